@@ -0,0 +1,60 @@
+"""revision content digest
+
+Revision ID: 0b7e59d4c218
+Revises: f4c2a86d3b17
+Create Date: 2026-10-16 13:52:27.904116
+
+"""
+import hashlib
+
+import sqlalchemy as sa
+
+from alembic import context, op
+
+# revision identifiers, used by Alembic.
+revision = '0b7e59d4c218'
+down_revision = 'f4c2a86d3b17'
+branch_labels = None
+depends_on = None
+
+
+def _revision_module(revision_id: str):
+    """Load another migration, to reuse the helpers it froze."""
+    return context.script.get_revision(revision_id).module
+
+
+def upgrade() -> None:
+    op.add_column('revisions', sa.Column('content_size', sa.Integer(), nullable=True))
+    op.add_column('revisions', sa.Column('content_hash', sa.String(length=64), nullable=True))
+
+    # Batching and replay come from the delta migration; revisions written
+    # since text compression was introduced may also need decoding
+    deltas = _revision_module('f4c2a86d3b17')
+    compression = _revision_module('1d5a7c3e9b42')
+
+    with op.get_context().autocommit_block():
+        connection = op.get_bind()
+        for pages in deltas.page_batches(connection):
+            updates = []
+            for rows in pages.values():
+                contents = deltas.replay(rows, decode=compression.decode_text)
+                for row in rows:
+                    raw = contents[row.revision_number].encode()
+                    digest = hashlib.sha256(raw).hexdigest()
+                    updates.append({"id": row.id, "size": len(raw), "digest": digest})
+
+            connection.execute(
+                sa.text(
+                    "UPDATE revisions SET content_size = :size, content_hash = :digest "
+                    "WHERE id = :id"
+                ),
+                updates,
+            )
+
+    op.alter_column('revisions', 'content_size', existing_type=sa.Integer(), nullable=False)
+    op.alter_column('revisions', 'content_hash', existing_type=sa.String(length=64), nullable=False)
+
+
+def downgrade() -> None:
+    op.drop_column('revisions', 'content_hash')
+    op.drop_column('revisions', 'content_size')
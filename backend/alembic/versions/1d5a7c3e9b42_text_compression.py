@@ -0,0 +1,91 @@
+"""text compression
+
+Revision ID: 1d5a7c3e9b42
+Revises: 4c8e1f6a2d93
+Create Date: 2026-10-17 09:14:36.205817
+
+"""
+import base64
+import lzma
+import zlib
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '1d5a7c3e9b42'
+down_revision = '4c8e1f6a2d93'
+branch_labels = None
+depends_on = None
+
+# Rows decoded per committed batch
+ROW_BATCH_SIZE = 1000
+
+# Columns that may hold values written by CompressedText, with the primary key
+# (and a value below every key) each table is walked by
+COMPRESSED_COLUMNS = {
+    "revisions": ("id", 0, ("content", "delta")),
+    "section_contents": ("hash", "", ("text", "code")),
+}
+
+# The storage format of app.db.types.CompressedText, copied here so the
+# migrations never import app code. Encoded values are ESC, a codec tag and a
+# base85 payload; "=" marks escaped plain text that started with ESC.
+COMPRESSION_MARKER = "\x1b"
+ESCAPED_TAG = "="
+DECOMPRESSORS = {"z": zlib.decompress, "x": lzma.decompress}
+
+
+def decode_text(stored: str) -> str:
+    """Decode a value written by CompressedText; plain text passes through."""
+    if not stored.startswith(COMPRESSION_MARKER):
+        return stored
+
+    tag, payload = stored[1], stored[2:]
+    if tag == ESCAPED_TAG:
+        return payload
+    return DECOMPRESSORS[tag](base64.b85decode(payload)).decode()
+
+
+def upgrade() -> None:
+    # Nothing to change: CompressedText columns stay TEXT and plain values
+    # remain valid. From here on they may hold encoded values.
+    pass
+
+
+def downgrade() -> None:
+    # Earlier revisions read these columns as plain text (in SQL and when
+    # replaying histories), so store every encoded value decoded again
+    with op.get_context().autocommit_block():
+        connection = op.get_bind()
+        for table, (key, last, columns) in COMPRESSED_COLUMNS.items():
+            selected = ", ".join((key, *columns))
+            encoded = " OR ".join(f"left({column}, 1) = :marker" for column in columns)
+            assignments = ", ".join(f"{column} = :{column}" for column in columns)
+            while True:
+                rows = connection.execute(
+                    sa.text(
+                        f"SELECT {selected} FROM {table} "
+                        f"WHERE {key} > :last AND ({encoded}) "
+                        f"ORDER BY {key} LIMIT :limit"
+                    ),
+                    {"last": last, "marker": COMPRESSION_MARKER, "limit": ROW_BATCH_SIZE},
+                ).all()
+                if not rows:
+                    break
+
+                connection.execute(
+                    sa.text(f"UPDATE {table} SET {assignments} WHERE {key} = :key"),
+                    [
+                        {
+                            "key": row[0],
+                            **{
+                                column: value and decode_text(value)
+                                for column, value in zip(columns, row[1:])
+                            },
+                        }
+                        for row in rows
+                    ],
+                )
+                last = rows[-1][0]
@@ -0,0 +1,27 @@
+"""keyset pagination indexes
+
+Revision ID: 3b9f2c71d4a8
+Revises: e66563560e30
+Create Date: 2026-10-16 09:12:03.418265
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '3b9f2c71d4a8'
+down_revision = 'e66563560e30'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Revisions already page on the uq_revisions_page_rev (page_id, revision_number) index
+    op.create_index('ix_pages_updated_at_id', 'pages', ['updated_at', 'id'], unique=False)
+    op.create_index(
+        'ix_pages_space_id_updated_at_id', 'pages', ['space_id', 'updated_at', 'id'], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_pages_space_id_updated_at_id', table_name='pages')
+    op.drop_index('ix_pages_updated_at_id', table_name='pages')
@@ -0,0 +1,32 @@
+"""tag filter indexes
+
+Revision ID: 4c8e1f6a2d93
+Revises: 7f3d2a9c5b16
+Create Date: 2026-10-16 16:41:18.532960
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '4c8e1f6a2d93'
+down_revision = '7f3d2a9c5b16'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_page_tags_tag_id_page_id', 'page_tags', ['tag_id', 'page_id'], unique=False)
+    op.create_index(
+        'ix_pages_live_updated_at_id',
+        'pages',
+        ['updated_at', 'id'],
+        unique=False,
+        postgresql_where=sa.text('NOT is_deleted'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_pages_live_updated_at_id', table_name='pages')
+    op.drop_index('ix_page_tags_tag_id_page_id', table_name='page_tags')
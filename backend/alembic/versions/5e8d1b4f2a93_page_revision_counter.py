@@ -0,0 +1,33 @@
+"""page revision counter
+
+Revision ID: 5e8d1b4f2a93
+Revises: d2a7f93c1e64
+Create Date: 2026-10-16 11:38:09.551207
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '5e8d1b4f2a93'
+down_revision = 'd2a7f93c1e64'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'pages',
+        sa.Column('current_revision', sa.Integer(), server_default='0', nullable=False),
+    )
+    op.execute(
+        "UPDATE pages SET current_revision = latest.revision_number "
+        "FROM (SELECT page_id, MAX(revision_number) AS revision_number "
+        "      FROM revisions GROUP BY page_id) AS latest "
+        "WHERE pages.id = latest.page_id"
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('pages', 'current_revision')
@@ -0,0 +1,141 @@
+"""section bodies by hash
+
+Revision ID: 6b2e9d4a1c58
+Revises: 1d5a7c3e9b42
+Create Date: 2026-10-17 10:02:51.774390
+
+"""
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import context, op
+
+# revision identifiers, used by Alembic.
+revision = '6b2e9d4a1c58'
+down_revision = '1d5a7c3e9b42'
+branch_labels = None
+depends_on = None
+
+# Rows rewritten per committed batch
+ROW_BATCH_SIZE = 1000
+
+SECTION_SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', coalesce(header, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(text, '') || ' ' || coalesce(caption, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(code, '')), 'C')"
+)
+
+# Content columns page_sections used to repeat from section_contents
+CONTENT_COLUMNS = (
+    ('section_type', sa.String(length=32)),
+    ('header', sa.Text()),
+    ('text', sa.Text()),
+    ('media_url', sa.Text()),
+    ('caption', sa.Text()),
+    ('code', sa.Text()),
+    ('language', sa.String(length=64)),
+)
+
+
+def upgrade() -> None:
+    # section_contents becomes the only copy of section bodies and is read by
+    # SQL (search vector, JSON page details), so it must hold plain text
+    compression = context.script.get_revision('1d5a7c3e9b42').module
+    with op.get_context().autocommit_block():
+        connection = op.get_bind()
+        last_hash = ""
+        while True:
+            rows = connection.execute(
+                sa.text(
+                    "SELECT hash, text, code FROM section_contents "
+                    "WHERE hash > :last AND (left(text, 1) = :marker OR left(code, 1) = :marker) "
+                    "ORDER BY hash LIMIT :limit"
+                ),
+                {
+                    "last": last_hash,
+                    "marker": compression.COMPRESSION_MARKER,
+                    "limit": ROW_BATCH_SIZE,
+                },
+            ).all()
+            if not rows:
+                break
+
+            connection.execute(
+                sa.text(
+                    "UPDATE section_contents SET text = :text, code = :code WHERE hash = :hash"
+                ),
+                [
+                    {
+                        "hash": row.hash,
+                        "text": row.text and compression.decode_text(row.text),
+                        "code": row.code and compression.decode_text(row.code),
+                    }
+                    for row in rows
+                ],
+            )
+            last_hash = rows[-1].hash
+
+    op.add_column('section_contents', sa.Column(
+        'search_vector',
+        postgresql.TSVECTOR(),
+        sa.Computed(SECTION_SEARCH_VECTOR_SQL, persisted=True),
+        nullable=True,
+    ))
+    op.create_index(
+        'ix_section_contents_search_vector', 'section_contents', ['search_vector'],
+        unique=False, postgresql_using='gin',
+    )
+
+    # Every write path has set content_hash since the section store was added
+    op.alter_column(
+        'page_sections', 'content_hash', existing_type=sa.String(length=64), nullable=False
+    )
+    op.drop_index('ix_page_sections_search_vector', table_name='page_sections')
+    op.drop_column('page_sections', 'search_vector')
+    for name, _ in CONTENT_COLUMNS:
+        op.drop_column('page_sections', name)
+
+
+def downgrade() -> None:
+    for name, type_ in CONTENT_COLUMNS:
+        op.add_column('page_sections', sa.Column(name, type_, nullable=True))
+
+    with op.get_context().autocommit_block():
+        connection = op.get_bind()
+        assignments = ", ".join(f"{name} = sc.{name}" for name, _ in CONTENT_COLUMNS)
+        last_id = 0
+        while True:
+            updated = connection.execute(
+                sa.text(
+                    "WITH batch AS ("
+                    "    SELECT id FROM page_sections WHERE id > :last ORDER BY id LIMIT :limit"
+                    ") "
+                    f"UPDATE page_sections ps SET {assignments} "
+                    "FROM batch, section_contents sc "
+                    "WHERE ps.id = batch.id AND sc.hash = ps.content_hash "
+                    "RETURNING ps.id"
+                ),
+                {"last": last_id, "limit": ROW_BATCH_SIZE},
+            ).scalars().all()
+            if not updated:
+                break
+            last_id = max(updated)
+
+    op.alter_column(
+        'page_sections', 'section_type', existing_type=sa.String(length=32), nullable=False
+    )
+    op.add_column('page_sections', sa.Column(
+        'search_vector',
+        postgresql.TSVECTOR(),
+        sa.Computed(SECTION_SEARCH_VECTOR_SQL, persisted=True),
+        nullable=True,
+    ))
+    op.create_index(
+        'ix_page_sections_search_vector', 'page_sections', ['search_vector'],
+        unique=False, postgresql_using='gin',
+    )
+    op.alter_column(
+        'page_sections', 'content_hash', existing_type=sa.String(length=64), nullable=True
+    )
+    op.drop_index('ix_section_contents_search_vector', table_name='section_contents')
+    op.drop_column('section_contents', 'search_vector')
@@ -0,0 +1,49 @@
+"""revision retention policies
+
+Revision ID: 6d1f8b3e0a45
+Revises: 0b7e59d4c218
+Create Date: 2026-10-16 14:31:50.216874
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '6d1f8b3e0a45'
+down_revision = '0b7e59d4c218'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('revision_retention_policies',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('workspace_id', sa.Integer(), nullable=False),
+    sa.Column('keep_all_days', sa.Integer(), nullable=False),
+    sa.Column('hourly_days', sa.Integer(), nullable=False),
+    sa.Column('daily_days', sa.Integer(), nullable=False),
+    sa.Column('keep_last', sa.Integer(), nullable=False),
+    sa.Column(
+        'created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False
+    ),
+    sa.Column(
+        'updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False
+    ),
+    sa.ForeignKeyConstraint(['workspace_id'], ['workspaces.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('workspace_id')
+    )
+    op.create_index(
+        op.f('ix_revision_retention_policies_id'),
+        'revision_retention_policies',
+        ['id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f('ix_revision_retention_policies_id'), table_name='revision_retention_policies'
+    )
+    op.drop_table('revision_retention_policies')
@@ -0,0 +1,175 @@
+"""tag page counts
+
+Revision ID: 7f3d2a9c5b16
+Revises: e2b47c0d9a81
+Create Date: 2026-10-16 16:02:44.187305
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '7f3d2a9c5b16'
+down_revision = 'e2b47c0d9a81'
+branch_labels = None
+depends_on = None
+
+# Counts only cover live pages. Each change is accounted by the trigger that
+# can still see the workspace: a cascaded delete skips rows whose page, space
+# or tag is already gone, because the parent's trigger counted them.
+APPLY_FUNCTION = """
+CREATE FUNCTION apply_tag_count_changes(workspace_ids bigint[], tag_ids bigint[], delta integer)
+RETURNS void LANGUAGE sql AS $$
+    WITH changes AS (
+        SELECT c.workspace_id, c.tag_id, count(*)::integer * delta AS n
+        FROM unnest(workspace_ids, tag_ids) AS c(workspace_id, tag_id)
+        JOIN tags ON tags.id = c.tag_id
+        GROUP BY c.workspace_id, c.tag_id
+    ), tag_totals AS (
+        UPDATE tags SET page_count = tags.page_count + totals.n
+        FROM (SELECT tag_id, sum(n)::integer AS n FROM changes GROUP BY tag_id) AS totals
+        WHERE tags.id = totals.tag_id
+    )
+    INSERT INTO tag_usage (workspace_id, tag_id, page_count)
+    SELECT changes.workspace_id, changes.tag_id, changes.n
+    FROM changes
+    JOIN workspaces ON workspaces.id = changes.workspace_id
+    ON CONFLICT (workspace_id, tag_id)
+    DO UPDATE SET page_count = tag_usage.page_count + excluded.page_count
+$$
+"""
+
+PAGE_TAGS_FUNCTION = """
+CREATE FUNCTION page_tags_maintain_tag_counts() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM apply_tag_count_changes(
+            array_agg(spaces.workspace_id)::bigint[], array_agg(changed.tag_id)::bigint[], 1
+        )
+        FROM new_rows AS changed
+        JOIN pages ON pages.id = changed.page_id AND NOT pages.is_deleted
+        JOIN spaces ON spaces.id = pages.space_id;
+    ELSE
+        PERFORM apply_tag_count_changes(
+            array_agg(spaces.workspace_id)::bigint[], array_agg(changed.tag_id)::bigint[], -1
+        )
+        FROM old_rows AS changed
+        JOIN pages ON pages.id = changed.page_id AND NOT pages.is_deleted
+        JOIN spaces ON spaces.id = pages.space_id;
+    END IF;
+    RETURN NULL;
+END
+$$
+"""
+
+PAGES_FUNCTION = """
+CREATE FUNCTION pages_maintain_tag_counts() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        IF NOT OLD.is_deleted THEN
+            PERFORM apply_tag_count_changes(
+                array_agg(spaces.workspace_id)::bigint[], array_agg(page_tags.tag_id)::bigint[], -1
+            )
+            FROM page_tags
+            JOIN spaces ON spaces.id = OLD.space_id
+            WHERE page_tags.page_id = OLD.id;
+        END IF;
+        RETURN OLD;
+    END IF;
+
+    IF NEW.is_deleted IS DISTINCT FROM OLD.is_deleted THEN
+        PERFORM apply_tag_count_changes(
+            array_agg(spaces.workspace_id)::bigint[], array_agg(page_tags.tag_id)::bigint[],
+            CASE WHEN NEW.is_deleted THEN -1 ELSE 1 END
+        )
+        FROM page_tags
+        JOIN spaces ON spaces.id = NEW.space_id
+        WHERE page_tags.page_id = NEW.id;
+    END IF;
+    RETURN NEW;
+END
+$$
+"""
+
+SPACES_FUNCTION = """
+CREATE FUNCTION spaces_maintain_tag_counts() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM apply_tag_count_changes(
+        array_agg(OLD.workspace_id)::bigint[], array_agg(page_tags.tag_id)::bigint[], -1
+    )
+    FROM pages
+    JOIN page_tags ON page_tags.page_id = pages.id
+    WHERE pages.space_id = OLD.id AND NOT pages.is_deleted;
+    RETURN OLD;
+END
+$$
+"""
+
+TRIGGERS = [
+    "CREATE TRIGGER page_tags_count_insert AFTER INSERT ON page_tags "
+    "REFERENCING NEW TABLE AS new_rows FOR EACH STATEMENT "
+    "EXECUTE FUNCTION page_tags_maintain_tag_counts()",
+    "CREATE TRIGGER page_tags_count_delete AFTER DELETE ON page_tags "
+    "REFERENCING OLD TABLE AS old_rows FOR EACH STATEMENT "
+    "EXECUTE FUNCTION page_tags_maintain_tag_counts()",
+    "CREATE TRIGGER pages_tag_count BEFORE DELETE OR UPDATE OF is_deleted ON pages "
+    "FOR EACH ROW EXECUTE FUNCTION pages_maintain_tag_counts()",
+    "CREATE TRIGGER spaces_tag_count BEFORE DELETE ON spaces "
+    "FOR EACH ROW EXECUTE FUNCTION spaces_maintain_tag_counts()",
+]
+
+
+def upgrade() -> None:
+    op.add_column('tags', sa.Column('page_count', sa.Integer(), server_default='0', nullable=False))
+    op.create_table('tag_usage',
+    sa.Column('workspace_id', sa.Integer(), nullable=False),
+    sa.Column('tag_id', sa.Integer(), nullable=False),
+    sa.Column('page_count', sa.Integer(), server_default=sa.text('0'), nullable=False),
+    sa.ForeignKeyConstraint(['tag_id'], ['tags.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['workspace_id'], ['workspaces.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('workspace_id', 'tag_id')
+    )
+    op.create_index(
+        'ix_tag_usage_workspace_id_page_count',
+        'tag_usage',
+        ['workspace_id', sa.text('page_count DESC'), 'tag_id'],
+        unique=False,
+    )
+
+    # Block tag writes while the counts are seeded so none slip between the
+    # backfill and the triggers
+    op.execute("LOCK TABLE page_tags IN SHARE ROW EXCLUSIVE MODE")
+    op.execute(
+        "INSERT INTO tag_usage (workspace_id, tag_id, page_count) "
+        "SELECT s.workspace_id, pt.tag_id, count(*) "
+        "FROM page_tags pt "
+        "JOIN pages p ON p.id = pt.page_id AND NOT p.is_deleted "
+        "JOIN spaces s ON s.id = p.space_id "
+        "GROUP BY s.workspace_id, pt.tag_id"
+    )
+    op.execute(
+        "UPDATE tags SET page_count = totals.page_count "
+        "FROM (SELECT tag_id, sum(page_count) AS page_count "
+        "      FROM tag_usage GROUP BY tag_id) AS totals "
+        "WHERE tags.id = totals.tag_id"
+    )
+
+    functions = (APPLY_FUNCTION, PAGE_TAGS_FUNCTION, PAGES_FUNCTION, SPACES_FUNCTION)
+    for statement in (*functions, *TRIGGERS):
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER spaces_tag_count ON spaces")
+    op.execute("DROP TRIGGER pages_tag_count ON pages")
+    op.execute("DROP TRIGGER page_tags_count_delete ON page_tags")
+    op.execute("DROP TRIGGER page_tags_count_insert ON page_tags")
+    op.execute("DROP FUNCTION spaces_maintain_tag_counts()")
+    op.execute("DROP FUNCTION pages_maintain_tag_counts()")
+    op.execute("DROP FUNCTION page_tags_maintain_tag_counts()")
+    op.execute("DROP FUNCTION apply_tag_count_changes(bigint[], bigint[], integer)")
+
+    op.drop_index('ix_tag_usage_workspace_id_page_count', table_name='tag_usage')
+    op.drop_table('tag_usage')
+    op.drop_column('tags', 'page_count')
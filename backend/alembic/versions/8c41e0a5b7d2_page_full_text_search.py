@@ -0,0 +1,60 @@
+"""page full-text search
+
+Revision ID: 8c41e0a5b7d2
+Revises: 3b9f2c71d4a8
+Create Date: 2026-10-16 10:04:51.602934
+
+"""
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '8c41e0a5b7d2'
+down_revision = '3b9f2c71d4a8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Stored generated columns: adding them rewrites each table once to backfill
+    op.add_column('pages', sa.Column(
+        'search_vector',
+        postgresql.TSVECTOR(),
+        sa.Computed(
+            "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(content, '')), 'B')",
+            persisted=True,
+        ),
+        nullable=True,
+    ))
+    op.add_column('page_sections', sa.Column(
+        'search_vector',
+        postgresql.TSVECTOR(),
+        sa.Computed(
+            "setweight(to_tsvector('english', coalesce(header, '')), 'A') || "
+            "setweight(to_tsvector('english', "
+            "coalesce(text, '') || ' ' || coalesce(caption, '')), 'B') || "
+            "setweight(to_tsvector('english', coalesce(code, '')), 'C')",
+            persisted=True,
+        ),
+        nullable=True,
+    ))
+    op.create_index(
+        'ix_pages_search_vector', 'pages', ['search_vector'], unique=False, postgresql_using='gin'
+    )
+    op.create_index(
+        'ix_page_sections_search_vector',
+        'page_sections',
+        ['search_vector'],
+        unique=False,
+        postgresql_using='gin',
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_page_sections_search_vector', table_name='page_sections')
+    op.drop_index('ix_pages_search_vector', table_name='pages')
+    op.drop_column('page_sections', 'search_vector')
+    op.drop_column('pages', 'search_vector')
@@ -0,0 +1,27 @@
+"""revision section hashes index
+
+Revision ID: 8e4b2f6c1a37
+Revises: 6b2e9d4a1c58
+Create Date: 2026-10-17 14:26:08.415372
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '8e4b2f6c1a37'
+down_revision = '6b2e9d4a1c58'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Lets section body garbage collection ask whether any revision snapshot
+    # still references a hash without scanning the revisions table
+    op.create_index(
+        'ix_revisions_section_hashes', 'revisions', ['section_hashes'],
+        unique=False, postgresql_using='gin',
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_revisions_section_hashes', table_name='revisions')
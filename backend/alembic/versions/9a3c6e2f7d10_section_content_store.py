@@ -0,0 +1,117 @@
+"""section content store
+
+Revision ID: 9a3c6e2f7d10
+Revises: 6d1f8b3e0a45
+Create Date: 2026-10-16 15:12:04.683529
+
+"""
+import hashlib
+import json
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '9a3c6e2f7d10'
+down_revision = '6d1f8b3e0a45'
+branch_labels = None
+depends_on = None
+
+# Existing page sections hashed and stored per committed batch
+SECTION_BATCH_SIZE = 1000
+
+# Section content fields, in the order they are hashed
+SECTION_CONTENT_FIELDS = (
+    "section_type", "header", "text", "media_url", "caption", "code", "language",
+)
+
+
+def section_hash(section) -> str:
+    """Hash a section's content fields (app.core.section_store.section_hash as of this revision)."""
+    payload = json.dumps([getattr(section, field) for field in SECTION_CONTENT_FIELDS])
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def upgrade() -> None:
+    op.create_table('section_contents',
+    sa.Column('hash', sa.String(length=64), nullable=False),
+    sa.Column('section_type', sa.String(length=32), nullable=False),
+    sa.Column('header', sa.Text(), nullable=True),
+    sa.Column('text', sa.Text(), nullable=True),
+    sa.Column('media_url', sa.Text(), nullable=True),
+    sa.Column('caption', sa.Text(), nullable=True),
+    sa.Column('code', sa.Text(), nullable=True),
+    sa.Column('language', sa.String(length=64), nullable=True),
+    sa.Column(
+        'created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False
+    ),
+    sa.PrimaryKeyConstraint('hash')
+    )
+    op.add_column('page_sections', sa.Column('content_hash', sa.String(length=64), nullable=True))
+    op.create_foreign_key(
+        'page_sections_content_hash_fkey', 'page_sections', 'section_contents',
+        ['content_hash'], ['hash'], ondelete='RESTRICT'
+    )
+    op.create_index(
+        op.f('ix_page_sections_content_hash'), 'page_sections', ['content_hash'], unique=False
+    )
+    op.add_column(
+        'revisions',
+        sa.Column('section_hashes', postgresql.ARRAY(sa.String(length=64)), nullable=True),
+    )
+
+    # Store the bodies of existing sections and point the sections at them
+    with op.get_context().autocommit_block():
+        connection = op.get_bind()
+        last_id = 0
+        while True:
+            rows = connection.execute(
+                sa.text(
+                    "SELECT id, section_type, header, text, media_url, caption, code, language "
+                    "FROM page_sections WHERE id > :last ORDER BY id LIMIT :limit"
+                ),
+                {"last": last_id, "limit": SECTION_BATCH_SIZE},
+            ).all()
+            if not rows:
+                break
+
+            hashes = {row.id: section_hash(row) for row in rows}
+            contents = {
+                hashes[row.id]: {
+                    "hash": hashes[row.id],
+                    "section_type": row.section_type,
+                    "header": row.header,
+                    "text": row.text,
+                    "media_url": row.media_url,
+                    "caption": row.caption,
+                    "code": row.code,
+                    "language": row.language,
+                }
+                for row in rows
+            }
+
+            connection.execute(
+                sa.text(
+                    "INSERT INTO section_contents "
+                    "(hash, section_type, header, text, media_url, caption, code, language) "
+                    "VALUES (:hash, :section_type, :header, :text, :media_url, :caption, "
+                    ":code, :language) "
+                    "ON CONFLICT (hash) DO NOTHING"
+                ),
+                list(contents.values()),
+            )
+            connection.execute(
+                sa.text("UPDATE page_sections SET content_hash = :hash WHERE id = :id"),
+                [{"id": row_id, "hash": digest} for row_id, digest in hashes.items()],
+            )
+            last_id = rows[-1].id
+
+
+def downgrade() -> None:
+    op.drop_column('revisions', 'section_hashes')
+    op.drop_index(op.f('ix_page_sections_content_hash'), table_name='page_sections')
+    op.drop_constraint('page_sections_content_hash_fkey', 'page_sections', type_='foreignkey')
+    op.drop_column('page_sections', 'content_hash')
+    op.drop_table('section_contents')
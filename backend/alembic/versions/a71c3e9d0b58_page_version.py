@@ -0,0 +1,24 @@
+"""page version
+
+Revision ID: a71c3e9d0b58
+Revises: 5e8d1b4f2a93
+Create Date: 2026-10-16 12:20:46.730118
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'a71c3e9d0b58'
+down_revision = '5e8d1b4f2a93'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('pages', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('pages', 'version')
@@ -0,0 +1,77 @@
+"""page content hash
+
+Revision ID: c58e1a7b9f36
+Revises: 9a3c6e2f7d10
+Create Date: 2026-10-16 15:47:39.120954
+
+"""
+import hashlib
+import json
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'c58e1a7b9f36'
+down_revision = '9a3c6e2f7d10'
+branch_labels = None
+depends_on = None
+
+# Pages hashed per committed batch
+PAGE_BATCH_SIZE = 500
+
+
+def page_content_hash(title: str, content: str, sections: list[tuple[int, str]]) -> str:
+    """
+    Hash a page's content exactly as app.core.section_store.page_content_hash does.
+
+    `sections` are (position, section hash) pairs in position order. The
+    formula is copied rather than imported so the migration never depends on
+    app code; if the two ever differ, no backfilled value can match a save.
+    """
+    payload = json.dumps([title, content, [list(section) for section in sections]])
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def upgrade() -> None:
+    op.add_column('pages', sa.Column('content_hash', sa.String(length=64), nullable=True))
+
+    with op.get_context().autocommit_block():
+        connection = op.get_bind()
+        last_id = 0
+        while True:
+            rows = connection.execute(
+                sa.text(
+                    "SELECT p.id, p.title, p.content, s.positions, s.section_hashes "
+                    "FROM pages p LEFT JOIN LATERAL ("
+                    "    SELECT array_agg(ps.position ORDER BY ps.position) AS positions, "
+                    "           array_agg(ps.content_hash ORDER BY ps.position) AS section_hashes "
+                    "    FROM page_sections ps WHERE ps.page_id = p.id"
+                    ") s ON true "
+                    "WHERE p.id > :last ORDER BY p.id LIMIT :limit"
+                ),
+                {"last": last_id, "limit": PAGE_BATCH_SIZE},
+            ).all()
+            if not rows:
+                break
+
+            connection.execute(
+                sa.text("UPDATE pages SET content_hash = :hash WHERE id = :id"),
+                [
+                    {
+                        "id": row.id,
+                        "hash": page_content_hash(
+                            row.title,
+                            row.content,
+                            list(zip(row.positions or [], row.section_hashes or [])),
+                        ),
+                    }
+                    for row in rows
+                ],
+            )
+            last_id = rows[-1].id
+
+
+def downgrade() -> None:
+    op.drop_column('pages', 'content_hash')
@@ -0,0 +1,39 @@
+"""trigram title indexes
+
+Revision ID: d2a7f93c1e64
+Revises: 8c41e0a5b7d2
+Create Date: 2026-10-16 10:47:22.185340
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'd2a7f93c1e64'
+down_revision = '8c41e0a5b7d2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        'ix_pages_title_trgm',
+        'pages',
+        ['title'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'title': 'gin_trgm_ops'},
+    )
+    op.create_index(
+        'ix_spaces_name_trgm',
+        'spaces',
+        ['name'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'name': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_spaces_name_trgm', table_name='spaces')
+    op.drop_index('ix_pages_title_trgm', table_name='pages')
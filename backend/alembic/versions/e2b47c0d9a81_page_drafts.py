@@ -0,0 +1,50 @@
+"""page drafts
+
+Revision ID: e2b47c0d9a81
+Revises: c58e1a7b9f36
+Create Date: 2026-10-16 16:20:13.557402
+
+"""
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'e2b47c0d9a81'
+down_revision = 'c58e1a7b9f36'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('page_drafts',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('page_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.Text(), nullable=True),
+    sa.Column('content', sa.Text(), nullable=True),
+    sa.Column('sections', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('base_version', sa.Integer(), nullable=True),
+    sa.Column('publish_error', sa.Text(), nullable=True),
+    sa.Column(
+        'created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False
+    ),
+    sa.Column(
+        'updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False
+    ),
+    sa.ForeignKeyConstraint(['page_id'], ['pages.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('page_id', 'user_id', name='uq_page_drafts_page_user')
+    )
+    op.create_index(op.f('ix_page_drafts_id'), 'page_drafts', ['id'], unique=False)
+    op.create_index(op.f('ix_page_drafts_user_id'), 'page_drafts', ['user_id'], unique=False)
+    op.create_index('ix_page_drafts_updated_at', 'page_drafts', ['updated_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_page_drafts_updated_at', table_name='page_drafts')
+    op.drop_index(op.f('ix_page_drafts_user_id'), table_name='page_drafts')
+    op.drop_index(op.f('ix_page_drafts_id'), table_name='page_drafts')
+    op.drop_table('page_drafts')
@@ -0,0 +1,187 @@
+"""revision deltas
+
+Revision ID: f4c2a86d3b17
+Revises: a71c3e9d0b58
+Create Date: 2026-10-16 13:05:12.418733
+
+"""
+import difflib
+import json
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'f4c2a86d3b17'
+down_revision = 'a71c3e9d0b58'
+branch_labels = None
+depends_on = None
+
+# Pages converted per batch; each batch is committed on its own so the
+# conversion never holds locks on the whole revisions table
+PAGE_BATCH_SIZE = 200
+
+# Keyframe spacing used when converting existing histories (the
+# REVISION_KEYFRAME_INTERVAL default when this revision was written)
+KEYFRAME_INTERVAL = 20
+
+CHECK_SQL = "(is_keyframe AND content IS NOT NULL) OR (NOT is_keyframe AND delta IS NOT NULL)"
+
+
+# The delta codec is copied from app.core.revision_store as it was when this
+# revision was written, so later changes to the app cannot alter the migration.
+# Later revisions that rebuild histories reuse page_batches and replay from here.
+
+def make_delta(old: str, new: str) -> str:
+    """Encode `new` as ["=", n] / ["-", n] / ["+", [lines]] line ops against `old`."""
+    old_lines = old.splitlines(keepends=True)
+    new_lines = new.splitlines(keepends=True)
+    ops: list[list] = []
+
+    matcher = difflib.SequenceMatcher(a=old_lines, b=new_lines, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            ops.append(["=", i2 - i1])
+            continue
+        if i2 > i1:
+            ops.append(["-", i2 - i1])
+        if j2 > j1:
+            ops.append(["+", new_lines[j1:j2]])
+
+    return json.dumps(ops, separators=(",", ":"))
+
+
+def apply_delta(old: str, delta: str) -> str:
+    """Rebuild the text a delta was made for from the text it was made against."""
+    old_lines = old.splitlines(keepends=True)
+    new_lines: list[str] = []
+    cursor = 0
+
+    for op_, arg in json.loads(delta):
+        if op_ == "=":
+            new_lines.extend(old_lines[cursor:cursor + arg])
+            cursor += arg
+        elif op_ == "-":
+            cursor += arg
+        else:
+            new_lines.extend(arg)
+
+    return "".join(new_lines)
+
+
+def replay(rows, decode=None) -> dict[int, str]:
+    """
+    Rebuild every revision's content from one page's rows, in revision order.
+
+    `decode` is applied to stored content and deltas first, for callers that
+    may find encoded values in them.
+    """
+    contents: dict[int, str] = {}
+    current = ""
+
+    for row in rows:
+        content, delta = row.content, row.delta
+        if decode is not None:
+            content = content and decode(content)
+            delta = delta and decode(delta)
+        current = content if row.is_keyframe else apply_delta(current, delta)
+        contents[row.revision_number] = current
+
+    return contents
+
+
+def page_batches(connection, batch_size: int = PAGE_BATCH_SIZE):
+    """Yield the revision rows of batch_size pages at a time, grouped by page."""
+    last_page_id = 0
+    while True:
+        page_ids = connection.execute(
+            sa.text(
+                "SELECT DISTINCT page_id FROM revisions WHERE page_id > :last "
+                "ORDER BY page_id LIMIT :limit"
+            ),
+            {"last": last_page_id, "limit": batch_size},
+        ).scalars().all()
+        if not page_ids:
+            return
+
+        rows = connection.execute(
+            sa.text(
+                "SELECT id, page_id, revision_number, is_keyframe, content, delta "
+                "FROM revisions WHERE page_id = ANY(:page_ids) "
+                "ORDER BY page_id, revision_number"
+            ),
+            {"page_ids": page_ids},
+        ).all()
+
+        pages: dict[int, list] = {}
+        for row in rows:
+            pages.setdefault(row.page_id, []).append(row)
+        yield pages
+
+        last_page_id = page_ids[-1]
+
+
+def upgrade() -> None:
+    op.add_column('revisions', sa.Column('delta', sa.Text(), nullable=True))
+    op.add_column(
+        'revisions',
+        sa.Column('is_keyframe', sa.Boolean(), server_default='true', nullable=False),
+    )
+    op.alter_column('revisions', 'content', existing_type=sa.Text(), nullable=True)
+    op.create_check_constraint('ck_revisions_keyframe_or_delta', 'revisions', CHECK_SQL)
+
+    with op.get_context().autocommit_block():
+        connection = op.get_bind()
+        for pages in page_batches(connection):
+            updates = []
+            for rows in pages.values():
+                contents = replay(rows)
+                since_keyframe = 0
+                for index, row in enumerate(rows):
+                    content = contents[row.revision_number]
+                    since_keyframe += 1
+                    if index and since_keyframe < KEYFRAME_INTERVAL:
+                        delta = make_delta(contents[rows[index - 1].revision_number], content)
+                        if len(delta) < len(content):
+                            if row.is_keyframe:
+                                updates.append({"id": row.id, "delta": delta})
+                            continue
+                    since_keyframe = 0
+
+            if updates:
+                connection.execute(
+                    sa.text(
+                        "UPDATE revisions SET is_keyframe = false, delta = :delta, content = NULL "
+                        "WHERE id = :id"
+                    ),
+                    updates,
+                )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        connection = op.get_bind()
+        for pages in page_batches(connection):
+            updates = []
+            for rows in pages.values():
+                contents = replay(rows)
+                updates.extend(
+                    {"id": row.id, "content": contents[row.revision_number]}
+                    for row in rows
+                    if not row.is_keyframe
+                )
+
+            if updates:
+                connection.execute(
+                    sa.text(
+                        "UPDATE revisions SET is_keyframe = true, content = :content, delta = NULL "
+                        "WHERE id = :id"
+                    ),
+                    updates,
+                )
+
+    op.drop_constraint('ck_revisions_keyframe_or_delta', 'revisions', type_='check')
+    op.alter_column('revisions', 'content', existing_type=sa.Text(), nullable=False)
+    op.drop_column('revisions', 'is_keyframe')
+    op.drop_column('revisions', 'delta')
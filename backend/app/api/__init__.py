@@ -1,3 +1,3 @@
-from app.api import users, spaces, pages, revisions, tags
+from app.api import drafts, pages, revisions, sections, spaces, tags, users
 
-__all__ = ["users", "spaces", "pages", "revisions", "tags"]
+__all__ = ["drafts", "pages", "revisions", "sections", "spaces", "tags", "users"]
@@ -11,11 +11,11 @@ from google.auth.transport import requests as google_requests
 
 from app.core.config import settings
 from app.core.security import create_access_token
-from app.core.deps import get_current_active_user
+from app.core.deps import get_current_active_user, invalidate_principal
 from app.db.session import get_db
 from app.models import User as UserModel
 from app.schemas.auth import Token, GoogleAuthURL, GoogleIdTokenRequest
-from app.schemas.user import User
+from app.schemas.user import Principal, User
 
 router = APIRouter(prefix="/auth", tags=["authentication"])
 
@@ -101,6 +101,7 @@ async def google_callback_mobile(
         if name and not user.display_name:
             user.display_name = name
             await db.commit()
+            invalidate_principal(user.id)
             await db.refresh(user)
 
     # 3) Issue JWT
@@ -228,6 +229,7 @@ async def google_callback(
         if name and not user.display_name:
             user.display_name = name
             await db.commit()
+            invalidate_principal(user.id)
             await db.refresh(user)
 
     # Create JWT token
@@ -245,13 +247,13 @@ async def google_callback(
 # ============================
 @router.get("/me", response_model=User)
 async def get_current_user_info(
-    current_user: UserModel = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
 ):
     return current_user
 
 
 @router.post("/logout")
 async def logout(
-    current_user: UserModel = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
 ):
     return {"message": "Successfully logged out"}
\ No newline at end of file
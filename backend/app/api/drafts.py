@@ -0,0 +1,234 @@
+import asyncio
+import logging
+from datetime import UTC, datetime, timedelta
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.deps import get_current_active_user
+from app.core.page_store import load_page, save_page
+from app.core.response_cache import page_cache_key, page_response_cache
+from app.db.session import AsyncSessionLocal, get_db
+from app.models import Page as PageModel
+from app.models import PageDraft as PageDraftModel
+from app.schemas import Page, PageDraft, PageDraftUpdate, PageUpdate, Principal
+
+router = APIRouter(prefix="/drafts", tags=["drafts"])
+
+logger = logging.getLogger(__name__)
+
+
+async def _get_draft(
+    db: AsyncSession, page_id: int, user_id: int, lock: bool = False
+) -> PageDraftModel:
+    """Load the user's draft of a page or raise 404."""
+    query = select(PageDraftModel).where(
+        PageDraftModel.page_id == page_id,
+        PageDraftModel.user_id == user_id,
+    )
+    if lock:
+        query = query.with_for_update()
+
+    result = await db.execute(query)
+    draft = result.scalar_one_or_none()
+
+    if not draft:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No draft of page {page_id} for user {user_id}"
+        )
+
+    return draft
+
+
+async def _publish_draft(db: AsyncSession, draft: PageDraftModel) -> None:
+    """
+    Apply a draft to its page through save_page and drop it, without committing.
+
+    The draft's delete commits together with the page update, so a draft is
+    published exactly once; an unchanged draft is a suppressed no-op save.
+    """
+    fields = {"title": draft.title, "content": draft.content, "sections": draft.sections}
+    page_in = PageUpdate(
+        **{field: value for field, value in fields.items() if value is not None},
+        updated_by=draft.user_id,
+        expected_version=draft.base_version,
+    )
+    await db.delete(draft)
+    await save_page(db, draft.page_id, page_in)
+
+
+@router.get("/page/{page_id}", response_model=PageDraft)
+async def get_draft(
+    page_id: int,
+    current_user: Principal = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Get the current user's draft of a page."""
+    return await _get_draft(db, page_id, current_user.id)
+
+
+@router.put("/page/{page_id}", response_model=PageDraft)
+async def save_draft(
+    page_id: int,
+    draft_in: PageDraftUpdate,
+    current_user: Principal = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Autosave the current user's in-progress edits to a page.
+
+    A single upsert into page_drafts: no revision, no section rewrite and no
+    page cache invalidation. Omitted fields keep their previous draft value;
+    send base_version to rebase the draft onto a newer page version.
+    """
+    result = await db.execute(select(PageModel.version).where(PageModel.id == page_id))
+    current_version = result.scalar_one_or_none()
+    if current_version is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Page with id {page_id} not found"
+        )
+
+    # A new draft starts from the current version; an existing one keeps its
+    # base unless the client rebases it explicitly
+    values = draft_in.model_dump(exclude_unset=True, mode="json")
+    changed_fields = list(values)
+    values.setdefault("base_version", current_version)
+
+    statement = insert(PageDraftModel).values(page_id=page_id, user_id=current_user.id, **values)
+    statement = statement.on_conflict_do_update(
+        constraint="uq_page_drafts_page_user",
+        set_={
+            **{field: statement.excluded[field] for field in changed_fields},
+            "updated_at": func.now(),
+            "publish_error": None,
+        },
+    ).returning(PageDraftModel.id)
+    draft_id = (await db.execute(statement)).scalar_one()
+    await db.commit()
+
+    result = await db.execute(
+        select(PageDraftModel)
+        .where(PageDraftModel.id == draft_id)
+        .execution_options(populate_existing=True)
+    )
+    return result.scalar_one()
+
+
+@router.post("/page/{page_id}/publish", response_model=Page)
+async def publish_draft(
+    page_id: int,
+    current_user: Principal = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Publish the current user's draft into the page as a single revision.
+
+    Returns 409 if the page was changed by someone else since the draft was
+    started; the draft is kept.
+    """
+    draft = await _get_draft(db, page_id, current_user.id, lock=True)
+    await _publish_draft(db, draft)
+    await db.commit()
+    page_response_cache.invalidate(page_cache_key(page_id))
+
+    return await load_page(db, page_id)
+
+
+@router.delete("/page/{page_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def discard_draft(
+    page_id: int,
+    current_user: Principal = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Throw away the current user's draft of a page."""
+    draft = await _get_draft(db, page_id, current_user.id)
+
+    await db.delete(draft)
+    await db.commit()
+
+    return None
+
+
+async def publish_idle_drafts(batch_size: int = 100) -> int:
+    """
+    Publish drafts nobody has touched for DRAFT_IDLE_PUBLISH_SECONDS.
+
+    Each draft is locked with SKIP LOCKED and published in its own
+    transaction, so several workers can run this side by side. A draft that
+    fails for any reason (typically a version conflict) is rolled back to a
+    savepoint, logged and marked with publish_error, and is skipped until it
+    is saved again; the rest of the batch carries on. Returns the number
+    published.
+    """
+    cutoff = datetime.now(UTC) - timedelta(seconds=settings.DRAFT_IDLE_PUBLISH_SECONDS)
+    idle = (
+        PageDraftModel.updated_at < cutoff,
+        PageDraftModel.publish_error.is_(None),
+    )
+
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(PageDraftModel.id).where(*idle).order_by(PageDraftModel.updated_at).limit(batch_size)
+        )
+        draft_ids = result.scalars().all()
+
+    published = 0
+    for draft_id in draft_ids:
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(PageDraftModel)
+                .where(PageDraftModel.id == draft_id, *idle)
+                .with_for_update(skip_locked=True)
+            )
+            draft = result.scalar_one_or_none()
+            if draft is None:
+                continue
+
+            # A savepoint keeps a failing draft from taking the page with it:
+            # the page is left untouched and the draft kept, marked with why
+            page_id = draft.page_id
+            try:
+                async with db.begin_nested():
+                    await _publish_draft(db, draft)
+            except Exception as exc:
+                if isinstance(exc, HTTPException):
+                    error = str(exc.detail)
+                    logger.warning(
+                        "Idle draft %d of page %d not published: %s", draft_id, page_id, error
+                    )
+                else:
+                    error = f"{type(exc).__name__}: {exc}"
+                    logger.exception(
+                        "Publishing idle draft %d of page %d failed", draft_id, page_id
+                    )
+
+                await db.execute(
+                    update(PageDraftModel)
+                    .where(PageDraftModel.id == draft_id)
+                    .values(publish_error=error)
+                )
+                await db.commit()
+                continue
+
+            await db.commit()
+            page_response_cache.invalidate(page_cache_key(page_id))
+            published += 1
+
+    return published
+
+
+async def run_draft_publisher() -> None:
+    """Background loop publishing idle drafts, started with the application."""
+    while True:
+        await asyncio.sleep(settings.DRAFT_PUBLISH_INTERVAL_SECONDS)
+        try:
+            published = await publish_idle_drafts()
+            if published:
+                logger.info("Published %d idle drafts", published)
+        except Exception:
+            logger.exception("Publishing idle drafts failed")
@@ -1,92 +1,589 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select, func, delete, text
+from collections.abc import Sequence
+from datetime import datetime
+from typing import NoReturn
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from sqlalchemy import (
+    Float,
+    Select,
+    case,
+    exists,
+    func,
+    literal,
+    or_,
+    select,
+    text,
+    tuple_,
+    union,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
-
+from sqlalchemy.orm import aliased, selectinload
+
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.core.deps import get_current_active_user
+from app.core.etag import etag_matches, etag_versions, make_versioned_etag
+from app.core.page_store import build_sections_for_page, load_page, save_page, sections_to_text
+from app.core.pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor
+from app.core.response_cache import page_cache_key, page_response_cache
+from app.core.revision_store import build_revision
+from app.core.section_store import page_content_hash, store_section_contents
 from app.db.session import get_db
-from app.models import Page as PageModel, Space as SpaceModel, User as UserModel, Tag as TagModel, PageSection as PageSectionModel
-from app.models import Revision as RevisionModel
-from app.schemas import Page, PageCreate, PageUpdate, PageWithDetails, PageSectionCreate
+from app.models import Page as PageModel
+from app.models import PageSection as PageSectionModel
+from app.models import SectionContent as SectionContentModel
+from app.models import Space as SpaceModel
+from app.models import Tag as TagModel
+from app.models import User as UserModel
+from app.models.base import SEARCH_CONFIG
+from app.models.page_tag import page_tags
+from app.models.workspace_member import WorkspaceMember
+from app.schemas import (
+    AutocompleteHit,
+    Page,
+    PageCreate,
+    PageSearchResult,
+    PageSummary,
+    PageUpdate,
+    PageWithDetails,
+    Principal,
+)
 
 router = APIRouter(prefix="/pages", tags=["pages"])
 
+# Upper bound on the tag ids accepted by each tag filter of /pages/by-tags
+MAX_TAG_FILTER_SIZE = 50
+
+SEARCH_HEADLINE_OPTIONS = (
+    "MaxFragments=2, MaxWords=30, MinWords=10, StartSel=<mark>, StopSel=</mark>"
+)
+
+# PageWithDetails as one JSON document, built by json_build_object / json_agg so a
+# page read is a single round trip with no ORM hydration or Pydantic pass
+PAGE_DETAILS_JSON_SQL = text("""
+SELECT json_build_object(
+    'id', p.id,
+    'space_id', p.space_id,
+    'slug', p.slug,
+    'title', p.title,
+    'content', p.content,
+    'created_by', p.created_by,
+    'updated_by', p.updated_by,
+    'is_deleted', p.is_deleted,
+    'current_revision', p.current_revision,
+    'version', p.version,
+    'created_at', p.created_at,
+    'updated_at', p.updated_at,
+    'sections', COALESCE((
+        SELECT json_agg(json_build_object(
+            'id', ps.id,
+            'page_id', ps.page_id,
+            'position', ps.position,
+            'section_type', sc.section_type,
+            'header', sc.header,
+            'text', sc.text,
+            'media_url', sc.media_url,
+            'caption', sc.caption,
+            'code', sc.code,
+            'language', sc.language,
+            'created_at', ps.created_at,
+            'updated_at', ps.updated_at
+        ) ORDER BY ps.position)
+        FROM page_sections ps
+        JOIN section_contents sc ON sc.hash = ps.content_hash
+        WHERE ps.page_id = p.id
+    ), '[]'::json),
+    'creator', json_build_object(
+        'id', c.id,
+        'username', c.username,
+        'email', c.email,
+        'display_name', c.display_name,
+        'is_active', c.is_active,
+        'created_at', c.created_at,
+        'updated_at', c.updated_at
+    ),
+    'updater', CASE WHEN u.id IS NULL THEN NULL ELSE json_build_object(
+        'id', u.id,
+        'username', u.username,
+        'email', u.email,
+        'display_name', u.display_name,
+        'is_active', u.is_active,
+        'created_at', u.created_at,
+        'updated_at', u.updated_at
+    ) END,
+    'space', json_build_object(
+        'id', s.id,
+        'workspace_id', s.workspace_id,
+        'name', s.name,
+        'slug', s.slug,
+        'description', s.description,
+        'is_private', s.is_private,
+        'owner_id', s.owner_id,
+        'created_at', s.created_at,
+        'updated_at', s.updated_at
+    ),
+    'tags', COALESCE((
+        SELECT json_agg(json_build_object(
+            'id', t.id,
+            'name', t.name,
+            'slug', t.slug,
+            'created_at', t.created_at
+        ) ORDER BY t.id)
+        FROM page_tags pt
+        JOIN tags t ON t.id = pt.tag_id
+        WHERE pt.page_id = p.id
+    ), '[]'::json)
+)::text
+FROM pages p
+JOIN spaces s ON s.id = p.space_id
+JOIN users c ON c.id = p.created_by
+LEFT JOIN users u ON u.id = p.updated_by
+WHERE p.id = :page_id
+""")
+
+# Recent autocomplete results per (user, prefix, limit), absorbing keystroke-rate repeats
+autocomplete_cache = LRUCache(
+    maxsize=settings.AUTOCOMPLETE_CACHE_SIZE,
+    ttl=settings.AUTOCOMPLETE_CACHE_TTL_SECONDS,
+)
+
+def _escape_like(value: str) -> str:
+    """Escape LIKE wildcards so user input only ever matches literally."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+async def _get_page_etag(db: AsyncSession, *criteria) -> tuple[int, str] | None:
+    """
+    Compute the ETag of a page's detail view without loading it.
+
+    One indexed lookup gathers every timestamp and tag that feeds into
+    PageWithDetails, so a matching If-None-Match can be answered with 304.
+    """
+    creator = aliased(UserModel)
+    updater = aliased(UserModel)
+
+    section_max_updated = (
+        select(func.max(PageSectionModel.updated_at))
+        .where(PageSectionModel.page_id == PageModel.id)
+        .scalar_subquery()
+    )
+    section_count = (
+        select(func.count())
+        .select_from(PageSectionModel)
+        .where(PageSectionModel.page_id == PageModel.id)
+        .scalar_subquery()
+    )
+    tag_fingerprint = (
+        select(
+            func.string_agg(
+                func.concat(TagModel.id, ":", TagModel.name, ":", TagModel.slug),
+                aggregate_order_by(literal(","), TagModel.id),
+            )
+        )
+        .select_from(page_tags)
+        .join(TagModel, TagModel.id == page_tags.c.tag_id)
+        .where(page_tags.c.page_id == PageModel.id)
+        .scalar_subquery()
+    )
+
+    result = await db.execute(
+        select(
+            PageModel.id,
+            PageModel.version,
+            PageModel.updated_at,
+            SpaceModel.updated_at,
+            creator.updated_at,
+            updater.updated_at,
+            section_max_updated,
+            section_count,
+            tag_fingerprint,
+        )
+        .join(SpaceModel, SpaceModel.id == PageModel.space_id)
+        .join(creator, creator.id == PageModel.created_by)
+        .outerjoin(updater, updater.id == PageModel.updated_by)
+        .where(*criteria)
+    )
+    row = result.one_or_none()
+
+    if row is None:
+        return None
+
+    page_id, version, *parts = row
+    return page_id, make_versioned_etag(version, page_id, *parts)
+
+
+def _not_modified(etag: str) -> Response:
+    """Build an empty 304 response for a conditional GET that matched."""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=_etag_headers(etag))
+
+
+def _etag_headers(etag: str) -> dict[str, str]:
+    """Headers that let browsers keep the page and revalidate it on every view."""
+    return {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+
+def _filter_page_listing(
+    query: Select,
+    skip: int,
+    cursor: str | None,
+    space_id: int | None,
+    include_deleted: bool,
+) -> Select:
+    """Apply the shared filters and keyset ordering used by page listings."""
+    query = query.order_by(PageModel.updated_at.desc(), PageModel.id.desc())
+
+    if space_id:
+        query = query.where(PageModel.space_id == space_id)
+
+    if not include_deleted:
+        query = query.where(PageModel.is_deleted.is_(False))
+
+    if cursor:
+        position = decode_cursor(cursor, {"updated_at": str, "id": int})
+        try:
+            updated_at = datetime.fromisoformat(position["updated_at"])
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid pagination cursor"
+            )
+        query = query.where(
+            tuple_(PageModel.updated_at, PageModel.id) < tuple_(updated_at, position["id"])
+        )
+    elif skip:
+        query = query.offset(skip)
+
+    return query
 
-def _sections_to_text(sections: list[PageSectionCreate]) -> str:
-    """Build a plain-text fallback string from structured sections."""
-    parts: list[str] = []
-    for section in sections:
-        if section.section_type == "paragraph":
-            if section.header:
-                parts.append(section.header)
-            if section.text:
-                parts.append(section.text)
-        elif section.section_type in {"info", "warning", "error"}:
-            if section.text:
-                parts.append(section.text)
-        elif section.section_type == "snippet":
-            if section.caption:
-                parts.append(section.caption)
-            if section.code:
-                parts.append(section.code)
-        elif section.section_type == "picture":
-            desc = section.caption or section.media_url or ""
-            if desc:
-                parts.append(desc)
-    return "\n\n".join(parts).strip()
-
-
-def _build_sections_for_page(page: PageModel, sections: list[PageSectionCreate]) -> None:
-    """Replace the page's sections with the provided collection."""
-    page.sections = [
-        PageSectionModel(
-            position=section.position,
-            section_type=section.section_type,
-            header=section.header,
-            text=section.text,
-            media_url=section.media_url,
-            caption=section.caption,
-            code=section.code,
-            language=section.language,
+
+def _set_next_page_cursor(response: Response, rows: Sequence, limit: int) -> None:
+    """Expose the cursor for the page after `rows` when the listing may continue."""
+    if rows and len(rows) == limit:
+        last = rows[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(
+            {"updated_at": last.updated_at.isoformat(), "id": last.id}
         )
-        for section in sorted(sections, key=lambda s: s.position)
-    ]
 
 
 @router.get("/", response_model=list[PageWithDetails])
 async def list_pages(
+    response: Response,
     skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: str | None = None,
     space_id: int | None = None,
     include_deleted: bool = False,
     db: AsyncSession = Depends(get_db),
 ):
-    """Get a list of all pages."""
-    query = select(PageModel)
-
-    if space_id:
-        query = query.where(PageModel.space_id == space_id)
-
-    if not include_deleted:
-        query = query.where(PageModel.is_deleted == False)
+    """
+    Get a list of pages, most recently updated first.
 
-    query = query.options(
+    Pass the X-Next-Cursor response header back as `cursor` to fetch the next
+    page; keyset pagination keeps deep pages as cheap as the first one.
+    """
+    query = select(PageModel).options(
         selectinload(PageModel.creator),
         selectinload(PageModel.updater),
         selectinload(PageModel.space),
         selectinload(PageModel.tags),
         selectinload(PageModel.sections),
     )
-    result = await db.execute(query.offset(skip).limit(limit))
+    query = _filter_page_listing(query, skip, cursor, space_id, include_deleted)
+
+    result = await db.execute(query.limit(limit))
     pages = result.scalars().all()
+    _set_next_page_cursor(response, pages, limit)
+
     return pages
 
 
-@router.get("/{page_id}", response_model=PageWithDetails)
-async def get_page(
-    page_id: int,
+@router.get("/summary", response_model=list[PageSummary])
+async def list_page_summaries(
+    response: Response,
+    skip: int = 0,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: str | None = None,
+    space_id: int | None = None,
+    include_deleted: bool = False,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Get a lightweight list of pages for sidebars and dashboards.
+
+    Selects only the summary columns in a single query, without loading
+    content, sections, tags or users. Paginates like `list_pages`.
+    """
+    query = select(
+        PageModel.id,
+        PageModel.space_id,
+        PageModel.slug,
+        PageModel.title,
+        PageModel.updated_at,
+    )
+    query = _filter_page_listing(query, skip, cursor, space_id, include_deleted)
+
+    result = await db.execute(query.limit(limit))
+    pages = result.all()
+    _set_next_page_cursor(response, pages, limit)
+
+    return pages
+
+
+def _filter_by_tags(
+    query: Select,
+    all_tags: list[int],
+    any_tags: list[int],
+    no_tags: list[int],
+) -> Select:
+    """
+    Restrict a page query to pages matching every tag in all_tags, at least
+    one in any_tags and none in no_tags.
+
+    Each condition is a semi- or anti-join on page_tags, so the planner can
+    either probe the (page_id, tag_id) key while walking pages in listing
+    order, or read the (tag_id, page_id) index of a rare tag first.
+    """
+    for tag_id in dict.fromkeys(all_tags):
+        query = query.where(
+            exists().where(page_tags.c.page_id == PageModel.id, page_tags.c.tag_id == tag_id)
+        )
+
+    if any_tags:
+        query = query.where(
+            exists().where(page_tags.c.page_id == PageModel.id, page_tags.c.tag_id.in_(any_tags))
+        )
+
+    if no_tags:
+        query = query.where(
+            ~exists().where(page_tags.c.page_id == PageModel.id, page_tags.c.tag_id.in_(no_tags))
+        )
+
+    return query
+
+
+@router.get("/by-tags", response_model=list[PageSummary])
+async def list_pages_by_tags(
+    response: Response,
+    all_tags: list[int] = Query([], alias="all", max_length=MAX_TAG_FILTER_SIZE),
+    any_tags: list[int] = Query([], alias="any", max_length=MAX_TAG_FILTER_SIZE),
+    no_tags: list[int] = Query([], alias="none", max_length=MAX_TAG_FILTER_SIZE),
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: str | None = None,
+    space_id: int | None = None,
+    include_deleted: bool = False,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    List pages by tag, e.g. `?all=1&all=2&none=3` for pages tagged 1 and 2
+    but not 3.
+
+    The AND/OR/NOT logic runs in SQL over page_tags and results page by
+    cursor like `list_page_summaries`, so neither the response size nor the
+    cost of a page depends on how many pages carry the tags.
+    """
+    if not (all_tags or any_tags):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="At least one 'all' or 'any' tag is required"
+        )
+
+    query = select(
+        PageModel.id,
+        PageModel.space_id,
+        PageModel.slug,
+        PageModel.title,
+        PageModel.updated_at,
+    )
+    query = _filter_by_tags(query, all_tags, any_tags, no_tags)
+    query = _filter_page_listing(query, 0, cursor, space_id, include_deleted)
+
+    result = await db.execute(query.limit(limit))
+    pages = result.all()
+    _set_next_page_cursor(response, pages, limit)
+
+    return pages
+
+
+@router.get("/search", response_model=list[PageSearchResult])
+async def search_pages(
+    response: Response,
+    q: str,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
+    workspace_id: int | None = None,
+    space_id: int | None = None,
     db: AsyncSession = Depends(get_db),
 ):
-    """Get a specific page by ID with full details."""
+    """
+    Full-text search over page titles, content and section text.
+
+    Matches come from the GIN-indexed search vectors on pages and section bodies;
+    a page's rank adds its own score to that of its best matching section.
+    Results are ordered by rank and paginate with the X-Next-Cursor header.
+    """
+    query_ts = func.websearch_to_tsquery(SEARCH_CONFIG, q)
+
+    # Best section score per page, computed once and reused for candidates and ranking;
+    # bodies are matched through their GIN index, then mapped to the pages using them
+    section_ranks = (
+        select(
+            PageSectionModel.page_id,
+            func.max(func.ts_rank(SectionContentModel.search_vector, query_ts)).label("rank"),
+        )
+        .join(SectionContentModel, SectionContentModel.hash == PageSectionModel.content_hash)
+        .where(SectionContentModel.search_vector.op("@@")(query_ts))
+        .group_by(PageSectionModel.page_id)
+        .cte("section_ranks")
+    )
+
+    # Candidate pages, each side answered by its own GIN index
+    candidates = union(
+        select(PageModel.id.label("page_id")).where(PageModel.search_vector.op("@@")(query_ts)),
+        select(section_ranks.c.page_id),
+    ).subquery()
+
+    rank = (
+        func.ts_rank(PageModel.search_vector, query_ts) + func.coalesce(section_ranks.c.rank, 0)
+    ).cast(Float)
+
+    ranked = (
+        select(
+            PageModel.id,
+            PageModel.space_id,
+            PageModel.slug,
+            PageModel.title,
+            PageModel.updated_at,
+            PageModel.content,
+            rank.label("rank"),
+        )
+        .join(candidates, candidates.c.page_id == PageModel.id)
+        .outerjoin(section_ranks, section_ranks.c.page_id == PageModel.id)
+        .where(PageModel.is_deleted.is_(False))
+    )
+
+    if space_id:
+        ranked = ranked.where(PageModel.space_id == space_id)
+
+    if workspace_id:
+        ranked = ranked.where(
+            PageModel.space_id.in_(
+                select(SpaceModel.id).where(SpaceModel.workspace_id == workspace_id)
+            )
+        )
+
+    ranked = ranked.subquery()
+
+    hits = select(ranked).order_by(ranked.c.rank.desc(), ranked.c.id.desc())
+    if cursor:
+        position = decode_cursor(cursor, {"rank": float, "id": int})
+        hits = hits.where(
+            tuple_(ranked.c.rank, ranked.c.id) < tuple_(position["rank"], position["id"])
+        )
+    hits = hits.limit(limit).subquery()
+
+    # Highlighting is comparatively expensive, so only run it on the returned rows
+    result = await db.execute(
+        select(
+            hits.c.id,
+            hits.c.space_id,
+            hits.c.slug,
+            hits.c.title,
+            hits.c.updated_at,
+            hits.c.rank,
+            func.ts_headline(SEARCH_CONFIG, hits.c.content, query_ts, SEARCH_HEADLINE_OPTIONS)
+            .label("snippet"),
+        ).order_by(hits.c.rank.desc(), hits.c.id.desc())
+    )
+    results = result.all()
+
+    if results and len(results) == limit:
+        last = results[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor({"rank": last.rank, "id": last.id})
+
+    return results
+
+
+@router.get("/autocomplete", response_model=list[AutocompleteHit])
+async def autocomplete(
+    q: str,
+    limit: int = Query(10, ge=1, le=50),
+    current_user: Principal = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Typo-tolerant title autocomplete over pages and spaces in the caller's workspaces.
+
+    Prefix matches rank first, then trigram word similarity; both are served
+    by the gin_trgm_ops indexes. Recent results are kept in a short-lived LRU.
+    """
+    prefix = q.strip().lower()
+    if not prefix:
+        return []
+
+    cache_key = (current_user.id, prefix, limit)
+    hits = autocomplete_cache.get(cache_key)
+    if hits is not None:
+        return hits
+
+    member_spaces = (
+        select(SpaceModel.id)
+        .join(WorkspaceMember, WorkspaceMember.workspace_id == SpaceModel.workspace_id)
+        .where(WorkspaceMember.user_id == current_user.id)
+    )
+    pattern = _escape_like(prefix) + "%"
+
+    page_score = func.word_similarity(prefix, PageModel.title) + case(
+        (PageModel.title.ilike(pattern, escape="\\"), 1.0), else_=0.0
+    )
+    space_score = func.word_similarity(prefix, SpaceModel.name) + case(
+        (SpaceModel.name.ilike(pattern, escape="\\"), 1.0), else_=0.0
+    )
+
+    matches = union_all(
+        select(
+            literal("page").label("kind"),
+            PageModel.id,
+            PageModel.space_id,
+            PageModel.slug,
+            PageModel.title,
+            page_score.label("score"),
+        ).where(
+            or_(
+                PageModel.title.ilike(pattern, escape="\\"),
+                literal(prefix).op("<%")(PageModel.title),
+            ),
+            PageModel.is_deleted.is_(False),
+            PageModel.space_id.in_(member_spaces),
+        ),
+        select(
+            literal("space").label("kind"),
+            SpaceModel.id,
+            SpaceModel.id.label("space_id"),
+            SpaceModel.slug,
+            SpaceModel.name.label("title"),
+            space_score.label("score"),
+        ).where(
+            or_(
+                SpaceModel.name.ilike(pattern, escape="\\"),
+                literal(prefix).op("<%")(SpaceModel.name),
+            ),
+            SpaceModel.id.in_(member_spaces),
+        ),
+    ).subquery()
+
+    result = await db.execute(
+        select(matches).order_by(matches.c.score.desc(), matches.c.title).limit(limit)
+    )
+    hits = [AutocompleteHit.model_validate(row) for row in result.all()]
+    autocomplete_cache.set(cache_key, hits)
+
+    return hits
+
+
+async def _load_page_details_orm(db: AsyncSession, page_id: int) -> bytes:
+    """Load a page with its relationships through the ORM and serialize it."""
     result = await db.execute(
         select(PageModel)
         .options(
@@ -98,44 +595,79 @@ async def get_page(
         )
         .where(PageModel.id == page_id)
     )
-    page = result.scalar_one_or_none()
+    page = result.scalar_one()
+    return PageWithDetails.model_validate(page).model_dump_json().encode()
 
-    if not page:
+
+async def _load_page_details_json(db: AsyncSession, page_id: int) -> bytes:
+    """Have PostgreSQL build the PageWithDetails document in a single statement."""
+    result = await db.execute(PAGE_DETAILS_JSON_SQL, {"page_id": page_id})
+    return result.scalar_one().encode()
+
+
+async def _page_details_response(db: AsyncSession, page_id: int, etag: str) -> Response:
+    """
+    Serve a page's PageWithDetails body for the given version.
+
+    Bodies are cached as serialized bytes per (page, ETag), so a popular page
+    is only loaded and serialized once per change.
+    """
+    cache_key = page_cache_key(page_id)
+    body = page_response_cache.get(cache_key, etag)
+
+    if body is None:
+        if settings.PAGE_DETAILS_JSON_FAST_PATH:
+            body = await _load_page_details_json(db, page_id)
+        else:
+            body = await _load_page_details_orm(db, page_id)
+        page_response_cache.set(cache_key, etag, body)
+
+    return Response(content=body, media_type="application/json", headers=_etag_headers(etag))
+
+
+@router.get("/{page_id}", response_model=PageWithDetails)
+async def get_page(
+    page_id: int,
+    if_none_match: str | None = Header(default=None),
+    db: AsyncSession = Depends(get_db),
+):
+    """Get a specific page by ID with full details; honours If-None-Match."""
+    version = await _get_page_etag(db, PageModel.id == page_id)
+
+    if version is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Page with id {page_id} not found"
         )
 
-    return page
+    _, etag = version
+    if etag_matches(if_none_match, etag):
+        return _not_modified(etag)
+
+    return await _page_details_response(db, page_id, etag)
 
 
 @router.get("/space/{space_id}/slug/{slug}", response_model=PageWithDetails)
 async def get_page_by_space_and_slug(
     space_id: int,
     slug: str,
+    if_none_match: str | None = Header(default=None),
     db: AsyncSession = Depends(get_db),
 ):
-    """Get a specific page by space ID and slug."""
-    result = await db.execute(
-        select(PageModel)
-        .options(
-            selectinload(PageModel.creator),
-            selectinload(PageModel.updater),
-            selectinload(PageModel.space),
-            selectinload(PageModel.tags),
-            selectinload(PageModel.sections),
-        )
-        .where(PageModel.space_id == space_id, PageModel.slug == slug)
-    )
-    page = result.scalar_one_or_none()
+    """Get a specific page by space ID and slug; honours If-None-Match."""
+    version = await _get_page_etag(db, PageModel.space_id == space_id, PageModel.slug == slug)
 
-    if not page:
+    if version is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Page with slug {slug} not found in space {space_id}"
         )
 
-    return page
+    page_id, etag = version
+    if etag_matches(if_none_match, etag):
+        return _not_modified(etag)
+
+    return await _page_details_response(db, page_id, etag)
 
 
 @router.post("/", response_model=Page, status_code=status.HTTP_201_CREATED)
@@ -182,11 +714,11 @@ async def create_page(
 
     # Ensure we keep a text fallback for older clients/revisions
     if not page_data.get("content") and page_in.sections:
-        page_data["content"] = _sections_to_text(page_in.sections)
+        page_data["content"] = sections_to_text(page_in.sections)
     if "content" not in page_data or page_data["content"] is None:
         page_data["content"] = ""
 
-    page = PageModel(**page_data)
+    page = PageModel(**page_data, current_revision=1)
 
     # Add tags if provided
     if page_in.tag_ids:
@@ -196,124 +728,91 @@ async def create_page(
         tags = result.scalars().all()
         page.tags = list(tags)
 
-    # Add structured sections if provided
+    # Add structured sections if provided, storing their bodies by hash
+    section_hashes: list[str] = []
     if page_in.sections:
-        _build_sections_for_page(page, page_in.sections)
+        section_hashes = await store_section_contents(
+            db, sorted(page_in.sections, key=lambda section: section.position)
+        )
+        build_sections_for_page(page, page_in.sections)
+    page.content_hash = page_content_hash(
+        page.title,
+        page.content,
+        [(section.position, section.content_hash) for section in page.sections],
+    )
 
     db.add(page)
     await db.commit()
 
     # Create initial revision
-    revision = RevisionModel(
+    revision = await build_revision(
+        db,
         page_id=page.id,
         revision_number=1,
         title=page.title,
         content=page.content,
         editor_id=page.created_by,
+        section_hashes=section_hashes,
     )
     db.add(revision)
     await db.commit()
+    page_response_cache.invalidate(page_cache_key(page.id))
 
-    # Reload with relationships loaded to avoid lazy IO during response serialization
-    result = await db.execute(
-        select(PageModel)
-        .options(selectinload(PageModel.sections), selectinload(PageModel.tags))
-        .where(PageModel.id == page.id)
-    )
-    page = result.scalar_one()
+    return await load_page(db, page.id)
 
-    return page
 
+async def _precondition_failed(db: AsyncSession, page_id: int) -> NoReturn:
+    """Answer a failed If-Match with 412 and the page's current ETag."""
+    await db.rollback()
+    version = await _get_page_etag(db, PageModel.id == page_id)
 
-@router.patch("/{page_id}", response_model=Page)
-async def update_page(
-    page_id: int,
-    page_in: PageUpdate,
-    db: AsyncSession = Depends(get_db),
-):
-    """Update a page and create a new revision."""
-    result = await db.execute(
-        select(PageModel)
-        .options(
-            selectinload(PageModel.revisions),
-            selectinload(PageModel.sections),
-        )
-        .where(PageModel.id == page_id)
-    )
-    page = result.scalar_one_or_none()
-
-    if not page:
+    if version is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Page with id {page_id} not found"
         )
 
-    # Track if content changed for revision creation
-    content_changed = False
-    update_data = page_in.model_dump(exclude_unset=True, exclude={"tag_ids", "sections"})
-
-    # Update tags if provided
-    if page_in.tag_ids is not None:
-        result = await db.execute(
-            select(TagModel).where(TagModel.id.in_(page_in.tag_ids))
-        )
-        tags = result.scalars().all()
-        page.tags = list(tags)
-
-    # Replace sections if provided
-    if page_in.sections is not None:
-        # Remove existing sections to avoid PK/unique conflicts, then add fresh ones
-        await db.execute(delete(PageSectionModel).where(PageSectionModel.page_id == page.id))
-        await db.flush()
-        await db.execute(
-            text(
-                "SELECT setval(pg_get_serial_sequence('page_sections','id'), "
-                "(SELECT COALESCE(MAX(id), 0) + 1 FROM page_sections), false)"
-            )
-        )
-        _build_sections_for_page(page, page_in.sections)
-        # If caller didn't set content explicitly, derive a fallback for revisions
-        if "content" not in update_data:
-            update_data["content"] = _sections_to_text(page_in.sections)
-        content_changed = True
-
-    # Check if title or content changed
-    if "title" in update_data or "content" in update_data:
-        content_changed = True
-
-    for field, value in update_data.items():
-        setattr(page, field, value if value is not None else getattr(page, field))
-
-    # Create new revision if content changed
-    if content_changed and page_in.updated_by:
-        # Get next revision number
-        result = await db.execute(
-            select(func.max(RevisionModel.revision_number))
-            .where(RevisionModel.page_id == page_id)
-        )
-        max_revision = result.scalar() or 0
-        next_revision = max_revision + 1
-
-        revision = RevisionModel(
-            page_id=page.id,
-            revision_number=next_revision,
-            title=page.title,
-            content=page.content,
-            editor_id=page_in.updated_by,
-        )
-        db.add(revision)
+    raise HTTPException(
+        status_code=status.HTTP_412_PRECONDITION_FAILED,
+        detail="Page has been modified since the ETag in If-Match",
+        headers={"ETag": version[1]},
+    )
 
-    await db.commit()
 
-    # Reload with relationships loaded to avoid lazy IO during response serialization
-    result = await db.execute(
-        select(PageModel)
-        .options(selectinload(PageModel.sections), selectinload(PageModel.tags))
-        .where(PageModel.id == page.id)
-    )
-    page = result.scalar_one()
+@router.patch("/{page_id}", response_model=Page)
+async def update_page(
+    page_id: int,
+    page_in: PageUpdate,
+    if_match: str | None = Header(default=None),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Update a page and create a new revision.
+
+    Guard against overwriting a newer edit with either the page version the
+    edit is based on, as `expected_version` (409 with the current version on
+    mismatch), or the page's ETag in If-Match (412 with the current ETag).
+    Page ETags lead with the page version, and If-Match is checked against
+    that version alone, by the same conditional UPDATE as expected_version.
+    """
+    versions = etag_versions(if_match) if if_match is not None else None
+    if versions is not None:
+        if len(set(versions)) != 1 or page_in.expected_version not in (None, versions[0]):
+            await _precondition_failed(db, page_id)
+        page_in = page_in.model_copy(update={"expected_version": versions[0]})
+
+    try:
+        saved = await save_page(db, page_id, page_in)
+    except HTTPException as exc:
+        if versions is None or exc.status_code != status.HTTP_409_CONFLICT:
+            raise
+        await _precondition_failed(db, page_id)
+
+    if saved:
+        await db.commit()
+        page_response_cache.invalidate(page_cache_key(page_id))
 
-    return page
+    return await load_page(db, page_id)
 
 
 @router.delete("/{page_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -339,4 +838,6 @@ async def delete_page(
         await db.delete(page)
         await db.commit()
 
+    page_response_cache.invalidate(page_cache_key(page_id))
+
     return None
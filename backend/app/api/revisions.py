@@ -1,35 +1,252 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+import difflib
+from collections.abc import Sequence
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.core.pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor
+from app.core.revision_store import hydrate_revision_contents, load_revision_contents
+from app.core.section_store import load_section_contents
 from app.db.session import get_db
 from app.models import Revision as RevisionModel
-from app.schemas import Revision, RevisionWithEditor
+from app.models import User as UserModel
+from app.models.page_section import SECTION_CONTENT_FIELDS
+from app.schemas import (
+    PageSectionSnapshot,
+    RevisionDiff,
+    RevisionDiffChange,
+    RevisionSummary,
+    RevisionWithEditor,
+)
 
 router = APIRouter(prefix="/revisions", tags=["revisions"])
 
+# Serialized RevisionDiff bodies keyed by the two revisions' row ids and content
+# hashes plus format and context. The compactor deletes revisions and rewrites
+# the rows it keeps, so the rows are looked up on every request: a compacted-away
+# revision is a 404, and a rewritten one can never hit a stale entry
+diff_cache = LRUCache(
+    maxsize=settings.REVISION_DIFF_CACHE_SIZE,
+    maxweight=settings.REVISION_DIFF_CACHE_MAX_BYTES,
+    weigh=len,
+)
+
+
+def _paginate_history(query: Select, skip: int, cursor: str | None) -> Select:
+    """Order a page's revisions newest first and apply cursor or offset pagination."""
+    query = query.order_by(RevisionModel.revision_number.desc())
+
+    if cursor:
+        position = decode_cursor(cursor, {"revision_number": int})
+        query = query.where(RevisionModel.revision_number < position["revision_number"])
+    elif skip:
+        query = query.offset(skip)
+
+    return query
+
+
+def _set_next_history_cursor(response: Response, revisions: Sequence, limit: int) -> None:
+    """Point X-Next-Cursor past the last revision when the page of results is full."""
+    if revisions and len(revisions) == limit:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(
+            {"revision_number": revisions[-1].revision_number}
+        )
+
+
+def _diff_revisions(
+    page_id: int,
+    old: tuple[int, str, str],
+    new: tuple[int, str, str],
+    format: str,
+    context: int,
+) -> RevisionDiff:
+    """Build the diff between two (revision_number, title, content) triples."""
+    old_lines = old[2].splitlines()
+    new_lines = new[2].splitlines()
+    matcher = difflib.SequenceMatcher(a=old_lines, b=new_lines, autojunk=False)
+
+    changes = [
+        RevisionDiffChange(
+            op=op,
+            from_start=i1,
+            from_end=i2,
+            to_start=j1,
+            to_end=j2,
+            removed=old_lines[i1:i2],
+            added=new_lines[j1:j2],
+        )
+        for op, i1, i2, j1, j2 in matcher.get_opcodes()
+        if op != "equal"
+    ]
+
+    diff = RevisionDiff(
+        page_id=page_id,
+        from_revision=old[0],
+        to_revision=new[0],
+        from_title=old[1],
+        to_title=new[1],
+        format=format,
+        lines_added=sum(change.to_end - change.to_start for change in changes),
+        lines_removed=sum(change.from_end - change.from_start for change in changes),
+    )
+
+    if format == "structured":
+        diff.changes = changes
+    else:
+        diff.unified = "\n".join(
+            difflib.unified_diff(
+                old_lines,
+                new_lines,
+                fromfile=f"revision {old[0]}",
+                tofile=f"revision {new[0]}",
+                n=context,
+                lineterm="",
+            )
+        )
+
+    return diff
+
 
 @router.get("/page/{page_id}", response_model=list[RevisionWithEditor])
 async def list_page_revisions(
     page_id: int,
+    response: Response,
     skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: str | None = None,
     db: AsyncSession = Depends(get_db),
 ):
-    """Get all revisions for a specific page."""
-    result = await db.execute(
+    """
+    Get all revisions for a specific page, newest first.
+
+    Pass the X-Next-Cursor response header back as `cursor` to fetch the next
+    page; the lookup walks the (page_id, revision_number) unique index.
+    Delta-stored revisions are rebuilt together from one keyframe chain.
+    """
+    query = (
         select(RevisionModel)
         .options(selectinload(RevisionModel.editor))
         .where(RevisionModel.page_id == page_id)
-        .order_by(RevisionModel.revision_number.desc())
-        .offset(skip)
-        .limit(limit)
     )
+    query = _paginate_history(query, skip, cursor)
+
+    result = await db.execute(query.limit(limit))
     revisions = result.scalars().all()
+    await hydrate_revision_contents(db, revisions)
+    _set_next_history_cursor(response, revisions, limit)
+
+    return revisions
+
+
+@router.get("/page/{page_id}/history", response_model=list[RevisionSummary])
+async def list_page_history(
+    page_id: int,
+    response: Response,
+    skip: int = 0,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: str | None = None,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Get a page's revision history without content, newest first.
+
+    Returns the stored content size and hash instead of the content, so a
+    history panel costs one index scan and a few KB; fetch a revision's
+    content on demand. Paginates like `list_page_revisions`.
+    """
+    query = (
+        select(
+            RevisionModel.id,
+            RevisionModel.page_id,
+            RevisionModel.revision_number,
+            RevisionModel.title,
+            RevisionModel.editor_id,
+            UserModel.username.label("editor_username"),
+            UserModel.display_name.label("editor_display_name"),
+            RevisionModel.created_at,
+            RevisionModel.content_size,
+            RevisionModel.content_hash,
+        )
+        .join(UserModel, UserModel.id == RevisionModel.editor_id)
+        .where(RevisionModel.page_id == page_id)
+    )
+    query = _paginate_history(query, skip, cursor)
+
+    result = await db.execute(query.limit(limit))
+    revisions = result.all()
+    _set_next_history_cursor(response, revisions, limit)
+
     return revisions
 
 
+@router.get("/page/{page_id}/diff", response_model=RevisionDiff)
+async def diff_page_revisions(
+    page_id: int,
+    from_revision: int = Query(..., alias="from"),
+    to_revision: int = Query(..., alias="to"),
+    format: Literal["unified", "structured"] = "unified",
+    context: int = Query(3, ge=0, le=100),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Diff two revisions of a page on the server.
+
+    `unified` returns a unified diff string with `context` lines around each
+    hunk; `structured` returns the changed line ranges with their text.
+    Results are cached per pair of stored revision rows.
+    """
+    result = await db.execute(
+        select(
+            RevisionModel.revision_number,
+            RevisionModel.id,
+            RevisionModel.content_hash,
+            RevisionModel.title,
+        ).where(
+            RevisionModel.page_id == page_id,
+            RevisionModel.revision_number.in_([from_revision, to_revision]),
+        )
+    )
+    rows = {row.revision_number: row for row in result.all()}
+
+    for number in (from_revision, to_revision):
+        if number not in rows:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Revision {number} not found for page {page_id}"
+            )
+
+    old, new = rows[from_revision], rows[to_revision]
+    cache_key = (old.id, old.content_hash, new.id, new.content_hash, format, context)
+    body = diff_cache.get(cache_key)
+    if body is not None:
+        return Response(content=body, media_type="application/json")
+
+    # Close revisions share a keyframe chain, so one range query covers both
+    low, high = sorted((from_revision, to_revision))
+    if high - low < settings.REVISION_KEYFRAME_INTERVAL:
+        contents = await load_revision_contents(db, page_id, low, high)
+    else:
+        contents = await load_revision_contents(db, page_id, low, low)
+        contents.update(await load_revision_contents(db, page_id, high, high))
+
+    diff = _diff_revisions(
+        page_id,
+        (from_revision, old.title, contents[from_revision]),
+        (to_revision, new.title, contents[to_revision]),
+        format,
+        context,
+    )
+    body = diff.model_dump_json(exclude_none=True).encode()
+    diff_cache.set(cache_key, body)
+
+    return Response(content=body, media_type="application/json")
+
+
 @router.get("/{revision_id}", response_model=RevisionWithEditor)
 async def get_revision(
     revision_id: int,
@@ -49,9 +266,45 @@ async def get_revision(
             detail=f"Revision with id {revision_id} not found"
         )
 
+    await hydrate_revision_contents(db, [revision])
+
     return revision
 
 
+@router.get("/{revision_id}/sections", response_model=list[PageSectionSnapshot])
+async def get_revision_sections(
+    revision_id: int,
+    db: AsyncSession = Depends(get_db),
+):
+    """Get the structured sections of a page as they were at this revision."""
+    result = await db.execute(
+        select(RevisionModel.section_hashes).where(RevisionModel.id == revision_id)
+    )
+    row = result.one_or_none()
+
+    if row is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Revision with id {revision_id} not found"
+        )
+    if row.section_hashes is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Revision with id {revision_id} has no section snapshot"
+        )
+
+    contents = await load_section_contents(db, row.section_hashes)
+
+    return [
+        PageSectionSnapshot(
+            content_hash=content.hash,
+            position=position,
+            **{field: getattr(content, field) for field in SECTION_CONTENT_FIELDS},
+        )
+        for position, content in enumerate(contents)
+    ]
+
+
 @router.get("/page/{page_id}/number/{revision_number}", response_model=RevisionWithEditor)
 async def get_revision_by_number(
     page_id: int,
@@ -75,4 +328,6 @@ async def get_revision_by_number(
             detail=f"Revision {revision_number} not found for page {page_id}"
         )
 
+    await hydrate_revision_contents(db, [revision])
+
     return revision
@@ -0,0 +1,267 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from pydantic import ValidationError
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.page_store import claim_page_version, record_section_edit
+from app.core.response_cache import page_cache_key, page_response_cache
+from app.core.section_store import store_section_contents
+from app.db.session import get_db
+from app.models import PageSection as PageSectionModel
+from app.models.page_section import SECTION_CONTENT_FIELDS
+from app.schemas import PageSection, PageSectionInsert, PageSectionMove, PageSectionUpdate
+from app.schemas.page_section import PageSectionBase
+
+router = APIRouter(prefix="/sections", tags=["sections"])
+
+# Spacing between neighbouring sections after a rebalance, leaving room for
+# many inserts and moves before the positions need to be spread out again
+POSITION_GAP = 1024
+
+
+async def _get_section(db: AsyncSession, section_id: int) -> PageSectionModel:
+    """
+    Load a section by ID or raise 404.
+
+    Always reads the current row, even if the session already holds the
+    section, so loading it again after claim_page_version sees every edit
+    committed before the page lock was taken.
+    """
+    result = await db.execute(
+        select(PageSectionModel)
+        .where(PageSectionModel.id == section_id)
+        .execution_options(populate_existing=True)
+    )
+    section = result.scalar_one_or_none()
+
+    if not section:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Section with id {section_id} not found"
+        )
+
+    return section
+
+
+async def _anchor_position(
+    db: AsyncSession,
+    page_id: int,
+    after_section_id: int | None,
+) -> int | None:
+    """Return the position of the anchor section, or None for the top of the page."""
+    if after_section_id is None:
+        return None
+
+    result = await db.execute(
+        select(PageSectionModel.position).where(
+            PageSectionModel.id == after_section_id,
+            PageSectionModel.page_id == page_id,
+        )
+    )
+    position = result.scalar_one_or_none()
+
+    if position is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Section with id {after_section_id} not found on page {page_id}"
+        )
+
+    return position
+
+
+async def _free_position(
+    db: AsyncSession,
+    page_id: int,
+    after_section_id: int | None,
+    exclude_id: int | None = None,
+) -> int:
+    """
+    Find an unused position directly after the anchor section.
+
+    Picks the midpoint of the gap to the next section. Only when that gap is
+    exhausted are the page's positions spread out again, so a typical insert
+    or move writes a single row.
+    """
+    for attempt in range(2):
+        lower = await _anchor_position(db, page_id, after_section_id)
+
+        query = select(func.min(PageSectionModel.position)).where(
+            PageSectionModel.page_id == page_id
+        )
+        if lower is not None:
+            query = query.where(PageSectionModel.position > lower)
+        if exclude_id is not None:
+            query = query.where(PageSectionModel.id != exclude_id)
+        upper = (await db.execute(query)).scalar()
+
+        if upper is None:
+            return POSITION_GAP if lower is None else lower + POSITION_GAP
+
+        candidate = (upper // 2) if lower is None else (lower + upper) // 2
+        if candidate != upper and candidate != lower:
+            return candidate
+
+        if attempt == 0:
+            await _rebalance_positions(db, page_id)
+
+    raise HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail=f"Could not find a free position on page {page_id}"
+    )
+
+
+async def _rebalance_positions(db: AsyncSession, page_id: int) -> None:
+    """
+    Spread a page's section positions POSITION_GAP apart, keeping their order.
+
+    Goes through negative positions first so neither statement trips the
+    uq_page_sections_page_position constraint midway.
+    """
+    await db.flush()
+    await db.execute(
+        text(
+            "UPDATE page_sections AS ps SET position = -ordered.rn "
+            "FROM (SELECT id, row_number() OVER (ORDER BY position) AS rn "
+            "      FROM page_sections WHERE page_id = :page_id) AS ordered "
+            "WHERE ps.id = ordered.id"
+        ),
+        {"page_id": page_id},
+    )
+    await db.execute(
+        text("UPDATE page_sections SET position = -position * :gap WHERE page_id = :page_id"),
+        {"page_id": page_id, "gap": POSITION_GAP},
+    )
+    db.expire_all()
+
+
+@router.post("/page/{page_id}", response_model=PageSection, status_code=status.HTTP_201_CREATED)
+async def insert_section(
+    page_id: int,
+    section_in: PageSectionInsert,
+    db: AsyncSession = Depends(get_db),
+):
+    """Insert a single section after another one (or at the top of the page)."""
+    # Claiming the page version first locks the page, so concurrent section
+    # edits pick positions and rebuild the content one at a time
+    claimed = await claim_page_version(db, page_id, new_revision=True)
+    position = await _free_position(db, page_id, section_in.after_section_id)
+    content_hashes = await store_section_contents(db, [section_in])
+
+    section = PageSectionModel(page_id=page_id, position=position, content_hash=content_hashes[0])
+    db.add(section)
+    await record_section_edit(db, page_id, claimed.current_revision, section_in.updated_by)
+    await db.commit()
+    page_response_cache.invalidate(page_cache_key(page_id))
+    await db.refresh(section)
+
+    return section
+
+
+@router.patch("/{section_id}", response_model=PageSection)
+async def update_section(
+    section_id: int,
+    section_in: PageSectionUpdate,
+    db: AsyncSession = Depends(get_db),
+):
+    """Update the content of a single section without rewriting the rest of the page."""
+    section = await _get_section(db, section_id)
+    claimed = await claim_page_version(db, section.page_id, new_revision=True)
+    # Merge against the row as it is under the page lock, not as first read,
+    # so a concurrent partial update of other fields is not overwritten
+    section = await _get_section(db, section_id)
+    update_data = section_in.model_dump(exclude_unset=True, exclude={"updated_by"})
+
+    # Validate the merged section, since the payload may only carry some fields
+    merged = {field: getattr(section, field) for field in SECTION_CONTENT_FIELDS}
+    merged.update({k: v for k, v in update_data.items() if k in SECTION_CONTENT_FIELDS})
+    try:
+        content = PageSectionBase(position=section.position, **merged)
+    except ValidationError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=exc.errors(include_url=False, include_context=False)
+        )
+
+    if update_data.get("position") not in (None, section.position):
+        result = await db.execute(
+            select(PageSectionModel.id).where(
+                PageSectionModel.page_id == section.page_id,
+                PageSectionModel.position == update_data["position"],
+            )
+        )
+        if result.scalar_one_or_none() is not None:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=(
+                    f"Position {update_data['position']} is already taken "
+                    f"on page {section.page_id}"
+                )
+            )
+
+    if update_data.get("position") is not None:
+        section.position = update_data["position"]
+    # Bodies are immutable and shared; point the section at the merged one
+    section.content_hash = (await store_section_contents(db, [content]))[0]
+
+    await record_section_edit(db, section.page_id, claimed.current_revision, section_in.updated_by)
+    await db.commit()
+    page_response_cache.invalidate(page_cache_key(section.page_id))
+    await db.refresh(section)
+
+    return section
+
+
+@router.post("/{section_id}/move", response_model=PageSection)
+async def move_section(
+    section_id: int,
+    move_in: PageSectionMove,
+    db: AsyncSession = Depends(get_db),
+):
+    """Move a section after another one, rewriting only its own position."""
+    section = await _get_section(db, section_id)
+
+    if move_in.after_section_id == section.id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="A section cannot be moved after itself"
+        )
+
+    page_id = section.page_id
+    claimed = await claim_page_version(db, page_id, new_revision=True)
+    position = await _free_position(db, page_id, move_in.after_section_id, exclude_id=section_id)
+
+    # A rebalance may have expired the section
+    section = await _get_section(db, section_id)
+    section.position = position
+
+    await record_section_edit(db, page_id, claimed.current_revision, move_in.updated_by)
+    await db.commit()
+    page_response_cache.invalidate(page_cache_key(page_id))
+    await db.refresh(section)
+
+    return section
+
+
+@router.delete("/{section_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_section(
+    section_id: int,
+    updated_by: int | None = None,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Delete a single section; the remaining positions are left untouched.
+
+    `updated_by` names the editor the page revision is attributed to.
+    """
+    section = await _get_section(db, section_id)
+    page_id = section.page_id
+    claimed = await claim_page_version(db, page_id, new_revision=True)
+    # A concurrent delete may have removed it while we waited for the page lock
+    section = await _get_section(db, section_id)
+
+    await db.delete(section)
+    await record_section_edit(db, page_id, claimed.current_revision, updated_by)
+    await db.commit()
+    page_response_cache.invalidate(page_cache_key(page_id))
+
+    return None
@@ -5,10 +5,10 @@ from sqlalchemy.orm import selectinload
 
 from app.core.deps import get_db, get_current_active_user
 from app.models.space import Space as SpaceModel
-from app.models.user import User
 from app.models.workspace import Workspace
 from app.models.workspace_member import WorkspaceMember
 from app.schemas.space import Space, SpaceCreate, SpaceUpdate, SpaceWithOwner
+from app.schemas.user import Principal
 
 router = APIRouter(prefix="/spaces", tags=["spaces"])
 
@@ -49,7 +49,7 @@ async def list_spaces(
     workspace_id: int,
     skip: int = 0,
     limit: int = 100,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Get all spaces in a workspace (requires membership)."""
@@ -71,7 +71,7 @@ async def list_spaces(
 async def get_space_by_slug(
     slug: str,
     workspace_id: int,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Get a specific space by slug (requires workspace membership)."""
@@ -101,7 +101,7 @@ async def get_space_by_slug(
 @router.get("/{space_id}", response_model=SpaceWithOwner)
 async def get_space(
     space_id: int,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Get a specific space by ID (requires workspace membership)."""
@@ -127,7 +127,7 @@ async def get_space(
 @router.post("/", response_model=Space, status_code=status.HTTP_201_CREATED)
 async def create_space(
     space_in: SpaceCreate,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Create a new space in a workspace (requires member, admin, or owner role)."""
@@ -169,7 +169,7 @@ async def create_space(
 async def update_space(
     space_id: int,
     space_in: SpaceUpdate,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Update a space (requires owner, admin role, or being the space owner)."""
@@ -205,7 +205,7 @@ async def update_space(
 @router.delete("/{space_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_space(
     space_id: int,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Delete a space and all its pages (requires owner/admin role or being space owner)."""
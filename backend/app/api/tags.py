@@ -1,14 +1,26 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.page_store import claim_page_version
+from app.core.response_cache import page_cache_key, page_response_cache
 from app.db.session import get_db
+from app.models import Page as PageModel
 from app.models import Tag as TagModel
-from app.schemas import Tag, TagCreate, TagUpdate
+from app.models import page_tags
+from app.schemas import Tag, TagBulkResult, TagBulkUpdate, TagCreate, TagUpdate
 
 router = APIRouter(prefix="/tags", tags=["tags"])
 
 
+async def _invalidate_tagged_pages(db: AsyncSession, tag_id: int) -> None:
+    """Drop cached page responses that embed this tag."""
+    result = await db.execute(select(page_tags.c.page_id).where(page_tags.c.tag_id == tag_id))
+    for page_id in result.scalars().all():
+        page_response_cache.invalidate(page_cache_key(page_id))
+
+
 @router.get("/", response_model=list[Tag])
 async def list_tags(
     skip: int = 0,
@@ -94,6 +106,92 @@ async def create_tag(
     return tag
 
 
+async def _require_all_exist(db: AsyncSession, model, ids: set[int], label: str) -> None:
+    """Raise 404 naming any of ids that has no row in model's table."""
+    if not ids:
+        return
+
+    result = await db.execute(select(model.id).where(model.id.in_(ids)))
+    missing = ids - set(result.scalars().all())
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"{label} not found: {', '.join(map(str, sorted(missing)))}"
+        )
+
+
+@router.post("/bulk", response_model=TagBulkResult)
+async def bulk_update_tags(
+    bulk_in: TagBulkUpdate,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Add and remove tags on many pages in one transaction.
+
+    One INSERT ... ON CONFLICT DO NOTHING and one DELETE on page_tags, so
+    revisions and sections are left alone and existing links are not
+    rewritten. The pages are locked in id order before their links change,
+    and every page whose tags changed has its version claimed, so a save
+    based on an older version or ETag is rejected instead of overwriting the
+    new tags. Returns how many links were actually added and removed.
+    """
+    page_ids = set(bulk_in.page_ids)
+    add_tag_ids = set(bulk_in.add_tag_ids)
+    remove_tag_ids = set(bulk_in.remove_tag_ids)
+
+    if not (add_tag_ids or remove_tag_ids):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Nothing to add or remove"
+        )
+    if add_tag_ids & remove_tag_ids:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="A tag cannot be both added and removed"
+        )
+
+    await _require_all_exist(db, PageModel, page_ids, "Pages")
+    await _require_all_exist(db, TagModel, add_tag_ids, "Tags")
+
+    # Take the same row locks claim_page_version takes, in a fixed order, so
+    # the link writes cannot deadlock against page saves or other bulk updates
+    await db.execute(
+        select(PageModel.id)
+        .where(PageModel.id.in_(page_ids))
+        .order_by(PageModel.id)
+        .with_for_update(key_share=True)
+    )
+
+    added_to: list[int] = []
+    removed_from: list[int] = []
+    if add_tag_ids:
+        statement = insert(page_tags).from_select(
+            ["page_id", "tag_id"],
+            select(PageModel.id, TagModel.id)
+            .where(PageModel.id.in_(page_ids), TagModel.id.in_(add_tag_ids))
+            .order_by(PageModel.id, TagModel.id),
+        ).on_conflict_do_nothing().returning(page_tags.c.page_id)
+        added_to = (await db.execute(statement)).scalars().all()
+
+    if remove_tag_ids:
+        statement = delete(page_tags).where(
+            page_tags.c.page_id.in_(page_ids),
+            page_tags.c.tag_id.in_(remove_tag_ids),
+        ).returning(page_tags.c.page_id)
+        removed_from = (await db.execute(statement)).scalars().all()
+
+    changed_page_ids = sorted(set(added_to) | set(removed_from))
+    for page_id in changed_page_ids:
+        await claim_page_version(db, page_id)
+
+    await db.commit()
+
+    for page_id in changed_page_ids:
+        page_response_cache.invalidate(page_cache_key(page_id))
+
+    return TagBulkResult(added=len(added_to), removed=len(removed_from))
+
+
 @router.patch("/{tag_id}", response_model=Tag)
 async def update_tag(
     tag_id: int,
@@ -143,6 +241,7 @@ async def update_tag(
     for field, value in update_data.items():
         setattr(tag, field, value)
 
+    await _invalidate_tagged_pages(db, tag_id)
     await db.commit()
     await db.refresh(tag)
 
@@ -164,6 +263,7 @@ async def delete_tag(
             detail=f"Tag with id {tag_id} not found"
         )
 
+    await _invalidate_tagged_pages(db, tag_id)
     await db.delete(tag)
     await db.commit()
 
@@ -1,13 +1,19 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from sqlalchemy import any_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.deps import invalidate_principal
+from app.core.etag import etag_matches, make_etag
+from app.core.security import get_password_hash
 from app.db.session import get_db
 from app.models import User as UserModel
 from app.schemas import User, UserCreate, UserUpdate
 
 router = APIRouter(prefix="/users", tags=["users"])
 
+# Upper bound on the ids or usernames accepted by one batch lookup
+MAX_USER_BATCH_SIZE = 100
+
 
 @router.get("/", response_model=list[User])
 async def list_users(
@@ -26,6 +32,60 @@ async def list_users(
     return users
 
 
+async def _batch_response(
+    db: AsyncSession,
+    criterion,
+    response: Response,
+    if_none_match: str | None,
+):
+    """
+    Load the users matching criterion in one query and answer conditionally.
+
+    The ETag covers each returned user's id and updated_at, so a client or
+    cache can revalidate a batch without the body being resent.
+    """
+    result = await db.execute(select(UserModel).where(criterion).order_by(UserModel.id))
+    users = result.scalars().all()
+
+    etag = make_etag(*(f"{user.id}:{user.updated_at.isoformat()}" for user in users))
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
+    return users
+
+
+@router.get("/batch", response_model=list[User])
+async def get_users_batch(
+    response: Response,
+    ids: list[int] = Query(..., min_length=1, max_length=MAX_USER_BATCH_SIZE),
+    if_none_match: str | None = Header(default=None),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Get several users by id in one request, e.g. `?ids=1&ids=2`.
+
+    Unknown ids are left out of the result, which is ordered by id.
+    """
+    return await _batch_response(
+        db, UserModel.id == any_(sorted(set(ids))), response, if_none_match
+    )
+
+
+@router.get("/batch/username", response_model=list[User])
+async def get_users_batch_by_username(
+    response: Response,
+    usernames: list[str] = Query(..., min_length=1, max_length=MAX_USER_BATCH_SIZE),
+    if_none_match: str | None = Header(default=None),
+    db: AsyncSession = Depends(get_db),
+):
+    """Get several users by username in one request, e.g. `?usernames=ada&usernames=bob`."""
+    return await _batch_response(
+        db, UserModel.username == any_(sorted(set(usernames))), response, if_none_match
+    )
+
+
 @router.get("/{user_id}", response_model=User)
 async def get_user(
     user_id: int,
@@ -89,11 +149,10 @@ async def create_user(
                 detail="Email already registered"
             )
 
-    # Create user (in production, hash the password)
+    # Create user; bcrypt runs on the password pool, off the event loop
     user_data = user_in.model_dump(exclude={"password"})
     if user_in.password:
-        # In production, use proper password hashing (bcrypt, argon2, etc.)
-        user_data["hashed_password"] = f"hashed_{user_in.password}"
+        user_data["hashed_password"] = await get_password_hash(user_in.password)
 
     user = UserModel(**user_data)
     db.add(user)
@@ -122,13 +181,13 @@ async def update_user(
     update_data = user_in.model_dump(exclude_unset=True, exclude={"password"})
 
     if user_in.password:
-        # In production, use proper password hashing
-        update_data["hashed_password"] = f"hashed_{user_in.password}"
+        update_data["hashed_password"] = await get_password_hash(user_in.password)
 
     for field, value in update_data.items():
         setattr(user, field, value)
 
     await db.commit()
+    invalidate_principal(user_id)
     await db.refresh(user)
 
     return user
@@ -151,5 +210,6 @@ async def delete_user(
 
     user.is_active = False
     await db.commit()
+    invalidate_principal(user_id)
 
     return None
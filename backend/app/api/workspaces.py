@@ -3,13 +3,17 @@ import smtplib
 from email.message import EmailMessage
 from ssl import create_default_context
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 
+from app.api.spaces import check_workspace_membership
 from app.core.deps import get_db, get_current_active_user
+from app.models.retention_policy import RevisionRetentionPolicy
+from app.models.tag import Tag
+from app.models.tag_usage import tag_usage
 from app.models.workspace import Workspace
 from app.models.workspace_member import WorkspaceMember
 from app.models.user import User
@@ -22,7 +26,11 @@ from app.schemas.workspace import (
     WorkspaceMemberInvite,
     WorkspaceMemberUpdate,
     WorkspaceMemberWithUser,
+    RetentionPolicy as RetentionPolicySchema,
+    RetentionPolicyUpdate,
 )
+from app.schemas.tag import TagCloudEntry
+from app.schemas.user import Principal
 
 router = APIRouter()
 
@@ -66,7 +74,7 @@ def _send_invite_email(to_email: str, workspace_name: str, inviter_email: str |
 @router.post("/", response_model=WorkspaceSchema, status_code=status.HTTP_201_CREATED)
 async def create_workspace(
     workspace_in: WorkspaceCreate,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Create a new workspace. The creator becomes the owner."""
@@ -106,7 +114,7 @@ async def create_workspace(
 async def list_workspaces(
     skip: int = 0,
     limit: int = 100,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db),
 ):
     """List all workspaces the user is a member of."""
@@ -137,7 +145,7 @@ async def list_workspaces(
 @router.get("/{workspace_id}", response_model=WorkspaceWithMembers)
 async def get_workspace(
     workspace_id: int,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Get a specific workspace."""
@@ -170,7 +178,7 @@ async def get_workspace(
 async def update_workspace(
     workspace_id: int,
     workspace_in: WorkspaceUpdate,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Update a workspace. Only owner and admins can update."""
@@ -204,7 +212,7 @@ async def update_workspace(
 @router.delete("/{workspace_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_workspace(
     workspace_id: int,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Delete a workspace. Only owner can delete."""
@@ -226,7 +234,7 @@ async def delete_workspace(
 @router.get("/{workspace_id}/members", response_model=list[WorkspaceMemberWithUser])
 async def list_workspace_members(
     workspace_id: int,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db),
 ):
     """List all members of a workspace."""
@@ -258,7 +266,7 @@ async def list_workspace_members(
 async def invite_member(
     workspace_id: int,
     invite: WorkspaceMemberInvite,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Invite a user to the workspace by email."""
@@ -330,7 +338,7 @@ async def update_member_role(
     workspace_id: int,
     user_id: int,
     member_update: WorkspaceMemberUpdate,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Update a member's role. Only owner and admins can update roles."""
@@ -382,7 +390,7 @@ async def update_member_role(
 async def remove_member(
     workspace_id: int,
     user_id: int,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Remove a member from the workspace."""
@@ -427,3 +435,104 @@ async def remove_member(
 
     await db.delete(member)
     await db.commit()
+
+
+# Revision retention policy endpoints
+@router.get("/{workspace_id}/retention-policy", response_model=RetentionPolicySchema)
+async def get_retention_policy(
+    workspace_id: int,
+    current_user: Principal = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Get the workspace's revision retention policy."""
+    await check_workspace_membership(workspace_id, current_user.id, db)
+
+    result = await db.execute(
+        select(RevisionRetentionPolicy).where(RevisionRetentionPolicy.workspace_id == workspace_id)
+    )
+    policy = result.scalar_one_or_none()
+
+    if not policy:
+        raise HTTPException(status_code=404, detail="Workspace has no retention policy")
+
+    return policy
+
+
+@router.put("/{workspace_id}/retention-policy", response_model=RetentionPolicySchema)
+async def set_retention_policy(
+    workspace_id: int,
+    policy_in: RetentionPolicyUpdate,
+    current_user: Principal = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Create or replace the workspace's revision retention policy.
+
+    Only owner and admins can change it. Old revisions are thinned by the
+    compactor job (`python -m app.db.compact_revisions`), not by this call.
+    """
+    await check_workspace_membership(workspace_id, current_user.id, db, ["owner", "admin"])
+
+    result = await db.execute(
+        select(RevisionRetentionPolicy).where(RevisionRetentionPolicy.workspace_id == workspace_id)
+    )
+    policy = result.scalar_one_or_none()
+
+    if policy is None:
+        policy = RevisionRetentionPolicy(workspace_id=workspace_id)
+        db.add(policy)
+
+    for field, value in policy_in.model_dump().items():
+        setattr(policy, field, value)
+
+    await db.commit()
+    await db.refresh(policy)
+
+    return policy
+
+
+@router.delete("/{workspace_id}/retention-policy", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_retention_policy(
+    workspace_id: int,
+    current_user: Principal = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Remove the workspace's retention policy, so its history is kept in full."""
+    await check_workspace_membership(workspace_id, current_user.id, db, ["owner", "admin"])
+
+    result = await db.execute(
+        select(RevisionRetentionPolicy).where(RevisionRetentionPolicy.workspace_id == workspace_id)
+    )
+    policy = result.scalar_one_or_none()
+
+    if not policy:
+        raise HTTPException(status_code=404, detail="Workspace has no retention policy")
+
+    await db.delete(policy)
+    await db.commit()
+
+
+# Tag cloud
+@router.get("/{workspace_id}/tag-cloud", response_model=list[TagCloudEntry])
+async def get_tag_cloud(
+    workspace_id: int,
+    limit: int = Query(100, ge=1, le=1000),
+    current_user: Principal = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Get the workspace's most used tags, busiest first.
+
+    Reads the trigger-maintained tag_usage counts, so the cost depends on
+    limit rather than on how many pages are tagged.
+    """
+    await check_workspace_membership(workspace_id, current_user.id, db)
+
+    result = await db.execute(
+        select(Tag.id, Tag.name, Tag.slug, tag_usage.c.page_count)
+        .join(tag_usage, tag_usage.c.tag_id == Tag.id)
+        .where(tag_usage.c.workspace_id == workspace_id, tag_usage.c.page_count > 0)
+        .order_by(tag_usage.c.page_count.desc(), Tag.id)
+        .limit(limit)
+    )
+    return result.all()
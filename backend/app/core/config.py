@@ -26,6 +26,42 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24  # 24 hours
 
+    # Threads hashing and verifying passwords; also the cap on concurrent hashes
+    PASSWORD_HASH_WORKERS: int = 4
+
+    # Authenticated principals cached per process; the TTL bounds how long
+    # another worker may still accept a user deactivated elsewhere
+    PRINCIPAL_CACHE_SIZE: int = 10000
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 30
+
+    # Autocomplete
+    AUTOCOMPLETE_CACHE_SIZE: int = 4096
+    AUTOCOMPLETE_CACHE_TTL_SECONDS: int = 30
+
+    # Page response cache: "memory" (per process) or "shared" (key-value store)
+    RESPONSE_CACHE_BACKEND: str = "memory"
+    RESPONSE_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    RESPONSE_CACHE_TTL_SECONDS: int = 300
+
+    # Build page detail responses with SQL JSON aggregation instead of the ORM
+    PAGE_DETAILS_JSON_FAST_PATH: bool = False
+
+    # Revision history: store a full keyframe every N revisions, deltas in between
+    REVISION_KEYFRAME_INTERVAL: int = 20
+
+    # Drafts idle this long are published by the background publisher (0 disables it)
+    DRAFT_IDLE_PUBLISH_SECONDS: int = 300
+    DRAFT_PUBLISH_INTERVAL_SECONDS: int = 30
+
+    # Revision diffs are immutable; cache serialized bodies up to this many bytes
+    REVISION_DIFF_CACHE_SIZE: int = 2048
+    REVISION_DIFF_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+
+    # Compressed text columns: codec "none", "zlib" or "lzma" for new writes,
+    # applied to values of at least TEXT_COMPRESSION_MIN_BYTES
+    TEXT_COMPRESSION_CODEC: str = "none"
+    TEXT_COMPRESSION_MIN_BYTES: int = 1024
+
     # Google OAuth Settings
     GOOGLE_CLIENT_ID: str = ""
     GOOGLE_CLIENT_SECRET: str = ""
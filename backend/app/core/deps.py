@@ -3,19 +3,31 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import LRUCache
+from app.core.config import settings
 from app.core.security import decode_access_token
 from app.db.session import get_db
 from app.models import User
+from app.schemas import Principal
 
 # HTTP Bearer token authentication
 security = HTTPBearer()
 
+# Principals of active users by (user id, token iat); frozen Pydantic copies, so a
+# cached principal carries no session or lazy loads from one request into another
+principal_cache = LRUCache(settings.PRINCIPAL_CACHE_SIZE, ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS)
+
+
+def invalidate_principal(user_id: int) -> None:
+    """Forget every cached principal of a user, e.g. after it was changed or deactivated."""
+    principal_cache.delete_where(lambda key: key[0] == user_id)
+
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db),
-) -> User:
-    """Get the current authenticated user from JWT token."""
+) -> Principal:
+    """Get the current authenticated user from JWT token, as a principal."""
     token = credentials.credentials
 
     credentials_exception = HTTPException(
@@ -38,6 +50,11 @@ async def get_current_user(
     except (ValueError, TypeError):
         raise credentials_exception
 
+    cache_key = (user_id, payload.get("iat"))
+    principal = principal_cache.get(cache_key)
+    if principal is not None:
+        return principal
+
     # Get user from database
     result = await db.execute(select(User).where(User.id == user_id))
     user = result.scalar_one_or_none()
@@ -51,11 +68,13 @@ async def get_current_user(
             detail="Inactive user"
         )
 
-    return user
+    principal = Principal.model_validate(user)
+    principal_cache.set(cache_key, principal)
+    return principal
 
 
 async def get_current_active_user(
-    current_user: User = Depends(get_current_user),
-) -> User:
+    current_user: Principal = Depends(get_current_user),
+) -> Principal:
     """Get the current active user."""
     return current_user
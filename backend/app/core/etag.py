@@ -0,0 +1,57 @@
+import hashlib
+from typing import Any
+
+
+def make_etag(*parts: Any) -> str:
+    """Build a strong, quoted ETag from the values that make up a resource version."""
+    digest = hashlib.sha256("|".join(str(part) for part in parts).encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def make_versioned_etag(version: int, *parts: Any) -> str:
+    """
+    Build a strong ETag that leads with a version number, e.g. "7-3f2a...".
+
+    The digest still covers everything the representation shows, for
+    If-None-Match; the version lets If-Match be checked against it alone.
+    """
+    digest = make_etag(version, *parts).strip('"')
+    return f'"{version}-{digest}"'
+
+
+def etag_versions(header: str) -> list[int] | None:
+    """
+    Return the versions named by the versioned ETags in an If-Match header, or None for "*".
+
+    Weak and unrecognised tags name no version, as they can never satisfy If-Match.
+    """
+    candidates = [candidate.strip() for candidate in header.split(",")]
+    if "*" in candidates:
+        return None
+
+    versions = []
+    for candidate in candidates:
+        prefix, separator, _ = candidate.removeprefix('"').partition("-")
+        if candidate.startswith('"') and separator and prefix.isdigit():
+            versions.append(int(prefix))
+    return versions
+
+
+def etag_matches(header: str | None, etag: str, weak: bool = True) -> bool:
+    """
+    Check an If-None-Match / If-Match header value against an ETag.
+
+    If-None-Match uses the weak comparison; If-Match must pass weak=False, as
+    a weak validator never satisfies it (RFC 9110, section 13.1.1).
+    """
+    if not header:
+        return False
+
+    candidates = [candidate.strip() for candidate in header.split(",")]
+    if "*" in candidates:
+        return True
+
+    # Our own ETags are always strong, so only the client's side can be weak
+    if not weak:
+        return etag in candidates
+    return any(candidate.removeprefix("W/") == etag for candidate in candidates)
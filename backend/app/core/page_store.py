@@ -0,0 +1,405 @@
+"""
+Page writes shared by the page, section and draft endpoints.
+
+save_page applies a PageUpdate: the optimistic version check, no-op save
+detection, section syncing and the new revision. record_section_edit brings
+a page's content and history up to date after a single-section edit. Neither
+commits, so callers can run them inside their own transaction or savepoint;
+invalidate the page response cache once the caller has committed.
+"""
+
+from fastapi import HTTPException, status
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.core.revision_store import build_revision
+from app.core.section_store import page_content_hash, section_hash, store_section_contents
+from app.models import Page as PageModel
+from app.models import PageSection as PageSectionModel
+from app.models import Tag as TagModel
+from app.models.page_tag import page_tags
+from app.schemas import PageSectionCreate, PageUpdate
+
+# Page saves seen, and those answered without writing as no-op saves
+save_stats = {"saves": 0, "suppressed": 0}
+
+
+def sections_to_text(sections: list[PageSectionCreate]) -> str:
+    """Build a plain-text fallback string from structured sections."""
+    parts: list[str] = []
+    for section in sections:
+        if section.section_type == "paragraph":
+            if section.header:
+                parts.append(section.header)
+            if section.text:
+                parts.append(section.text)
+        elif section.section_type in {"info", "warning", "error"}:
+            if section.text:
+                parts.append(section.text)
+        elif section.section_type == "snippet":
+            if section.caption:
+                parts.append(section.caption)
+            if section.code:
+                parts.append(section.code)
+        elif section.section_type == "picture":
+            desc = section.caption or section.media_url or ""
+            if desc:
+                parts.append(desc)
+    return "\n\n".join(parts).strip()
+
+
+def build_sections_for_page(page: PageModel, sections: list[PageSectionCreate]) -> None:
+    """Replace the page's sections with the provided collection, whose bodies are already stored."""
+    page.sections = [
+        PageSectionModel(position=section.position, content_hash=section_hash(section))
+        for section in sorted(sections, key=lambda s: s.position)
+    ]
+
+
+async def sync_sections_for_page(
+    db: AsyncSession, page: PageModel, sections: list[PageSectionCreate]
+) -> None:
+    """
+    Bring the page's loaded sections in line with the provided collection.
+
+    Sections carrying an id are matched to that row wherever it moved; those
+    without one reuse the unclaimed row at the same position, if any, and are
+    inserted otherwise. Unchanged rows (same content hash) are left alone,
+    changed rows are repointed at their new body (which must already be
+    stored), and rows nobody claimed are deleted.
+    """
+    positions = [section.position for section in sections]
+    if len(set(positions)) != len(positions):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Section positions must be unique"
+        )
+
+    ids = [section.id for section in sections if section.id is not None]
+    if len(set(ids)) != len(ids):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Section ids must be unique"
+        )
+
+    by_id = {section.id: section for section in page.sections}
+    unknown = set(ids) - by_id.keys()
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Sections {sorted(unknown)} do not belong to page {page.id}"
+        )
+
+    claimed_ids = set(ids)
+    by_position = {
+        section.position: section for section in page.sections if section.id not in claimed_ids
+    }
+    matches = [
+        (
+            incoming,
+            by_id[incoming.id] if incoming.id is not None else by_position.get(incoming.position),
+        )
+        for incoming in sorted(sections, key=lambda s: s.position)
+    ]
+
+    kept = [current for _, current in matches if current is not None]
+    moved = [
+        current
+        for incoming, current in matches
+        if current is not None and current.position != incoming.position
+    ]
+    if moved or len(kept) != len(page.sections):
+        # Positions are unique per page and a flush writes inserts and updates
+        # before deletes, so first drop unclaimed rows (via delete-orphan) and
+        # park moved rows on negative positions
+        page.sections = kept
+        for offset, current in enumerate(moved, start=1):
+            current.position = -offset
+        await db.flush()
+
+    synced: list[PageSectionModel] = []
+    for incoming, current in matches:
+        digest = section_hash(incoming)
+        if current is None:
+            synced.append(PageSectionModel(position=incoming.position, content_hash=digest))
+            continue
+
+        current.position = incoming.position
+        if current.content_hash != digest:
+            current.content_hash = digest
+        synced.append(current)
+
+    page.sections = synced
+
+
+# PageUpdate fields is_noop_save knows how to compare with the stored page
+NOOP_COMPARED_FIELDS = {
+    "title", "content", "sections", "tag_ids", "is_deleted", "updated_by", "expected_version",
+}
+
+
+async def is_noop_save(
+    db: AsyncSession,
+    page_id: int,
+    page_in: PageUpdate,
+    update_data: dict,
+    expected_version: int | None,
+) -> bool:
+    """
+    Tell whether a PATCH would leave the page exactly as it is stored.
+
+    Compares the payload's content hash (title, content, section positions
+    and bodies) with the page's in one read-only query; anything that cannot
+    be decided that way, including any field the comparison does not cover,
+    counts as a change.
+    """
+    if page_in.model_fields_set - NOOP_COMPARED_FIELDS:
+        return False
+
+    columns = [
+        PageModel.title, PageModel.content_hash, PageModel.is_deleted,
+        PageModel.updated_by, PageModel.version,
+    ]
+    if page_in.tag_ids is not None:
+        columns.append(
+            select(func.array_agg(page_tags.c.tag_id))
+            .where(page_tags.c.page_id == PageModel.id)
+            .scalar_subquery()
+            .label("tag_ids")
+        )
+    if page_in.sections is None and update_data.get("content") is not None:
+        for column, label in (
+            (PageSectionModel.position, "section_positions"),
+            (PageSectionModel.content_hash, "section_hashes"),
+        ):
+            columns.append(
+                select(func.array_agg(aggregate_order_by(column, PageSectionModel.position)))
+                .where(PageSectionModel.page_id == PageModel.id)
+                .scalar_subquery()
+                .label(label)
+            )
+
+    result = await db.execute(select(*columns).where(PageModel.id == page_id))
+    stored = result.one_or_none()
+
+    if stored is None or (expected_version is not None and expected_version != stored.version):
+        return False
+    if update_data.get("is_deleted") not in (None, stored.is_deleted):
+        return False
+    if update_data.get("updated_by") not in (None, stored.updated_by):
+        return False
+    if page_in.tag_ids is not None and set(page_in.tag_ids) != set(stored.tag_ids or []):
+        return False
+
+    # Unset or null fields keep their stored values, as in save_page
+    title = update_data.get("title") or stored.title
+    if page_in.sections is not None:
+        ordered = sorted(page_in.sections, key=lambda section: section.position)
+        sections = [(section.position, section_hash(section)) for section in ordered]
+        if "content" in update_data:
+            content = update_data["content"]
+        else:
+            content = sections_to_text(page_in.sections)
+    elif update_data.get("content") is not None:
+        sections = list(zip(stored.section_positions or [], stored.section_hashes or []))
+        content = update_data["content"]
+    else:
+        return title == stored.title
+
+    if content is None or stored.content_hash is None:
+        return False
+
+    return page_content_hash(title, content, sections) == stored.content_hash
+
+
+async def claim_page_version(
+    db: AsyncSession,
+    page_id: int,
+    expected_version: int | None = None,
+    new_revision: bool = False,
+) -> Row:
+    """
+    Check the expected version and claim the next version (and, for a new
+    revision, the next revision number) in one conditional UPDATE.
+
+    Its row lock serializes concurrent writes to the page until commit.
+    Raises 404 for a missing page and 409 with the current version when the
+    page has moved past expected_version.
+    """
+    claim = update(PageModel).where(PageModel.id == page_id)
+    if expected_version is not None:
+        claim = claim.where(PageModel.version == expected_version)
+
+    values = {"version": PageModel.version + 1}
+    if new_revision:
+        values["current_revision"] = PageModel.current_revision + 1
+
+    result = await db.execute(
+        claim.values(**values)
+        .returning(PageModel.version, PageModel.current_revision)
+        .execution_options(synchronize_session=False)
+    )
+    claimed = result.one_or_none()
+
+    if claimed is None:
+        result = await db.execute(select(PageModel.version).where(PageModel.id == page_id))
+        current_version = result.scalar_one_or_none()
+
+        if current_version is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Page with id {page_id} not found"
+            )
+
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail={
+                "message": "Page has been modified since the expected version",
+                "expected_version": expected_version,
+                "current_version": current_version,
+            },
+        )
+
+    return claimed
+
+
+async def load_page(db: AsyncSession, page_id: int) -> PageModel:
+    """
+    Load a page with sections and tags for a response, avoiding lazy IO.
+
+    populate_existing refreshes the server-side timestamps of rows written
+    earlier in the same session.
+    """
+    result = await db.execute(
+        select(PageModel)
+        .options(selectinload(PageModel.sections), selectinload(PageModel.tags))
+        .where(PageModel.id == page_id)
+        .execution_options(populate_existing=True)
+    )
+    return result.scalar_one()
+
+
+async def record_section_edit(
+    db: AsyncSession,
+    page_id: int,
+    revision_number: int,
+    editor_id: int | None = None,
+) -> None:
+    """
+    Bring a page up to date after one of its sections was inserted, edited,
+    moved or deleted, under a version claimed with claim_page_version.
+
+    The text content is rebuilt from the sections in order and the content
+    hash refreshed, and the result is recorded as revision_number, as
+    save_page would for a full save. The edit is attributed to editor_id, or
+    to the page's last editor when the client did not name one.
+    """
+    # Write the pending section changes first; populate_existing would
+    # otherwise overwrite them with the stored state
+    await db.flush()
+    page = await load_page(db, page_id)
+
+    ordered_sections = sorted(page.sections, key=lambda section: section.position)
+    page.content = sections_to_text(ordered_sections)
+    if editor_id is not None:
+        page.updated_by = editor_id
+    page.content_hash = page_content_hash(
+        page.title,
+        page.content,
+        [(section.position, section.content_hash) for section in ordered_sections],
+    )
+
+    revision = await build_revision(
+        db,
+        page_id=page.id,
+        revision_number=revision_number,
+        title=page.title,
+        content=page.content,
+        editor_id=page.updated_by or page.created_by,
+        section_hashes=[section.content_hash for section in ordered_sections],
+    )
+    db.add(revision)
+    await db.flush()
+
+
+async def save_page(db: AsyncSession, page_id: int, page_in: PageUpdate) -> bool:
+    """
+    Apply a PageUpdate to a page and record a revision if its content changed.
+
+    Honours page_in.expected_version (409 on mismatch). Returns False, having
+    written nothing, when the save would leave the page as it is stored.
+    """
+    update_data = page_in.model_dump(
+        exclude_unset=True, exclude={"tag_ids", "sections", "expected_version"}
+    )
+    save_stats["saves"] += 1
+
+    # Autosaves often resend exactly what is stored; answer those without writing
+    if await is_noop_save(db, page_id, page_in, update_data, page_in.expected_version):
+        save_stats["suppressed"] += 1
+        return False
+
+    # Title, content or sections changing means a new revision
+    content_changed = (
+        page_in.sections is not None or "title" in update_data or "content" in update_data
+    )
+    create_revision = bool(content_changed and page_in.updated_by)
+    claimed = await claim_page_version(db, page_id, page_in.expected_version, create_revision)
+
+    # Load the page only now, under the row lock, so sections are diffed
+    # against the state this edit will actually replace
+    result = await db.execute(
+        select(PageModel)
+        .options(
+            selectinload(PageModel.sections),
+            selectinload(PageModel.tags),
+        )
+        .where(PageModel.id == page_id)
+    )
+    page = result.scalar_one()
+
+    # Update tags if provided
+    if page_in.tag_ids is not None:
+        result = await db.execute(
+            select(TagModel).where(TagModel.id.in_(page_in.tag_ids))
+        )
+        tags = result.scalars().all()
+        page.tags = list(tags)
+
+    # Sync sections if provided, touching only rows that actually changed
+    if page_in.sections is not None:
+        await store_section_contents(db, page_in.sections)
+        await sync_sections_for_page(db, page, page_in.sections)
+        # If caller didn't set content explicitly, derive a fallback for revisions
+        if "content" not in update_data:
+            update_data["content"] = sections_to_text(page_in.sections)
+
+    for field, value in update_data.items():
+        setattr(page, field, value if value is not None else getattr(page, field))
+
+    ordered_sections = sorted(page.sections, key=lambda section: section.position)
+    section_hashes = [section.content_hash for section in ordered_sections]
+    page.content_hash = page_content_hash(
+        page.title,
+        page.content,
+        [(section.position, section.content_hash) for section in ordered_sections],
+    )
+
+    # Create new revision if content changed, numbered by the claim above
+    if create_revision:
+        revision = await build_revision(
+            db,
+            page_id=page.id,
+            revision_number=claimed.current_revision,
+            title=page.title,
+            content=page.content,
+            editor_id=page_in.updated_by,
+            section_hashes=section_hashes,
+        )
+        db.add(revision)
+
+    await db.flush()
+    return True
@@ -0,0 +1,37 @@
+import base64
+import json
+from typing import Any
+
+from fastapi import HTTPException, status
+
+# Response header carrying the cursor for the next page of a keyset-paginated listing
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(values: dict[str, Any]) -> str:
+    """Encode keyset values into an opaque, URL-safe cursor token."""
+    raw = json.dumps(values, separators=(",", ":"), default=str).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, fields: dict[str, type]) -> dict[str, Any]:
+    """Decode a cursor token and check it carries the expected typed fields."""
+    invalid_cursor = HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Invalid pagination cursor",
+    )
+
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError):
+        raise invalid_cursor
+
+    if not isinstance(values, dict):
+        raise invalid_cursor
+
+    for key, expected_type in fields.items():
+        if not isinstance(values.get(key), expected_type):
+            raise invalid_cursor
+
+    return values
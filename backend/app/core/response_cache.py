@@ -0,0 +1,180 @@
+import time
+from typing import Any, Protocol
+
+from app.core.cache import LRUCache
+from app.core.config import settings
+
+
+class ResponseCacheBackend(Protocol):
+    """Storage for serialized responses, keyed by resource and tagged with a version."""
+
+    def get(self, key: str, version: str) -> bytes | None:
+        """Return the cached body if it was stored for exactly this version."""
+        ...
+
+    def set(self, key: str, version: str, body: bytes) -> None:
+        """Store the body for this version, replacing any other version."""
+        ...
+
+    def invalidate(self, key: str) -> None:
+        """Drop whatever is cached for key."""
+        ...
+
+    def stats(self) -> dict[str, Any]:
+        """Return hit/miss/eviction counters."""
+        ...
+
+
+class MemoryResponseCache:
+    """In-process backend: an LRU bounded by total body bytes, with a per-entry TTL."""
+
+    def __init__(self, max_bytes: int, ttl: float | None = None, max_entries: int = 100_000):
+        self._cache = LRUCache(
+            maxsize=max_entries,
+            ttl=ttl,
+            maxweight=max_bytes,
+            weigh=lambda entry: len(entry[1]),
+        )
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, key: str, version: str) -> bytes | None:
+        entry = self._cache.get(key)
+        if entry is not None and entry[0] == version:
+            self.hits += 1
+            return entry[1]
+
+        # Absent, expired, or cached for an older version of the resource
+        self.misses += 1
+        return None
+
+    def set(self, key: str, version: str, body: bytes) -> None:
+        self._cache.set(key, (version, body))
+
+    def invalidate(self, key: str) -> None:
+        self._cache.delete(key)
+        self.invalidations += 1
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "backend": "memory",
+            "entries": len(self._cache),
+            "bytes": self._cache.weight,
+            "max_bytes": self._cache.maxweight,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self._cache.evictions,
+            "invalidations": self.invalidations,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+class KeyValueStore(Protocol):
+    """Minimal client interface of a shared key-value store (a subset of redis-py)."""
+
+    def get(self, name: str) -> bytes | None:
+        ...
+
+    def set(self, name: str, value: bytes, ex: int | None = None) -> Any:
+        ...
+
+    def delete(self, *names: str) -> Any:
+        ...
+
+
+class LocalKeyValueStore:
+    """Single-process stand-in for a shared store, for development and tests."""
+
+    def __init__(self):
+        self._data: dict[str, tuple[float | None, bytes]] = {}
+
+    def get(self, name: str) -> bytes | None:
+        entry = self._data.get(name)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._data[name]
+            return None
+
+        return value
+
+    def set(self, name: str, value: bytes, ex: int | None = None) -> None:
+        expires_at = time.monotonic() + ex if ex is not None else None
+        self._data[name] = (expires_at, value)
+
+    def delete(self, *names: str) -> None:
+        for name in names:
+            self._data.pop(name, None)
+
+
+class SharedStoreResponseCache:
+    """
+    Backend on top of a shared key-value store, so several workers share entries.
+
+    Eviction and size bounds are left to the store; entries carry the TTL.
+    """
+
+    def __init__(
+        self, store: KeyValueStore, ttl: int | None = None, namespace: str = "wikitack:response:"
+    ):
+        self._store = store
+        self._ttl = ttl
+        self._namespace = namespace
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, key: str, version: str) -> bytes | None:
+        raw = self._store.get(self._namespace + key)
+        if raw is not None:
+            cached_version, _, body = raw.partition(b"\n")
+            if cached_version.decode() == version:
+                self.hits += 1
+                return body
+
+        self.misses += 1
+        return None
+
+    def set(self, key: str, version: str, body: bytes) -> None:
+        self._store.set(self._namespace + key, version.encode() + b"\n" + body, ex=self._ttl)
+
+    def invalidate(self, key: str) -> None:
+        self._store.delete(self._namespace + key)
+        self.invalidations += 1
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "backend": "shared",
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+def build_response_cache() -> ResponseCacheBackend:
+    """Create the response cache backend selected in settings."""
+    if settings.RESPONSE_CACHE_BACKEND == "shared":
+        return SharedStoreResponseCache(
+            LocalKeyValueStore(),
+            ttl=settings.RESPONSE_CACHE_TTL_SECONDS,
+        )
+
+    return MemoryResponseCache(
+        max_bytes=settings.RESPONSE_CACHE_MAX_BYTES,
+        ttl=settings.RESPONSE_CACHE_TTL_SECONDS,
+    )
+
+
+# Serialized PageWithDetails bodies, keyed by "page:<id>" and versioned by ETag
+page_response_cache = build_response_cache()
+
+
+def page_cache_key(page_id: int) -> str:
+    """Cache key of a page's detail response."""
+    return f"page:{page_id}"
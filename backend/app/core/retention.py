@@ -0,0 +1,43 @@
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+
+from app.models import RevisionRetentionPolicy
+
+
+def revisions_to_keep(
+    revisions: Sequence[tuple[int, datetime]],
+    policy: RevisionRetentionPolicy,
+    now: datetime,
+) -> set[int]:
+    """
+    Apply a retention policy to one page's (revision_number, created_at) pairs.
+
+    Returns the revision numbers to keep. Within each hour or day bucket the
+    newest revision survives, and the page's latest revision is always kept.
+    """
+    keep_all_until = now - timedelta(days=policy.keep_all_days)
+    hourly_until = keep_all_until - timedelta(days=policy.hourly_days)
+    daily_until = hourly_until - timedelta(days=policy.daily_days)
+
+    kept: set[int] = set()
+    buckets: set[tuple[str, datetime]] = set()
+    tail_kept = 0
+
+    for number, created_at in sorted(revisions, key=lambda revision: revision[0], reverse=True):
+        if not kept or created_at >= keep_all_until:
+            kept.add(number)
+        elif created_at >= hourly_until:
+            bucket = ("hour", created_at.replace(minute=0, second=0, microsecond=0))
+            if bucket not in buckets:
+                buckets.add(bucket)
+                kept.add(number)
+        elif created_at >= daily_until:
+            bucket = ("day", created_at.replace(hour=0, minute=0, second=0, microsecond=0))
+            if bucket not in buckets:
+                buckets.add(bucket)
+                kept.add(number)
+        elif tail_kept < policy.keep_last:
+            tail_kept += 1
+            kept.add(number)
+
+    return kept
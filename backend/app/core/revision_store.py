@@ -0,0 +1,214 @@
+"""
+Delta-compressed revision storage.
+
+Revisions are stored as line-level deltas against the previous revision, with
+a full keyframe every REVISION_KEYFRAME_INTERVAL revisions (or whenever a
+delta would not be smaller than the text itself). Reading a revision replays
+the deltas since the nearest keyframe, which is one range scan over the
+(page_id, revision_number) index.
+"""
+
+import difflib
+import hashlib
+import json
+from collections.abc import Sequence
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.core.config import settings
+from app.models import Revision as RevisionModel
+
+
+def make_delta(old: str, new: str) -> str:
+    """
+    Encode `new` as line operations against `old`.
+
+    Ops are ["=", n] (keep n lines), ["-", n] (drop n lines) and
+    ["+", [lines]] (insert lines), serialized as compact JSON.
+    """
+    old_lines = old.splitlines(keepends=True)
+    new_lines = new.splitlines(keepends=True)
+    ops: list[list] = []
+
+    matcher = difflib.SequenceMatcher(a=old_lines, b=new_lines, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            ops.append(["=", i2 - i1])
+            continue
+        if i2 > i1:
+            ops.append(["-", i2 - i1])
+        if j2 > j1:
+            ops.append(["+", new_lines[j1:j2]])
+
+    return json.dumps(ops, separators=(",", ":"))
+
+
+def apply_delta(old: str, delta: str) -> str:
+    """Rebuild the text a delta was made for from the text it was made against."""
+    old_lines = old.splitlines(keepends=True)
+    new_lines: list[str] = []
+    cursor = 0
+
+    for op, arg in json.loads(delta):
+        if op == "=":
+            new_lines.extend(old_lines[cursor:cursor + arg])
+            cursor += arg
+        elif op == "-":
+            cursor += arg
+        else:
+            new_lines.extend(arg)
+
+    return "".join(new_lines)
+
+
+def content_digest(content: str) -> tuple[int, str]:
+    """Return the UTF-8 size and sha256 hex digest of a revision's full content."""
+    raw = content.encode()
+    return len(raw), hashlib.sha256(raw).hexdigest()
+
+
+def layout_chain(
+    contents: Sequence[str],
+    previous: str | None = None,
+    since_keyframe: int = 0,
+) -> list[tuple[bool, str | None, str | None]]:
+    """
+    Lay out successive contents of a page as (is_keyframe, content, delta) rows.
+
+    Follows the same rules as build_revision, for rewriting whole histories.
+    To continue a chain laid out earlier, pass the content of its last row as
+    `previous` and the number of delta rows since its last keyframe.
+    """
+    rows: list[tuple[bool, str | None, str | None]] = []
+
+    for content in contents:
+        since_keyframe += 1
+        if previous is not None and since_keyframe < settings.REVISION_KEYFRAME_INTERVAL:
+            delta = make_delta(previous, content)
+            if len(delta) < len(content):
+                rows.append((False, None, delta))
+                previous = content
+                continue
+        rows.append((True, content, None))
+        since_keyframe = 0
+        previous = content
+
+    return rows
+
+
+def _chain_query(page_id: int, from_number: int, to_number: int):
+    """Select the rows needed to rebuild revisions from_number..to_number of a page."""
+    keyframe = (
+        select(func.max(RevisionModel.revision_number))
+        .where(
+            RevisionModel.page_id == page_id,
+            RevisionModel.is_keyframe.is_(True),
+            RevisionModel.revision_number <= from_number,
+        )
+        .scalar_subquery()
+    )
+    return (
+        select(
+            RevisionModel.revision_number,
+            RevisionModel.is_keyframe,
+            RevisionModel.content,
+            RevisionModel.delta,
+        )
+        .where(
+            RevisionModel.page_id == page_id,
+            RevisionModel.revision_number >= keyframe,
+            RevisionModel.revision_number <= to_number,
+        )
+        .order_by(RevisionModel.revision_number)
+    )
+
+
+def replay_chain(rows: Sequence) -> dict[int, str]:
+    """Replay (revision_number, is_keyframe, content, delta) rows in order."""
+    contents: dict[int, str] = {}
+    current = ""
+
+    for revision_number, is_keyframe, content, delta in rows:
+        current = content if is_keyframe else apply_delta(current, delta)
+        contents[revision_number] = current
+
+    return contents
+
+
+async def load_revision_contents(
+    db: AsyncSession,
+    page_id: int,
+    from_number: int,
+    to_number: int,
+) -> dict[int, str]:
+    """Rebuild the content of every stored revision in from_number..to_number."""
+    result = await db.execute(_chain_query(page_id, from_number, to_number))
+    return replay_chain(result.all())
+
+
+async def load_revision_content(db: AsyncSession, page_id: int, revision_number: int) -> str | None:
+    """Rebuild the content of one revision, or None if it does not exist."""
+    contents = await load_revision_contents(db, page_id, revision_number, revision_number)
+    return contents.get(revision_number)
+
+
+async def hydrate_revision_contents(db: AsyncSession, revisions: Sequence[RevisionModel]) -> None:
+    """
+    Fill in `content` on delta revisions of one page, without marking them dirty.
+
+    All requested revisions are rebuilt from a single chain query.
+    """
+    pending = [revision for revision in revisions if not revision.is_keyframe]
+    if not pending:
+        return
+
+    numbers = [revision.revision_number for revision in pending]
+    contents = await load_revision_contents(db, pending[0].page_id, min(numbers), max(numbers))
+
+    for revision in pending:
+        set_committed_value(revision, "content", contents[revision.revision_number])
+
+
+async def build_revision(
+    db: AsyncSession,
+    page_id: int,
+    revision_number: int,
+    title: str,
+    content: str,
+    editor_id: int,
+    section_hashes: list[str] | None = None,
+) -> RevisionModel:
+    """
+    Create a revision stored as a delta, or as a keyframe when one is due.
+
+    section_hashes snapshots the page's sections as section_contents hashes.
+    """
+    content_size, content_hash = content_digest(content)
+    revision = RevisionModel(
+        page_id=page_id,
+        revision_number=revision_number,
+        title=title,
+        editor_id=editor_id,
+        content_size=content_size,
+        content_hash=content_hash,
+        section_hashes=section_hashes,
+    )
+
+    rows = []
+    if revision_number > 1:
+        result = await db.execute(_chain_query(page_id, revision_number - 1, revision_number - 1))
+        rows = result.all()
+
+    if rows and len(rows) < settings.REVISION_KEYFRAME_INTERVAL:
+        previous = replay_chain(rows)[rows[-1][0]]
+        delta = make_delta(previous, content)
+        if len(delta) < len(content):
+            revision.is_keyframe = False
+            revision.delta = delta
+            return revision
+
+    revision.is_keyframe = True
+    revision.content = content
+    return revision
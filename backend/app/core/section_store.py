@@ -0,0 +1,75 @@
+"""
+Content-addressed storage of section bodies.
+
+Every distinct section body is stored once in section_contents under the
+sha256 of its content fields. Page sections point at their body's hash and
+revisions snapshot a page's structure as an ordered list of hashes, so
+unchanged sections cost nothing across revisions. Bodies that nothing
+references any more are deleted by the compactor (app.db.compact_revisions).
+"""
+
+import hashlib
+import json
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import SectionContent as SectionContentModel
+from app.models.page_section import SECTION_CONTENT_FIELDS
+
+
+def section_hash(section: Any) -> str:
+    """Hash the content fields of a section, independent of its position."""
+    payload = json.dumps([getattr(section, field) for field in SECTION_CONTENT_FIELDS])
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def page_content_hash(title: str, content: str, sections: Sequence[tuple[int, str]]) -> str:
+    """
+    Hash everything a save can change about a page's content, to spot no-op saves.
+
+    `sections` are (position, section hash) pairs in position order, so moving
+    a section changes the hash as much as editing it.
+    """
+    payload = json.dumps([title, content, [list(section) for section in sections]])
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+async def store_section_contents(db: AsyncSession, sections: Sequence[Any]) -> list[str]:
+    """
+    Make sure each section's body is in the store and return their hashes in order.
+
+    Bodies already stored (by this or any other page or revision) are skipped
+    by the primary key, in a single INSERT ... ON CONFLICT DO NOTHING.
+    """
+    hashes = [section_hash(section) for section in sections]
+    rows = {
+        digest: {
+            "hash": digest,
+            **{field: getattr(section, field) for field in SECTION_CONTENT_FIELDS},
+        }
+        for digest, section in zip(hashes, sections)
+    }
+
+    if rows:
+        await db.execute(
+            insert(SectionContentModel)
+            .values(list(rows.values()))
+            .on_conflict_do_nothing(index_elements=[SectionContentModel.hash])
+        )
+
+    return hashes
+
+
+async def load_section_contents(
+    db: AsyncSession, hashes: Sequence[str]
+) -> list[SectionContentModel]:
+    """Load the bodies for a list of hashes, in list order (repeats included)."""
+    result = await db.execute(
+        select(SectionContentModel).where(SectionContentModel.hash.in_(set(hashes)))
+    )
+    by_hash = {content.hash: content for content in result.scalars().all()}
+    return [by_hash[digest] for digest in hashes]
@@ -1,22 +1,98 @@
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any
+from typing import Any, TypeVar
+
+import bcrypt
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 
 from app.core.config import settings
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+T = TypeVar("T")
+
+# bcrypt only ever reads the first 72 bytes of a password; bcrypt 5 raises on
+# longer input instead of ignoring the rest, so cut it to match existing hashes
+BCRYPT_MAX_PASSWORD_BYTES = 72
+
+# bcrypt costs 100+ ms of CPU per call, so it runs on a small dedicated pool
+# instead of the event loop; the worker count caps concurrent hashes
+_password_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    thread_name_prefix="password-hash",
+)
+
+
+class PasswordHashStats:
+    """Process-wide counters for the password hashing pool: queue wait and run time."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.queue_wait_seconds = 0.0
+        self.max_queue_wait_seconds = 0.0
+        self.run_seconds = 0.0
+
+    def record(self, queue_wait: float, run: float) -> None:
+        with self._lock:
+            self.calls += 1
+            self.queue_wait_seconds += queue_wait
+            self.max_queue_wait_seconds = max(self.max_queue_wait_seconds, queue_wait)
+            self.run_seconds += run
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "workers": settings.PASSWORD_HASH_WORKERS,
+            "calls": self.calls,
+            "queue_wait_ms_avg": 1000 * self.queue_wait_seconds / self.calls if self.calls else 0.0,
+            "queue_wait_ms_max": 1000 * self.max_queue_wait_seconds,
+            "run_ms_avg": 1000 * self.run_seconds / self.calls if self.calls else 0.0,
+        }
+
+
+password_hash_stats = PasswordHashStats()
+
+
+def hash_password_blocking(password: str) -> str:
+    """Hash a password with bcrypt on the calling thread."""
+    secret = password.encode()[:BCRYPT_MAX_PASSWORD_BYTES]
+    return bcrypt.hashpw(secret, bcrypt.gensalt()).decode()
+
+
+def check_password_blocking(plain_password: str, hashed_password: str) -> bool:
+    """Check a password against a bcrypt hash on the calling thread; other values never match."""
+    secret = plain_password.encode()[:BCRYPT_MAX_PASSWORD_BYTES]
+    try:
+        return bcrypt.checkpw(secret, hashed_password.encode())
+    except ValueError:
+        # Not a bcrypt hash, e.g. a placeholder stored before hashing was wired in
+        return False
+
+
+async def _run_in_password_pool(func: Callable[..., T], *args: Any) -> T:
+    """Run a blocking hash function on the password pool, recording how long it queued."""
+    submitted = time.perf_counter()
+
+    def timed() -> T:
+        started = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            password_hash_stats.record(started - submitted, time.perf_counter() - started)
+
+    return await asyncio.get_running_loop().run_in_executor(_password_executor, timed)
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against a hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against a hash without blocking the event loop."""
+    return await _run_in_password_pool(check_password_blocking, plain_password, hashed_password)
 
 
-def get_password_hash(password: str) -> str:
-    """Hash a password."""
-    return pwd_context.hash(password)
+async def get_password_hash(password: str) -> str:
+    """Hash a password without blocking the event loop."""
+    return await _run_in_password_pool(hash_password_blocking, password)
 
 
 def create_access_token(data: dict[str, Any], expires_delta: timedelta | None = None) -> str:
@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+"""
+Revision Compaction Job
+
+Thins page histories according to each workspace's revision retention
+policy. Dropped revisions are deleted and the surviving ones are re-encoded
+so their delta chains stay intact. A page is compacted one window of
+revisions at a time, each in its own short transaction holding the same page
+row lock an edit takes, so a long history never blocks edits to its page for
+more than one window, and edits to other pages never wait on the job.
+
+Afterwards, section bodies that no page section or revision snapshot
+references any more are deleted from section_contents, in batches.
+
+Usage (from the backend directory):
+    python -m app.db.compact_revisions [--workspace-id 1] [--batch-size 100]
+        [--window-size 100] [--pause 0.05] [--dry-run]
+"""
+
+import argparse
+import asyncio
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import delete, exists, func, select, text, update
+from sqlalchemy.dialects.postgresql import array
+from sqlalchemy.engine import Row
+from sqlalchemy.exc import DBAPIError
+
+from app.core.retention import revisions_to_keep
+from app.core.revision_store import layout_chain, load_revision_content, replay_chain
+from app.db.session import AsyncSessionLocal, engine
+from app.models import Page as PageModel
+from app.models import PageSection as PageSectionModel
+from app.models import Revision as RevisionModel
+from app.models import RevisionRetentionPolicy
+from app.models import SectionContent as SectionContentModel
+from app.models import Space as SpaceModel
+
+# How long a garbage collection batch waits for in-flight section writes
+# before skipping the batch, so queued edits are never stuck behind it
+SECTION_GC_LOCK_TIMEOUT = "2s"
+
+# Revisions rewritten per transaction; a window always ends just before a
+# stored keyframe, so it may run past this by up to one keyframe interval
+WINDOW_SIZE = 100
+
+
+class CompactionReport:
+    """Totals for one compaction run."""
+
+    def __init__(self):
+        self.pages_scanned = 0
+        self.pages_compacted = 0
+        self.rows_deleted = 0
+        self.rows_rewritten = 0
+        self.bytes_reclaimed = 0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.pages_scanned:,} pages scanned, {self.pages_compacted:,} compacted, "
+            f"{self.rows_deleted:,} revisions deleted, {self.rows_rewritten:,} re-encoded, "
+            f"{self.bytes_reclaimed:,} bytes reclaimed"
+        )
+
+
+def _stored_bytes():
+    """Bytes a revision row spends on content and delta, as stored."""
+    return (
+        func.coalesce(func.octet_length(RevisionModel.content), 0)
+        + func.coalesce(func.octet_length(RevisionModel.delta), 0)
+    )
+
+
+def plan_windows(rows: Sequence[Row], window_size: int) -> list[tuple[int, int]]:
+    """
+    Split a page's history into (first, last) index ranges of at least window_size rows.
+
+    Every window but the first starts at a stored keyframe, so rewriting one
+    window never breaks the chain of the windows after it.
+    """
+    windows: list[tuple[int, int]] = []
+    start = 0
+
+    for index in range(1, len(rows) + 1):
+        at_keyframe = index == len(rows) or rows[index].is_keyframe
+        if at_keyframe and index - start >= window_size:
+            windows.append((start, index - 1))
+            start = index
+
+    if start < len(rows):
+        windows.append((start, len(rows) - 1))
+    return windows
+
+
+def rewrite_window(
+    stored: Sequence,
+    keep: set[int],
+    previous: str | None,
+    since_keyframe: int,
+) -> tuple[list[dict], list[int], str | None, int]:
+    """
+    Work out the writes that compact one window of a page's history.
+
+    `stored` holds the window's (id, revision_number, is_keyframe, content,
+    delta) rows, starting at a keyframe; `previous` and `since_keyframe`
+    describe the chain before it, as for layout_chain. Returns the row
+    updates, the ids to delete, and the chain state to hand the next window.
+    """
+    contents = replay_chain(
+        [(row.revision_number, row.is_keyframe, row.content, row.delta) for row in stored]
+    )
+    survivors = [row for row in stored if row.revision_number in keep]
+    layout = layout_chain(
+        [contents[row.revision_number] for row in survivors], previous, since_keyframe
+    )
+
+    changes = [
+        {"id": row.id, "is_keyframe": is_keyframe, "content": content, "delta": delta}
+        for row, (is_keyframe, content, delta) in zip(survivors, layout)
+        if (row.is_keyframe, row.content, row.delta) != (is_keyframe, content, delta)
+    ]
+    dropped = [row.id for row in stored if row.revision_number not in keep]
+
+    for is_keyframe, _, _ in layout:
+        since_keyframe = 0 if is_keyframe else since_keyframe + 1
+    if survivors:
+        previous = contents[survivors[-1].revision_number]
+
+    return changes, dropped, previous, since_keyframe
+
+
+async def compact_page(
+    page_id: int,
+    policy: RevisionRetentionPolicy,
+    now: datetime,
+    report: CompactionReport,
+    window_size: int = WINDOW_SIZE,
+    pause: float = 0.0,
+    dry_run: bool = False,
+) -> None:
+    """
+    Apply the policy to one page's history, one window of revisions per transaction.
+
+    The plan is made from revision metadata alone. Each window then locks the
+    page, rebuilds only its own revisions, re-encodes the survivors against
+    the last revision kept before it and commits, so memory and lock time are
+    bounded by the window rather than the history.
+    """
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(
+                RevisionModel.id,
+                RevisionModel.revision_number,
+                RevisionModel.created_at,
+                RevisionModel.is_keyframe,
+                _stored_bytes().label("stored_bytes"),
+            )
+            .where(RevisionModel.page_id == page_id)
+            .order_by(RevisionModel.revision_number)
+        )
+        rows = result.all()
+    report.pages_scanned += 1
+
+    keep = revisions_to_keep([(row.revision_number, row.created_at) for row in rows], policy, now)
+    if len(keep) == len(rows):
+        return
+    report.pages_compacted += 1
+
+    # Windows before the first dropped revision keep their encoding as is
+    first_dropped = next(
+        index for index, row in enumerate(rows) if row.revision_number not in keep
+    )
+    windows = [window for window in plan_windows(rows, window_size) if window[1] >= first_dropped]
+
+    # The chain the rewritten windows continue: the last revision before them
+    # and the number of delta rows stored since its keyframe
+    previous: str | None = None
+    since_keyframe = 0
+    start = windows[0][0]
+    if start:
+        last_keyframe = max(
+            (index for index in range(start) if rows[index].is_keyframe), default=-1
+        )
+        since_keyframe = start - 1 - last_keyframe
+        async with AsyncSessionLocal() as db:
+            previous = await load_revision_content(db, page_id, rows[start - 1].revision_number)
+
+    for first, last in windows:
+        window = rows[first:last + 1]
+        async with AsyncSessionLocal() as db:
+            if not dry_run:
+                result = await db.execute(
+                    select(PageModel.id).where(PageModel.id == page_id).with_for_update()
+                )
+                if result.scalar_one_or_none() is None:
+                    return
+
+            result = await db.execute(
+                select(
+                    RevisionModel.id,
+                    RevisionModel.revision_number,
+                    RevisionModel.is_keyframe,
+                    RevisionModel.content,
+                    RevisionModel.delta,
+                )
+                .where(
+                    RevisionModel.page_id == page_id,
+                    RevisionModel.revision_number.between(
+                        window[0].revision_number, window[-1].revision_number
+                    ),
+                )
+                .order_by(RevisionModel.revision_number)
+            )
+            stored = result.all()
+            if [row.id for row in stored] != [row.id for row in window]:
+                # Rewritten since it was planned; a later run picks the page up again
+                return
+
+            changes, dropped, previous, since_keyframe = rewrite_window(
+                stored, keep, previous, since_keyframe
+            )
+
+            report.rows_deleted += len(dropped)
+            report.rows_rewritten += len(changes)
+            if dry_run:
+                report.bytes_reclaimed += sum(
+                    row.stored_bytes for row in window if row.revision_number not in keep
+                )
+                continue
+
+            if dropped:
+                await db.execute(delete(RevisionModel).where(RevisionModel.id.in_(dropped)))
+            if changes:
+                await db.execute(update(RevisionModel), changes)
+
+            result = await db.execute(
+                select(func.sum(_stored_bytes())).where(
+                    RevisionModel.id.in_([row.id for row in stored if row.id not in dropped])
+                )
+            )
+            stored_after = result.scalar() or 0
+            report.bytes_reclaimed += sum(row.stored_bytes for row in window) - stored_after
+            await db.commit()
+
+        if pause:
+            await asyncio.sleep(pause)
+
+
+async def compact_workspace(
+    policy: RevisionRetentionPolicy,
+    report: CompactionReport,
+    batch_size: int = 100,
+    window_size: int = WINDOW_SIZE,
+    pause: float = 0.0,
+    dry_run: bool = False,
+) -> None:
+    """Compact every page of the policy's workspace that has revisions past the keep-all window."""
+    now = datetime.now(UTC)
+    cutoff = now - timedelta(days=policy.keep_all_days)
+    last_page_id = 0
+
+    while True:
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(PageModel.id)
+                .join(SpaceModel, SpaceModel.id == PageModel.space_id)
+                .where(
+                    SpaceModel.workspace_id == policy.workspace_id,
+                    PageModel.id > last_page_id,
+                    exists().where(
+                        RevisionModel.page_id == PageModel.id,
+                        RevisionModel.created_at < cutoff,
+                    ),
+                )
+                .order_by(PageModel.id)
+                .limit(batch_size)
+            )
+            page_ids = result.scalars().all()
+
+        if not page_ids:
+            return
+
+        for page_id in page_ids:
+            await compact_page(page_id, policy, now, report, window_size, pause, dry_run)
+
+        last_page_id = page_ids[-1]
+
+
+def _unreferenced_section_contents():
+    """Criteria for section bodies that no page section or revision snapshot points at."""
+    return (
+        ~exists().where(PageSectionModel.content_hash == SectionContentModel.hash),
+        ~exists().where(
+            RevisionModel.section_hashes.contains(array([SectionContentModel.hash]))
+        ),
+    )
+
+
+async def collect_section_contents(
+    batch_size: int = 1000,
+    pause: float = 0.0,
+    dry_run: bool = False,
+) -> int:
+    """
+    Delete section bodies nothing references any more; returns how many.
+
+    Bodies are immutable and shared, and edits only ever add new ones, so
+    without this pass section_contents (and its search index) only grows.
+    Candidates are found without locks. Each batch is then deleted, with its
+    references checked again, under a SHARE ROW EXCLUSIVE table lock. That
+    lock waits for every in-flight write that stored a body to commit its
+    references, and holds new ones back for just that one delete.
+    """
+    deleted = 0
+    last_hash = ""
+
+    while True:
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(SectionContentModel.hash)
+                .where(SectionContentModel.hash > last_hash, *_unreferenced_section_contents())
+                .order_by(SectionContentModel.hash)
+                .limit(batch_size)
+            )
+            candidates = result.scalars().all()
+            if not candidates:
+                return deleted
+            last_hash = candidates[-1]
+
+            if dry_run:
+                deleted += len(candidates)
+                continue
+
+            try:
+                await db.execute(text(f"SET LOCAL lock_timeout = '{SECTION_GC_LOCK_TIMEOUT}'"))
+                await db.execute(text("LOCK TABLE section_contents IN SHARE ROW EXCLUSIVE MODE"))
+            except DBAPIError:
+                # Writes kept the table busy; these bodies are collected next run
+                await db.rollback()
+                continue
+
+            result = await db.execute(
+                delete(SectionContentModel)
+                .where(
+                    SectionContentModel.hash.in_(candidates),
+                    *_unreferenced_section_contents(),
+                )
+                .returning(SectionContentModel.hash)
+            )
+            deleted += len(result.all())
+            await db.commit()
+
+        if pause:
+            await asyncio.sleep(pause)
+
+
+async def main(
+    workspace_id: int | None, batch_size: int, window_size: int, pause: float, dry_run: bool
+) -> None:
+    async with AsyncSessionLocal() as db:
+        query = select(RevisionRetentionPolicy).order_by(RevisionRetentionPolicy.workspace_id)
+        if workspace_id is not None:
+            query = query.where(RevisionRetentionPolicy.workspace_id == workspace_id)
+        policies = (await db.execute(query)).scalars().all()
+
+    total = CompactionReport()
+    for policy in policies:
+        report = CompactionReport()
+        await compact_workspace(policy, report, batch_size, window_size, pause, dry_run)
+        print(f"Workspace {policy.workspace_id}: {report}")
+
+        for field in vars(total):
+            setattr(total, field, getattr(total, field) + getattr(report, field))
+
+    print(f"\n{'Would reclaim' if dry_run else 'Total'}: {total}")
+
+    bodies = await collect_section_contents(pause=pause, dry_run=dry_run)
+    print(f"Unreferenced section bodies {'found' if dry_run else 'deleted'}: {bodies:,}")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--workspace-id", type=int, default=None)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument(
+        "--window-size", type=int, default=WINDOW_SIZE, help="revisions rewritten per transaction"
+    )
+    parser.add_argument(
+        "--pause", type=float, default=0.0, help="seconds to sleep between transactions"
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="report what would be removed without writing"
+    )
+    args = parser.parse_args()
+
+    asyncio.run(
+        main(args.workspace_id, args.batch_size, args.window_size, args.pause, args.dry_run)
+    )
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Compressed Column Rewrite Job
+
+Rewrites existing rows of every CompressedText column under the current
+TEXT_COMPRESSION_* settings: compresses plain rows after compression is turned
+on, switches codecs, or (with TEXT_COMPRESSION_CODEC=none) restores plain
+text. Works through each table by primary key in small committed batches, so
+it can run in the background next to the API.
+
+Usage (from the backend directory):
+    TEXT_COMPRESSION_CODEC=zlib python -m app.db.recompress --batch-size 500 --pause 0.1
+"""
+
+import argparse
+import asyncio
+
+from sqlalchemy import Table, Text, bindparam, select, type_coerce, update
+
+from app.db.base import Base
+from app.db.session import AsyncSessionLocal, engine
+from app.db.types import CompressedText, compress_text, compression_stats, decompress_text
+
+
+def compressed_columns() -> list[tuple[Table, str]]:
+    """Return (table, column name) for every CompressedText column in the models."""
+    return [
+        (table, column.name)
+        for table in Base.metadata.sorted_tables
+        for column in table.columns
+        if isinstance(column.type, CompressedText)
+    ]
+
+
+async def rewrite_column(
+    table: Table, column_name: str, batch_size: int, pause: float
+) -> tuple[int, int]:
+    """
+    Re-encode one column batch by batch; returns (rows scanned, rows rewritten).
+
+    Values are read and written as plain Text so the type's own processing
+    does not run twice.
+    """
+    column = table.c[column_name]
+    stored = type_coerce(column, Text)
+    statement = (
+        update(table)
+        .where(table.c.id == bindparam("row_id"))
+        .values({column_name: bindparam("stored", type_=Text)})
+    )
+
+    scanned = rewritten = 0
+    last_id = 0
+    while True:
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(table.c.id, stored)
+                .where(table.c.id > last_id, column.is_not(None))
+                .order_by(table.c.id)
+                .limit(batch_size)
+            )
+            rows = result.all()
+            if not rows:
+                return scanned, rewritten
+
+            changes = []
+            for row_id, value in rows:
+                encoded = compress_text(decompress_text(value))
+                if encoded != value:
+                    changes.append({"row_id": row_id, "stored": encoded})
+
+            if changes:
+                await db.execute(statement, changes)
+                await db.commit()
+
+        scanned += len(rows)
+        rewritten += len(changes)
+        last_id = rows[-1][0]
+        print(
+            f"  {table.name}.{column_name}: {scanned:,} scanned, {rewritten:,} rewritten", end="\r"
+        )
+
+        if pause:
+            await asyncio.sleep(pause)
+
+
+async def main(batch_size: int, pause: float) -> None:
+    for table, column_name in compressed_columns():
+        scanned, rewritten = await rewrite_column(table, column_name, batch_size, pause)
+        print(f"{table.name}.{column_name}: {scanned:,} rows scanned, {rewritten:,} rewritten")
+
+    stats = compression_stats.stats()
+    print(
+        f"\nCodec {stats['codec']}: {stats['raw_bytes']:,} bytes of text stored as "
+        f"{stats['stored_bytes']:,} ({stats['ratio']:.1%}); "
+        f"{stats['write_cpu_ms_avg']:.3f} ms CPU per write, "
+        f"{stats['read_cpu_ms_avg']:.3f} ms per compressed read"
+    )
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--pause", type=float, default=0.0, help="seconds to sleep between batches")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.batch_size, args.pause))
@@ -0,0 +1,131 @@
+import base64
+import lzma
+import time
+import zlib
+from typing import Any
+
+from sqlalchemy import Text
+from sqlalchemy.types import TypeDecorator
+
+from app.core.config import settings
+
+# Stored values that start with this character carry a codec tag; PostgreSQL
+# text cannot hold NUL, and ESC never starts real page or revision content
+COMPRESSION_MARKER = "\x1b"
+
+# Codec tag -> (compress, decompress); "=" marks plain text that happened to
+# start with the marker and was escaped
+CODECS = {
+    "z": (zlib.compress, zlib.decompress),
+    "x": (lzma.compress, lzma.decompress),
+}
+CODEC_TAGS = {"zlib": "z", "lzma": "x"}
+ESCAPED_TAG = "="
+
+
+class CompressionStats:
+    """Process-wide counters for CompressedText: sizes and CPU time per read/write."""
+
+    def __init__(self):
+        self.writes = 0
+        self.compressed_writes = 0
+        self.raw_bytes = 0
+        self.stored_bytes = 0
+        self.write_cpu_seconds = 0.0
+        self.reads = 0
+        self.compressed_reads = 0
+        self.read_cpu_seconds = 0.0
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "codec": settings.TEXT_COMPRESSION_CODEC,
+            "writes": self.writes,
+            "compressed_writes": self.compressed_writes,
+            "raw_bytes": self.raw_bytes,
+            "stored_bytes": self.stored_bytes,
+            "ratio": self.stored_bytes / self.raw_bytes if self.raw_bytes else 1.0,
+            "write_cpu_ms_avg": 1000 * self.write_cpu_seconds / self.writes if self.writes else 0.0,
+            "reads": self.reads,
+            "compressed_reads": self.compressed_reads,
+            "read_cpu_ms_avg": (
+                1000 * self.read_cpu_seconds / self.compressed_reads
+                if self.compressed_reads
+                else 0.0
+            ),
+        }
+
+
+compression_stats = CompressionStats()
+
+
+def compress_text(value: str, codec: str | None = None, min_bytes: int | None = None) -> str:
+    """
+    Encode text for storage under the given (or configured) codec.
+
+    Values below the size threshold, or that do not shrink, are stored as-is.
+    """
+    codec = settings.TEXT_COMPRESSION_CODEC if codec is None else codec
+    min_bytes = settings.TEXT_COMPRESSION_MIN_BYTES if min_bytes is None else min_bytes
+
+    start = time.thread_time()
+    raw = value.encode()
+    stored = None
+
+    tag = CODEC_TAGS.get(codec)
+    if tag is not None and len(raw) >= min_bytes:
+        compress, _ = CODECS[tag]
+        encoded = COMPRESSION_MARKER + tag + base64.b85encode(compress(raw)).decode("ascii")
+        if len(encoded) < len(raw):
+            stored = encoded
+
+    compression_stats.writes += 1
+    compression_stats.raw_bytes += len(raw)
+    if stored is not None:
+        compression_stats.compressed_writes += 1
+    elif value.startswith(COMPRESSION_MARKER):
+        stored = COMPRESSION_MARKER + ESCAPED_TAG + value
+    else:
+        stored = value
+    compression_stats.stored_bytes += len(stored.encode()) if stored is not value else len(raw)
+    compression_stats.write_cpu_seconds += time.thread_time() - start
+
+    return stored
+
+
+def decompress_text(stored: str) -> str:
+    """Decode a value written by compress_text; plain text passes through."""
+    compression_stats.reads += 1
+    if not stored.startswith(COMPRESSION_MARKER):
+        return stored
+
+    tag, payload = stored[1], stored[2:]
+    if tag == ESCAPED_TAG:
+        return payload
+
+    start = time.thread_time()
+    _, decompress = CODECS[tag]
+    value = decompress(base64.b85decode(payload)).decode()
+
+    compression_stats.compressed_reads += 1
+    compression_stats.read_cpu_seconds += time.thread_time() - start
+
+    return value
+
+
+class CompressedText(TypeDecorator):
+    """
+    Text column whose large values are transparently compressed.
+
+    Compression is opt-in through TEXT_COMPRESSION_CODEC; reads always decode,
+    so rows written under any codec (or none) stay readable. Only use this for
+    columns that SQL never reads directly (search vectors, JSON aggregation).
+    """
+
+    impl = Text
+    cache_ok = True
+
+    def process_bind_param(self, value: str | None, dialect) -> str | None:
+        return None if value is None else compress_text(value)
+
+    def process_result_value(self, value: str | None, dialect) -> str | None:
+        return None if value is None else decompress_text(value)
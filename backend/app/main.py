@@ -1,20 +1,34 @@
+import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.api import auth, drafts, pages, revisions, sections, spaces, tags, users, workspaces
 from app.core.config import settings
-from app.db.session import engine
+from app.core.deps import principal_cache
+from app.core.page_store import save_stats
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.core.response_cache import page_response_cache
+from app.core.security import password_hash_stats
+
 # Import all models to register them with SQLAlchemy
-from app.db.base import Base
+from app.db.base import Base  # noqa: F401
+from app.db.session import engine
+from app.db.types import compression_stats
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan context manager for startup and shutdown events."""
     # Startup
+    draft_publisher = None
+    if settings.DRAFT_IDLE_PUBLISH_SECONDS > 0:
+        draft_publisher = asyncio.create_task(drafts.run_draft_publisher())
     yield
     # Shutdown
+    if draft_publisher is not None:
+        draft_publisher.cancel()
     await engine.dispose()
 
 
@@ -31,6 +45,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, "ETag"],
 )
 
 
@@ -50,13 +65,29 @@ async def health():
     return {"status": "healthy"}
 
 
-# API routes
-from app.api import users, workspaces, spaces, pages, revisions, tags, auth
+@app.get("/metrics")
+async def metrics():
+    """In-process cache, compression, password hashing and save counters."""
+    return {
+        "page_response_cache": page_response_cache.stats(),
+        "autocomplete_cache": pages.autocomplete_cache.stats(),
+        "revision_diff_cache": revisions.diff_cache.stats(),
+        "principal_cache": principal_cache.stats(),
+        "password_hashing": password_hash_stats.stats(),
+        "page_saves": save_stats,
+        "text_compression": compression_stats.stats(),
+    }
+
 
+# API routes
 app.include_router(auth.router, prefix=settings.API_V1_PREFIX)
 app.include_router(users.router, prefix=settings.API_V1_PREFIX)
-app.include_router(workspaces.router, prefix=f"{settings.API_V1_PREFIX}/workspaces", tags=["workspaces"])
+app.include_router(
+    workspaces.router, prefix=f"{settings.API_V1_PREFIX}/workspaces", tags=["workspaces"]
+)
 app.include_router(spaces.router, prefix=settings.API_V1_PREFIX)
 app.include_router(pages.router, prefix=settings.API_V1_PREFIX)
+app.include_router(sections.router, prefix=settings.API_V1_PREFIX)
 app.include_router(revisions.router, prefix=settings.API_V1_PREFIX)
+app.include_router(drafts.router, prefix=settings.API_V1_PREFIX)
 app.include_router(tags.router, prefix=settings.API_V1_PREFIX)
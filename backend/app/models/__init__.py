@@ -5,5 +5,12 @@ from app.models.revision import Revision
 from app.models.tag import Tag
 from app.models.page_section import PageSection
 from app.models.page_tag import page_tags
+from app.models.tag_usage import tag_usage
+from app.models.retention_policy import RevisionRetentionPolicy
+from app.models.section_content import SectionContent
+from app.models.page_draft import PageDraft
 
-__all__ = ["User", "Space", "Page", "Revision", "Tag", "PageSection", "page_tags"]
+__all__ = [
+    "User", "Space", "Page", "Revision", "Tag", "PageSection", "page_tags", "tag_usage",
+    "RevisionRetentionPolicy", "SectionContent", "PageDraft",
+]
@@ -4,6 +4,9 @@ from sqlalchemy import DateTime
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 
+# Text search configuration shared by the generated search vectors and queries
+SEARCH_CONFIG = "english"
+
 
 class TimestampMixin:
     """Mixin for created_at and updated_at timestamps."""
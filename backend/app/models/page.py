@@ -1,16 +1,28 @@
-from sqlalchemy import Boolean, ForeignKey, Text, UniqueConstraint
-from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import TYPE_CHECKING
 
+from sqlalchemy import (
+    Boolean,
+    Computed,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+    text,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
 from app.db.session import Base
-from app.models.base import TimestampMixin
+from app.models.base import SEARCH_CONFIG, TimestampMixin
 
 if TYPE_CHECKING:
-    from app.models.user import User
-    from app.models.space import Space
+    from app.models.page_section import PageSection
     from app.models.revision import Revision
+    from app.models.space import Space
     from app.models.tag import Tag
-    from app.models.page_section import PageSection
+    from app.models.user import User
 
 
 class Page(Base, TimestampMixin):
@@ -19,6 +31,23 @@ class Page(Base, TimestampMixin):
     __tablename__ = "pages"
     __table_args__ = (
         UniqueConstraint("space_id", "slug", name="uq_pages_space_slug"),
+        # Keyset pagination order for page listings, with and without a space filter
+        Index("ix_pages_updated_at_id", "updated_at", "id"),
+        Index("ix_pages_space_id_updated_at_id", "space_id", "updated_at", "id"),
+        # Same order restricted to live pages, which is what listings read by default
+        Index(
+            "ix_pages_live_updated_at_id",
+            "updated_at",
+            "id",
+            postgresql_where=text("NOT is_deleted"),
+        ),
+        Index("ix_pages_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_pages_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
@@ -29,6 +58,26 @@ class Page(Base, TimestampMixin):
     created_by: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="RESTRICT"), nullable=False)
     updated_by: Mapped[int | None] = mapped_column(ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
     is_deleted: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    # Latest revision_number, incremented in place so numbering needs no MAX() lookup
+    current_revision: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
+    )
+    # Bumped on every write, for optimistic concurrency checks on edits
+    version: Mapped[int] = mapped_column(Integer, default=1, server_default="1", nullable=False)
+    # Hash of title, content and (position, section hash) pairs, recomputed by every
+    # page and section write; NULL only until a page written before it is saved again
+    content_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    # Maintained by PostgreSQL; deferred so regular page loads never fetch it
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(content, '')), 'B')",
+            persisted=True,
+        ),
+        nullable=True,
+        deferred=True,
+    )
 
     # Relationships
     space: Mapped["Space"] = relationship("Space", back_populates="pages")
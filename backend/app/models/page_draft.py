@@ -0,0 +1,36 @@
+from sqlalchemy import ForeignKey, Index, Integer, Text, UniqueConstraint
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.session import Base
+from app.models.base import TimestampMixin
+
+
+class PageDraft(Base, TimestampMixin):
+    """
+    A user's unpublished edits to a page, overwritten by every autosave.
+
+    Published into the page (and a single revision) on explicit save or once
+    it has been idle for DRAFT_IDLE_PUBLISH_SECONDS. Unset fields keep the
+    page's current value when published.
+    """
+
+    __tablename__ = "page_drafts"
+    __table_args__ = (
+        UniqueConstraint("page_id", "user_id", name="uq_page_drafts_page_user"),
+        # Idle drafts are found oldest first by the background publisher
+        Index("ix_page_drafts_updated_at", "updated_at"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    page_id: Mapped[int] = mapped_column(ForeignKey("pages.id", ondelete="CASCADE"), nullable=False)
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    title: Mapped[str | None] = mapped_column(Text, nullable=True)
+    content: Mapped[str | None] = mapped_column(Text, nullable=True)
+    sections: Mapped[list[dict] | None] = mapped_column(JSONB, nullable=True)
+    # Page version the draft was started from, checked when it is published
+    base_version: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    # Why the last idle publish failed (e.g. a version conflict); cleared by the next autosave
+    publish_error: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -1,16 +1,35 @@
-from sqlalchemy import ForeignKey, Text, UniqueConstraint, String, Integer
-from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import TYPE_CHECKING
 
+from sqlalchemy import ForeignKey, Integer, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
 from app.db.session import Base
 from app.models.base import TimestampMixin
 
 if TYPE_CHECKING:
     from app.models.page import Page
+    from app.models.section_content import SectionContent
+
+# Section fields that make up its content, as opposed to identity and ordering
+SECTION_CONTENT_FIELDS = (
+    "section_type", "header", "text", "media_url", "caption", "code", "language",
+)
+
+
+def _body_field(name: str) -> property:
+    """Read-only view of one content field of a section's stored body."""
+    return property(lambda section: getattr(section.body, name), doc=f"The section body's {name}.")
 
 
 class PageSection(Base, TimestampMixin):
-    """Structured content section belonging to a page."""
+    """
+    Structured content section belonging to a page.
+
+    A section row only places a body on the page: its content lives once in
+    section_contents under content_hash, and the content fields below read
+    through to it. To change a section, store the new body and repoint
+    content_hash.
+    """
 
     __tablename__ = "page_sections"
     __table_args__ = (
@@ -20,13 +39,19 @@ class PageSection(Base, TimestampMixin):
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     page_id: Mapped[int] = mapped_column(ForeignKey("pages.id", ondelete="CASCADE"), nullable=False, index=True)
     position: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
-    section_type: Mapped[str] = mapped_column(String(32), nullable=False)
-    header: Mapped[str | None] = mapped_column(Text, nullable=True)
-    text: Mapped[str | None] = mapped_column(Text, nullable=True)
-    media_url: Mapped[str | None] = mapped_column(Text, nullable=True)
-    caption: Mapped[str | None] = mapped_column(Text, nullable=True)
-    code: Mapped[str | None] = mapped_column(Text, nullable=True)
-    language: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    content_hash: Mapped[str] = mapped_column(
+        ForeignKey("section_contents.hash", ondelete="RESTRICT"), nullable=False, index=True
+    )
 
     # Relationships
     page: Mapped["Page"] = relationship("Page", back_populates="sections")
+    # Joined into every section load, so reading content never lazy-loads
+    body: Mapped["SectionContent"] = relationship("SectionContent", lazy="joined", innerjoin=True)
+
+    section_type = _body_field("section_type")
+    header = _body_field("header")
+    text = _body_field("text")
+    media_url = _body_field("media_url")
+    caption = _body_field("caption")
+    code = _body_field("code")
+    language = _body_field("language")
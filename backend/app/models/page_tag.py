@@ -1,4 +1,4 @@
-from sqlalchemy import ForeignKey, Table, Column, BigInteger
+from sqlalchemy import BigInteger, Column, ForeignKey, Index, Table
 
 from app.db.session import Base
 
@@ -8,4 +8,6 @@ page_tags = Table(
     Base.metadata,
     Column("page_id", BigInteger, ForeignKey("pages.id", ondelete="CASCADE"), primary_key=True),
     Column("tag_id", BigInteger, ForeignKey("tags.id", ondelete="CASCADE"), primary_key=True),
+    # The primary key serves page -> tags; this serves tag -> pages
+    Index("ix_page_tags_tag_id_page_id", "tag_id", "page_id"),
 )
@@ -0,0 +1,27 @@
+from sqlalchemy import ForeignKey, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.session import Base
+from app.models.base import TimestampMixin
+
+
+class RevisionRetentionPolicy(Base, TimestampMixin):
+    """
+    Per-workspace rules for thinning old page revisions.
+
+    Revisions younger than keep_all_days are all kept; over the next
+    hourly_days the newest revision per hour is kept, over the following
+    daily_days the newest per day, and beyond that only the newest keep_last.
+    A page's latest revision is always kept.
+    """
+
+    __tablename__ = "revision_retention_policies"
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    workspace_id: Mapped[int] = mapped_column(
+        ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=False, unique=True
+    )
+    keep_all_days: Mapped[int] = mapped_column(Integer, nullable=False, default=30)
+    hourly_days: Mapped[int] = mapped_column(Integer, nullable=False, default=30)
+    daily_days: Mapped[int] = mapped_column(Integer, nullable=False, default=365)
+    keep_last: Mapped[int] = mapped_column(Integer, nullable=False, default=50)
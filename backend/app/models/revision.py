@@ -1,11 +1,23 @@
-from sqlalchemy import ForeignKey, Integer, Text, UniqueConstraint
-from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime
-from sqlalchemy import DateTime
-from sqlalchemy.sql import func
 from typing import TYPE_CHECKING
 
+from sqlalchemy import (
+    Boolean,
+    CheckConstraint,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.sql import func
+
 from app.db.session import Base
+from app.db.types import CompressedText
 
 if TYPE_CHECKING:
     from app.models.page import Page
@@ -13,18 +25,38 @@ if TYPE_CHECKING:
 
 
 class Revision(Base):
-    """Revision model for page version history."""
+    """
+    Revision model for page version history.
+
+    Keyframe revisions store the full content; the others store a line delta
+    against the previous revision (see app.core.revision_store).
+    """
 
     __tablename__ = "revisions"
     __table_args__ = (
         UniqueConstraint("page_id", "revision_number", name="uq_revisions_page_rev"),
+        CheckConstraint(
+            "(is_keyframe AND content IS NOT NULL) OR (NOT is_keyframe AND delta IS NOT NULL)",
+            name="ck_revisions_keyframe_or_delta",
+        ),
+        # Answers "does any revision still reference this section body?"
+        Index("ix_revisions_section_hashes", "section_hashes", postgresql_using="gin"),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     page_id: Mapped[int] = mapped_column(ForeignKey("pages.id", ondelete="CASCADE"), nullable=False, index=True)
     revision_number: Mapped[int] = mapped_column(Integer, nullable=False)
     title: Mapped[str] = mapped_column(Text, nullable=False)
-    content: Mapped[str] = mapped_column(Text, nullable=False)
+    content: Mapped[str | None] = mapped_column(CompressedText, nullable=True)
+    delta: Mapped[str | None] = mapped_column(CompressedText, nullable=True)
+    is_keyframe: Mapped[bool] = mapped_column(
+        Boolean, default=True, server_default="true", nullable=False
+    )
+    # Size in bytes and sha256 of the full content, so history listings never need it
+    content_size: Mapped[int] = mapped_column(Integer, nullable=False)
+    content_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    # Ordered section_contents hashes: the page's structured sections at this revision
+    section_hashes: Mapped[list[str] | None] = mapped_column(ARRAY(String(64)), nullable=True)
     editor_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="RESTRICT"), nullable=False, index=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -0,0 +1,55 @@
+from datetime import datetime
+
+from sqlalchemy import Computed, DateTime, Index, String, Text
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from app.db.session import Base
+from app.models.base import SEARCH_CONFIG
+
+
+class SectionContent(Base):
+    """
+    Content-addressed section body, stored once per distinct content.
+
+    Keyed by the sha256 of the section content fields (see
+    app.core.section_store.section_hash); page sections and revision
+    snapshots reference rows by that hash. Rows are never updated, and are
+    deleted only by the compactor once nothing references them.
+
+    This is the only copy of section content, and SQL reads it directly
+    (search vector, JSON page details), so it is stored as plain text.
+    """
+
+    __tablename__ = "section_contents"
+    __table_args__ = (
+        Index("ix_section_contents_search_vector", "search_vector", postgresql_using="gin"),
+    )
+
+    hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    section_type: Mapped[str] = mapped_column(String(32), nullable=False)
+    header: Mapped[str | None] = mapped_column(Text, nullable=True)
+    text: Mapped[str | None] = mapped_column(Text, nullable=True)
+    media_url: Mapped[str | None] = mapped_column(Text, nullable=True)
+    caption: Mapped[str | None] = mapped_column(Text, nullable=True)
+    code: Mapped[str | None] = mapped_column(Text, nullable=True)
+    language: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+    # Maintained by PostgreSQL; deferred so regular loads never fetch it
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(header, '')), 'A') || "
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', "
+            "coalesce(text, '') || ' ' || coalesce(caption, '')), 'B') || "
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(code, '')), 'C')",
+            persisted=True,
+        ),
+        nullable=True,
+        deferred=True,
+    )
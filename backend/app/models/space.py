@@ -1,13 +1,14 @@
-from sqlalchemy import Boolean, ForeignKey, Text
-from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import TYPE_CHECKING
 
+from sqlalchemy import Boolean, ForeignKey, Index, Text
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
 from app.db.session import Base
 from app.models.base import TimestampMixin
 
 if TYPE_CHECKING:
-    from app.models.user import User
     from app.models.page import Page
+    from app.models.user import User
     from app.models.workspace import Workspace
 
 
@@ -15,6 +16,14 @@ class Space(Base, TimestampMixin):
     """Space model for wiki workspaces - belongs to a Workspace."""
 
     __tablename__ = "spaces"
+    __table_args__ = (
+        Index(
+            "ix_spaces_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     workspace_id: Mapped[int] = mapped_column(ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=False)
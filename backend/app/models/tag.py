@@ -1,10 +1,10 @@
-from sqlalchemy import Text
-from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime
-from sqlalchemy import DateTime
-from sqlalchemy.sql import func
 from typing import TYPE_CHECKING
 
+from sqlalchemy import DateTime, Integer, Text, text
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.sql import func
+
 from app.db.session import Base
 
 if TYPE_CHECKING:
@@ -19,6 +19,8 @@ class Tag(Base):
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     name: Mapped[str] = mapped_column(Text, unique=True, nullable=False)
     slug: Mapped[str | None] = mapped_column(Text, unique=True, nullable=True)
+    # Live pages carrying this tag, maintained by database triggers
+    page_count: Mapped[int] = mapped_column(Integer, server_default=text("0"), nullable=False)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
@@ -0,0 +1,18 @@
+from sqlalchemy import Column, ForeignKey, Index, Integer, Table, text
+
+from app.db.session import Base
+
+# Live (non-deleted) page count per tag and workspace, kept current by the
+# page_tags, pages and spaces triggers installed in migration 7f3d2a9c5b16
+tag_usage = Table(
+    "tag_usage",
+    Base.metadata,
+    Column(
+        "workspace_id", Integer, ForeignKey("workspaces.id", ondelete="CASCADE"), primary_key=True
+    ),
+    Column("tag_id", Integer, ForeignKey("tags.id", ondelete="CASCADE"), primary_key=True),
+    Column("page_count", Integer, server_default=text("0"), nullable=False),
+    Index(
+        "ix_tag_usage_workspace_id_page_count", "workspace_id", text("page_count DESC"), "tag_id"
+    ),
+)
@@ -1,10 +1,33 @@
-from app.schemas.user import User, UserCreate, UserUpdate, UserInDB
-from app.schemas.tag import Tag, TagCreate, TagUpdate
+from app.schemas.auth import GoogleAuthURL, GoogleCallback, Token
+from app.schemas.page import (
+    AutocompleteHit,
+    Page,
+    PageCreate,
+    PageSearchResult,
+    PageSummary,
+    PageUpdate,
+    PageWithDetails,
+)
+from app.schemas.page_draft import PageDraft, PageDraftUpdate
+from app.schemas.page_section import (
+    PageSection,
+    PageSectionCreate,
+    PageSectionInsert,
+    PageSectionMove,
+    PageSectionSnapshot,
+    PageSectionUpdate,
+)
+from app.schemas.revision import (
+    Revision,
+    RevisionCreate,
+    RevisionDiff,
+    RevisionDiffChange,
+    RevisionSummary,
+    RevisionWithEditor,
+)
 from app.schemas.space import Space, SpaceCreate, SpaceUpdate, SpaceWithOwner
-from app.schemas.page import Page, PageCreate, PageUpdate, PageWithDetails
-from app.schemas.revision import Revision, RevisionCreate, RevisionWithEditor
-from app.schemas.page_section import PageSection, PageSectionCreate, PageSectionUpdate
-from app.schemas.auth import Token, GoogleAuthURL, GoogleCallback
+from app.schemas.tag import Tag, TagBulkResult, TagBulkUpdate, TagCloudEntry, TagCreate, TagUpdate
+from app.schemas.user import Principal, User, UserCreate, UserInDB, UserUpdate
 
 # Rebuild models to resolve forward references with proper namespace
 SpaceWithOwner.model_rebuild(_types_namespace={"User": User})
@@ -12,16 +35,28 @@ Page.model_rebuild(_types_namespace={"SectionType": PageSection})
 PageCreate.model_rebuild(_types_namespace={"PageSectionCreate": PageSectionCreate})
 PageUpdate.model_rebuild(_types_namespace={"PageSectionCreate": PageSectionCreate})
 PageWithDetails.model_rebuild(
-    _types_namespace={"User": User, "SpaceType": Space, "Tag": Tag, "SectionType": PageSection, "PageSectionCreate": PageSectionCreate}
+    _types_namespace={
+        "User": User,
+        "SpaceType": Space,
+        "Tag": Tag,
+        "SectionType": PageSection,
+        "PageSectionCreate": PageSectionCreate,
+    }
 )
 RevisionWithEditor.model_rebuild(_types_namespace={"User": User})
+PageDraft.model_rebuild(_types_namespace={"PageSectionCreate": PageSectionCreate})
+PageDraftUpdate.model_rebuild(_types_namespace={"PageSectionCreate": PageSectionCreate})
 
 __all__ = [
-    "User", "UserCreate", "UserUpdate", "UserInDB",
+    "Principal", "User", "UserCreate", "UserUpdate", "UserInDB",
     "Space", "SpaceCreate", "SpaceUpdate", "SpaceWithOwner",
-    "Page", "PageCreate", "PageUpdate", "PageWithDetails",
-    "Revision", "RevisionCreate", "RevisionWithEditor",
-    "Tag", "TagCreate", "TagUpdate",
-    "PageSection", "PageSectionCreate", "PageSectionUpdate",
+    "Page", "PageCreate", "PageUpdate", "PageWithDetails", "PageSummary", "PageSearchResult",
+    "AutocompleteHit",
+    "Revision", "RevisionCreate", "RevisionWithEditor", "RevisionSummary", "RevisionDiff",
+    "RevisionDiffChange",
+    "Tag", "TagBulkResult", "TagBulkUpdate", "TagCloudEntry", "TagCreate", "TagUpdate",
+    "PageSection", "PageSectionCreate", "PageSectionUpdate", "PageSectionInsert", "PageSectionMove",
+    "PageSectionSnapshot",
+    "PageDraft", "PageDraftUpdate",
     "Token", "GoogleAuthURL", "GoogleCallback",
 ]
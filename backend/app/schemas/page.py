@@ -1,6 +1,6 @@
 from datetime import datetime
 from pydantic import BaseModel, ConfigDict
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Literal
 
 if TYPE_CHECKING:
     from app.schemas.user import User
@@ -33,6 +33,7 @@ class PageUpdate(BaseModel):
     is_deleted: bool | None = None
     tag_ids: list[int] | None = None
     sections: list["PageSectionCreate"] | None = None
+    expected_version: int | None = None
 
 
 class Page(PageBase):
@@ -42,6 +43,8 @@ class Page(PageBase):
     created_by: int
     updated_by: int | None = None
     is_deleted: bool
+    current_revision: int = 0
+    version: int = 1
     created_at: datetime
     updated_at: datetime
     sections: list["SectionType"] = []
@@ -57,3 +60,32 @@ class PageWithDetails(Page):
     tags: list["Tag"] = []
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class PageSummary(BaseModel):
+    """Lightweight page listing entry without content or relationships."""
+    id: int
+    space_id: int
+    slug: str
+    title: str
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class PageSearchResult(PageSummary):
+    """Full-text search hit with its rank and a highlighted content snippet."""
+    rank: float
+    snippet: str
+
+
+class AutocompleteHit(BaseModel):
+    """Fuzzy title match for page and space pickers."""
+    kind: Literal["page", "space"]
+    id: int
+    space_id: int
+    slug: str
+    title: str
+    score: float
+
+    model_config = ConfigDict(from_attributes=True)
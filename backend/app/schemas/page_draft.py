@@ -0,0 +1,31 @@
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from pydantic import BaseModel, ConfigDict
+
+if TYPE_CHECKING:
+    from app.schemas.page_section import PageSectionCreate
+
+
+class PageDraftUpdate(BaseModel):
+    """Autosave payload; omitted fields keep their previous draft value."""
+    title: str | None = None
+    content: str | None = None
+    sections: list["PageSectionCreate"] | None = None
+    base_version: int | None = None
+
+
+class PageDraft(BaseModel):
+    """Schema for draft response."""
+    id: int
+    page_id: int
+    user_id: int
+    title: str | None = None
+    content: str | None = None
+    sections: list["PageSectionCreate"] | None = None
+    base_version: int | None = None
+    publish_error: str | None = None
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
@@ -45,13 +45,22 @@ class PageSectionBase(BaseModel):
 
 
 class PageSectionCreate(PageSectionBase):
-    """Payload for creating a section."""
-    pass
+    """
+    Payload for creating a section.
+
+    When a page's sections are replaced, `id` names the existing section this
+    one continues (so moved sections keep their row); sections without an id
+    are matched by position or added.
+    """
+
+    id: int | None = None
 
 
 class PageSectionUpdate(BaseModel):
     """Payload for updating a section."""
 
+    # Editor the page revision for this edit is attributed to
+    updated_by: int | None = None
     section_type: SectionType | None = None
     position: int | None = None
     header: str | None = None
@@ -85,6 +94,34 @@ class PageSectionUpdate(BaseModel):
         return self
 
 
+class PageSectionInsert(BaseModel):
+    """Payload for inserting a single section into an existing page."""
+
+    after_section_id: int | None = None
+    # Editor the page revision for this edit is attributed to
+    updated_by: int | None = None
+    section_type: SectionType
+    header: str | None = None
+    text: str | None = None
+    media_url: str | None = None
+    caption: str | None = None
+    code: str | None = None
+    language: str | None = None
+
+    @model_validator(mode="after")
+    def validate_content(self):
+        PageSectionBase(position=0, **self.model_dump(exclude={"after_section_id", "updated_by"}))
+        return self
+
+
+class PageSectionMove(BaseModel):
+    """Payload for moving a section; no anchor moves it to the top of the page."""
+
+    after_section_id: int | None = None
+    # Editor the page revision for this edit is attributed to
+    updated_by: int | None = None
+
+
 class PageSection(PageSectionBase):
     """Section as returned to clients."""
 
@@ -94,3 +131,17 @@ class PageSection(PageSectionBase):
     updated_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class PageSectionSnapshot(BaseModel):
+    """Section as captured by a revision, read from the content-addressed store."""
+
+    content_hash: str
+    position: int
+    section_type: SectionType
+    header: str | None = None
+    text: str | None = None
+    media_url: str | None = None
+    caption: str | None = None
+    code: str | None = None
+    language: str | None = None
@@ -1,6 +1,6 @@
 from datetime import datetime
 from pydantic import BaseModel, ConfigDict
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Literal
 
 if TYPE_CHECKING:
     from app.schemas.user import User
@@ -26,6 +26,7 @@ class Revision(RevisionBase):
     revision_number: int
     editor_id: int
     created_at: datetime
+    section_hashes: list[str] | None = None
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -35,3 +36,44 @@ class RevisionWithEditor(Revision):
     editor: "User"
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class RevisionSummary(BaseModel):
+    """History listing entry: revision metadata without its content."""
+    id: int
+    page_id: int
+    revision_number: int
+    title: str
+    editor_id: int
+    editor_username: str
+    editor_display_name: str | None = None
+    created_at: datetime
+    content_size: int
+    content_hash: str
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class RevisionDiffChange(BaseModel):
+    """One changed region between two revisions, as 0-based, end-exclusive line ranges."""
+    op: Literal["replace", "delete", "insert"]
+    from_start: int
+    from_end: int
+    to_start: int
+    to_end: int
+    removed: list[str]
+    added: list[str]
+
+
+class RevisionDiff(BaseModel):
+    """Line diff between two revisions of a page."""
+    page_id: int
+    from_revision: int
+    to_revision: int
+    from_title: str
+    to_title: str
+    format: Literal["unified", "structured"]
+    lines_added: int
+    lines_removed: int
+    unified: str | None = None
+    changes: list[RevisionDiffChange] | None = None
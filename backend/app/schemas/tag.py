@@ -1,5 +1,5 @@
 from datetime import datetime
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class TagBase(BaseModel):
@@ -25,3 +25,26 @@ class Tag(TagBase):
     created_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class TagCloudEntry(BaseModel):
+    """Schema for one tag in a workspace tag cloud."""
+    id: int
+    name: str
+    slug: str | None = None
+    page_count: int
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class TagBulkUpdate(BaseModel):
+    """Schema for adding and removing tags on many pages at once."""
+    page_ids: list[int] = Field(min_length=1, max_length=1000)
+    add_tag_ids: list[int] = Field(default=[], max_length=100)
+    remove_tag_ids: list[int] = Field(default=[], max_length=100)
+
+
+class TagBulkResult(BaseModel):
+    """Schema for the outcome of a bulk tag update."""
+    added: int
+    removed: int
@@ -40,3 +40,14 @@ class User(UserBase):
     updated_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class Principal(User):
+    """
+    The authenticated user handed to endpoints by get_current_active_user.
+
+    A frozen copy of the user's public fields, shared across requests through
+    the principal cache; load the User model when ORM access is needed.
+    """
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
@@ -69,3 +69,24 @@ class WorkspaceWithMembers(Workspace):
 
     member_count: int = 0
     space_count: int = 0
+
+
+# Revision retention policy schemas
+class RetentionPolicyBase(BaseModel):
+    keep_all_days: int = Field(default=30, ge=0)
+    hourly_days: int = Field(default=30, ge=0)
+    daily_days: int = Field(default=365, ge=0)
+    keep_last: int = Field(default=50, ge=0)
+
+
+class RetentionPolicyUpdate(RetentionPolicyBase):
+    pass
+
+
+class RetentionPolicy(RetentionPolicyBase):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    workspace_id: int
+    created_at: datetime
+    updated_at: datetime
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Concurrent Edit Check
+
+Fires many parallel PATCH /pages/{id} requests at one page of a running API
+and verifies that every successful save produced exactly one revision, with
+contiguous revision numbers and no duplicates. Exits non-zero on any failure.
+
+Usage (from the backend directory, with the API running):
+    python -m benchmarks.concurrent_edits --page-id 1 --user-id 1 --requests 300
+"""
+
+import argparse
+import asyncio
+import sys
+
+import httpx
+
+
+async def fetch_revision_numbers(client: httpx.AsyncClient, page_id: int) -> list[int]:
+    """Walk the page's full revision history using cursor pagination."""
+    numbers: list[int] = []
+    params: dict[str, str | int] = {"limit": 100}
+
+    while True:
+        response = await client.get(f"/revisions/page/{page_id}", params=params)
+        response.raise_for_status()
+        numbers.extend(revision["revision_number"] for revision in response.json())
+
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            return numbers
+        params = {"limit": 100, "cursor": cursor}
+
+
+async def main(base_url: str, page_id: int, user_id: int, requests: int, concurrency: int) -> int:
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        before = await fetch_revision_numbers(client, page_id)
+        start_number = max(before, default=0)
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def edit(i: int) -> int:
+            async with semaphore:
+                response = await client.patch(
+                    f"/pages/{page_id}",
+                    json={"content": f"Concurrent edit {i}", "updated_by": user_id},
+                )
+                return response.status_code
+
+        statuses = await asyncio.gather(*(edit(i) for i in range(requests)))
+        after = await fetch_revision_numbers(client, page_id)
+
+    succeeded = sum(1 for code in statuses if code == 200)
+    new_numbers = sorted(number for number in after if number > start_number)
+    expected = list(range(start_number + 1, start_number + succeeded + 1))
+
+    print(f"Requests: {requests}, succeeded: {succeeded}, failed: {requests - succeeded}")
+    last_number = max(new_numbers, default=start_number)
+    print(f"New revisions: {len(new_numbers)} (numbers {start_number + 1}..{last_number})")
+
+    problems = []
+    if succeeded != requests:
+        problems.append(f"{requests - succeeded} saves failed: {sorted(set(statuses))}")
+    if len(new_numbers) != len(set(new_numbers)):
+        problems.append("duplicate revision numbers")
+    if new_numbers != expected:
+        problems.append("lost or non-contiguous revisions")
+
+    for problem in problems:
+        print(f"❌ {problem}")
+    if not problems:
+        print("✅ No lost or duplicate revisions")
+
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check revision numbering under concurrent edits")
+    parser.add_argument("--base-url", default="http://localhost:8000/api/v1")
+    parser.add_argument("--page-id", type=int, required=True)
+    parser.add_argument("--user-id", type=int, required=True)
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--concurrency", type=int, default=100)
+    args = parser.parse_args()
+
+    sys.exit(
+        asyncio.run(
+            main(args.base_url, args.page_id, args.user_id, args.requests, args.concurrency)
+        )
+    )
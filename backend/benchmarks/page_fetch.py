@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Page Fetch Benchmark
+
+Compares the two ways of building a page's PageWithDetails response:
+the ORM path (selectinload + Pydantic) and the SQL JSON aggregation fast path.
+Runs against the database configured in settings; the page must exist.
+
+Usage (from the backend directory; DEBUG=false keeps SQL echo out of the timings):
+    DEBUG=false python -m benchmarks.page_fetch --page-id 1 --iterations 500
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+from app.api.pages import _load_page_details_json, _load_page_details_orm
+from app.db.session import AsyncSessionLocal, engine
+
+
+async def time_loader(loader, page_id: int, iterations: int) -> tuple[list[float], bytes]:
+    """Run a loader repeatedly, each time in a fresh session, and collect latencies in ms."""
+    timings: list[float] = []
+    body = b""
+
+    for _ in range(iterations):
+        async with AsyncSessionLocal() as db:
+            start = time.perf_counter()
+            body = await loader(db, page_id)
+            timings.append((time.perf_counter() - start) * 1000)
+
+    return timings, body
+
+
+def report(name: str, timings: list[float], body: bytes) -> None:
+    """Print latency percentiles for one loader."""
+    ordered = sorted(timings)
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    print(
+        f"{name:<6} mean {statistics.mean(ordered):7.2f} ms   "
+        f"p50 {statistics.median(ordered):7.2f} ms   p95 {p95:7.2f} ms   "
+        f"body {len(body):,} bytes"
+    )
+
+
+async def main(page_id: int, iterations: int, warmup: int) -> None:
+    print(f"Page {page_id}, {iterations} iterations after {warmup} warm-up runs\n")
+
+    results = {}
+    for name, loader in (("orm", _load_page_details_orm), ("json", _load_page_details_json)):
+        await time_loader(loader, page_id, warmup)
+        results[name] = await time_loader(loader, page_id, iterations)
+        report(name, *results[name])
+
+    orm_body, json_body = results["orm"][1], results["json"][1]
+    same_keys = set(json.loads(orm_body)) == set(json.loads(json_body))
+    print(f"\nSame top-level fields: {'yes' if same_keys else 'NO'}")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--page-id", type=int, required=True)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=20)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.page_id, args.iterations, args.warmup))
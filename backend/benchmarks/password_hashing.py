@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Password Hashing Event Loop Benchmark
+
+Simulates a burst of concurrent logins, each verifying a bcrypt password,
+while a probe coroutine measures how late the event loop wakes it up. Runs
+once with bcrypt called inline (blocking the loop) and once through the
+password pool the API uses, and reports loop lag next to login latency and
+pool queue wait. Runs in process; no database is needed.
+
+Usage (from the backend directory):
+    python -m benchmarks.password_hashing --logins 40 --probe-interval 5
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from app.core.config import settings
+from app.core.security import (
+    check_password_blocking,
+    hash_password_blocking,
+    password_hash_stats,
+    verify_password,
+)
+
+
+async def probe_loop_lag(interval: float, lags: list[float], stop: asyncio.Event) -> None:
+    """Sleep for interval repeatedly, recording how much later than asked each wake-up came."""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append((time.perf_counter() - start - interval) * 1000)
+
+
+async def login_inline(password: str, hashed: str) -> bool:
+    """A login handler calling bcrypt directly on the event loop."""
+    return check_password_blocking(password, hashed)
+
+
+async def login_pooled(password: str, hashed: str) -> bool:
+    """A login handler awaiting the password pool."""
+    return await verify_password(password, hashed)
+
+
+async def run(
+    login, logins: int, password: str, hashed: str, interval: float
+) -> tuple[list[float], list[float], float]:
+    """Fire logins concurrently under the lag probe; return lags, login latencies and wall time."""
+    lags: list[float] = []
+    stop = asyncio.Event()
+    probe = asyncio.create_task(probe_loop_lag(interval, lags, stop))
+    await asyncio.sleep(interval * 2)
+
+    async def timed_login() -> float:
+        start = time.perf_counter()
+        assert await login(password, hashed)
+        return (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    latencies = await asyncio.gather(*(timed_login() for _ in range(logins)))
+    wall = time.perf_counter() - start
+
+    stop.set()
+    await probe
+    return lags, list(latencies), wall
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def main(logins: int, probe_interval_ms: float) -> None:
+    password = "correct horse battery staple"
+    hashed = hash_password_blocking(password)
+    interval = probe_interval_ms / 1000
+
+    print(f"{logins} concurrent logins, {settings.PASSWORD_HASH_WORKERS} pool workers, "
+          f"probe every {probe_interval_ms:g} ms\n")
+    print(f"{'mode':>7} {'wall':>9} {'login p50':>10} {'login p99':>10} "
+          f"{'lag p50':>9} {'lag p99':>9} {'lag max':>9} {'queue avg':>10}")
+
+    for mode, login in (("inline", login_inline), ("pool", login_pooled)):
+        calls, queue_wait = password_hash_stats.calls, password_hash_stats.queue_wait_seconds
+        lags, latencies, wall = await run(login, logins, password, hashed, interval)
+        calls = password_hash_stats.calls - calls
+        queue_wait = password_hash_stats.queue_wait_seconds - queue_wait
+        queue = f"{1000 * queue_wait / calls:>7.1f} ms" if calls else f"{'-':>10}"
+        print(
+            f"{mode:>7} {wall * 1000:>6.0f} ms {statistics.median(latencies):>7.1f} ms "
+            f"{percentile(latencies, 0.99):>7.1f} ms {statistics.median(lags):>6.1f} ms "
+            f"{percentile(lags, 0.99):>6.1f} ms {max(lags):>6.1f} ms {queue}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--logins", type=int, default=40)
+    parser.add_argument(
+        "--probe-interval", type=float, default=5.0, help="milliseconds between loop lag probes"
+    )
+    args = parser.parse_args()
+
+    asyncio.run(main(args.logins, args.probe_interval))
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Revision Storage Benchmark
+
+Simulates the edit history of a page and compares, for several keyframe
+intervals, the bytes stored for the history against the worst-case time to
+rebuild one revision (a keyframe plus the longest run of deltas). Runs in
+process with the same codec the API uses; no database is needed.
+
+Usage (from the backend directory):
+    python -m benchmarks.revision_storage --revisions 500 --lines 400
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from app.core.revision_store import make_delta, replay_chain
+
+
+def simulate_history(revisions: int, lines: int, seed: int) -> list[str]:
+    """Generate successive page contents, each a small edit of the previous one."""
+    rng = random.Random(seed)
+    current = [
+        f"Paragraph {i}: " + "lorem ipsum dolor sit amet " * rng.randint(1, 6) for i in range(lines)
+    ]
+    history = ["\n".join(current)]
+
+    for _ in range(revisions - 1):
+        for _ in range(rng.randint(1, 4)):
+            roll = rng.random()
+            index = rng.randrange(len(current))
+            if roll < 0.6:
+                current[index] = current[index] + " edited"
+            elif roll < 0.85:
+                paragraph = "New paragraph " + "consectetur adipiscing " * rng.randint(1, 4)
+                current.insert(index, paragraph)
+            elif len(current) > 1:
+                del current[index]
+        history.append("\n".join(current))
+
+    return history
+
+
+def encode_history(
+    history: list[str], interval: int
+) -> list[tuple[int, bool, str | None, str | None]]:
+    """Lay the history out as stored rows, following the API's keyframe rules."""
+    rows = []
+    since_keyframe = 0
+
+    for number, content in enumerate(history, start=1):
+        since_keyframe += 1
+        if number > 1 and since_keyframe < interval:
+            delta = make_delta(history[number - 2], content)
+            if len(delta) < len(content):
+                rows.append((number, False, None, delta))
+                continue
+        rows.append((number, True, content, None))
+        since_keyframe = 0
+
+    return rows
+
+
+def worst_chain(rows: list) -> list:
+    """Return the longest keyframe-plus-deltas run, the slowest revision to rebuild."""
+    longest: list = []
+    current: list = []
+    for row in rows:
+        current = [row] if row[1] else current + [row]
+        if len(current) > len(longest):
+            longest = current
+    return longest
+
+
+def main(revisions: int, lines: int, intervals: list[int], iterations: int, seed: int) -> None:
+    history = simulate_history(revisions, lines, seed)
+    full_bytes = sum(len(content.encode()) for content in history)
+    print(
+        f"{revisions} revisions, ~{len(history[-1]):,} chars each, "
+        f"full copies: {full_bytes:,} bytes\n"
+    )
+    print(
+        f"{'interval':>8} {'stored bytes':>14} {'ratio':>7} {'keyframes':>10} "
+        f"{'rebuild p50':>12} {'rebuild max':>12}"
+    )
+
+    for interval in intervals:
+        rows = encode_history(history, interval)
+        stored = sum(len((row[2] or row[3]).encode()) for row in rows)
+        keyframes = sum(1 for row in rows if row[1])
+
+        chain = worst_chain(rows)
+        assert replay_chain(chain)[chain[-1][0]] == history[chain[-1][0] - 1]
+
+        timings = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            replay_chain(chain)
+            timings.append((time.perf_counter() - start) * 1000)
+
+        print(
+            f"{interval:>8} {stored:>14,} {stored / full_bytes:>6.1%} {keyframes:>10} "
+            f"{statistics.median(timings):>9.3f} ms {max(timings):>9.3f} ms"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--revisions", type=int, default=500)
+    parser.add_argument("--lines", type=int, default=400)
+    parser.add_argument("--intervals", type=int, nargs="+", default=[1, 5, 10, 20, 50, 100])
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    main(args.revisions, args.lines, args.intervals, args.iterations, args.seed)
@@ -0,0 +1,75 @@
+from app.core import cache
+from app.core.cache import LRUCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(cache.time, "monotonic", clock)
+    lru = LRUCache(maxsize=10, ttl=30)
+
+    lru.set("page", "body")
+    clock.now += 29
+    assert lru.get("page") == "body"
+
+    clock.now += 1
+    assert lru.get("page") is None
+    assert len(lru) == 0
+    assert (lru.hits, lru.misses) == (1, 1)
+
+
+def test_per_entry_ttl_overrides_default(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(cache.time, "monotonic", clock)
+    lru = LRUCache(maxsize=10, ttl=30)
+
+    lru.set("short", 1, ttl=5)
+    lru.set("default", 2)
+    clock.now += 10
+
+    assert lru.get("short") is None
+    assert lru.get("default") == 2
+
+
+def test_least_recently_used_entry_is_evicted():
+    lru = LRUCache(maxsize=2)
+    lru.set("a", 1)
+    lru.set("b", 2)
+    lru.get("a")
+    lru.set("c", 3)
+
+    assert lru.get("b") is None
+    assert lru.get("a") == 1
+    assert lru.get("c") == 3
+    assert lru.evictions == 1
+
+
+def test_weight_bound():
+    lru = LRUCache(maxsize=10, maxweight=10, weigh=len)
+    lru.set("a", b"12345")
+    lru.set("b", b"12345")
+    lru.set("c", b"123")
+
+    assert lru.get("a") is None
+    assert lru.weight == 8
+
+    lru.set("huge", b"x" * 11)
+    assert lru.get("huge") is None
+    assert len(lru) == 2
+
+
+def test_delete_where():
+    lru = LRUCache(maxsize=10)
+    for key in [("page", 1, "etag-a"), ("page", 1, "etag-b"), ("page", 2, "etag-c")]:
+        lru.set(key, "body")
+
+    assert lru.delete_where(lambda key: key[1] == 1) == 2
+    assert len(lru) == 1
+    assert lru.get(("page", 2, "etag-c")) == "body"
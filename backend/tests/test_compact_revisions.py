@@ -0,0 +1,55 @@
+from types import SimpleNamespace
+
+from app.core import revision_store
+from app.core.revision_store import layout_chain, replay_chain
+from app.db.compact_revisions import plan_windows, rewrite_window
+
+
+def _history(contents):
+    return [
+        SimpleNamespace(id=100 + number, revision_number=number, is_keyframe=is_keyframe,
+                        content=content, delta=delta)
+        for number, (is_keyframe, content, delta) in enumerate(layout_chain(contents), start=1)
+    ]
+
+
+def _replay(rows):
+    return replay_chain(
+        [(row.revision_number, row.is_keyframe, row.content, row.delta) for row in rows]
+    )
+
+
+def test_windows_end_before_keyframes():
+    rows = [SimpleNamespace(is_keyframe=index % 5 == 0) for index in range(23)]
+
+    assert plan_windows(rows, 7) == [(0, 9), (10, 19), (20, 22)]
+    assert plan_windows(rows, 100) == [(0, 22)]
+
+
+def test_history_stays_replayable_after_every_window(monkeypatch):
+    monkeypatch.setattr(revision_store.settings, "REVISION_KEYFRAME_INTERVAL", 5)
+    contents = ["".join(f"line {n}\n" for n in range(40 + i)) for i in range(60)]
+    planned = _history(contents)
+    keep = {number for number in range(1, 61) if number % 3 == 0 or number > 55}
+
+    rows = planned
+    previous, since_keyframe = None, 0
+    for first, last in plan_windows(planned, 7):
+        window = [row for row in rows if row.id in {row.id for row in planned[first:last + 1]}]
+        changes, dropped, previous, since_keyframe = rewrite_window(
+            window, keep, previous, since_keyframe
+        )
+
+        by_id = {change["id"]: change for change in changes}
+        rows = [
+            SimpleNamespace(**{**vars(row), **by_id.get(row.id, {})})
+            for row in rows
+            if row.id not in dropped
+        ]
+
+        # Every commit must leave a chain that still rebuilds every stored revision
+        replayed = _replay(rows)
+        assert replayed == {row.revision_number: contents[row.revision_number - 1] for row in rows}
+
+    assert [row.revision_number for row in rows] == sorted(keep)
+    assert any(not row.is_keyframe for row in rows)
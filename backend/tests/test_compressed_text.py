@@ -0,0 +1,48 @@
+import pytest
+
+from app.db import types
+from app.db.types import COMPRESSION_MARKER, CompressedText, compress_text, decompress_text
+
+TEXT = "The quick brown fox jumps over the lazy dog. " * 100
+
+
+@pytest.mark.parametrize("codec", ["zlib", "lzma"])
+def test_round_trip(codec):
+    stored = compress_text(TEXT, codec=codec, min_bytes=0)
+
+    assert stored.startswith(COMPRESSION_MARKER)
+    assert len(stored) < len(TEXT)
+    assert decompress_text(stored) == TEXT
+
+
+def test_below_threshold_is_stored_as_is():
+    assert compress_text(TEXT, codec="zlib", min_bytes=len(TEXT) + 1) == TEXT
+
+
+def test_disabled_codec_is_stored_as_is():
+    assert compress_text(TEXT, codec="none", min_bytes=0) == TEXT
+
+
+def test_text_starting_with_marker_is_escaped():
+    value = COMPRESSION_MARKER + "not actually compressed"
+    stored = compress_text(value, codec="none")
+
+    assert stored != value
+    assert decompress_text(stored) == value
+
+
+def test_plain_text_reads_through():
+    assert decompress_text("written before compression") == "written before compression"
+
+
+def test_column_type_round_trip(monkeypatch):
+    monkeypatch.setattr(types.settings, "TEXT_COMPRESSION_CODEC", "zlib")
+    monkeypatch.setattr(types.settings, "TEXT_COMPRESSION_MIN_BYTES", 0)
+    column = CompressedText()
+
+    stored = column.process_bind_param(TEXT, dialect=None)
+
+    assert stored.startswith(COMPRESSION_MARKER)
+    assert column.process_result_value(stored, dialect=None) == TEXT
+    assert column.process_bind_param(None, dialect=None) is None
+    assert column.process_result_value(None, dialect=None) is None
@@ -0,0 +1,55 @@
+from datetime import UTC, datetime
+
+import pytest
+from fastapi.security import HTTPAuthorizationCredentials
+from pydantic import ValidationError
+
+from app.core.deps import get_current_user, invalidate_principal
+from app.core.security import create_access_token
+from app.models import User as UserModel
+from app.schemas import Principal
+
+
+class FakeSession:
+    """Answers every query with the same user, counting the round trips."""
+
+    def __init__(self, user):
+        self.user = user
+        self.queries = 0
+
+    async def execute(self, statement):
+        self.queries += 1
+        return self
+
+    def scalar_one_or_none(self):
+        return self.user
+
+
+@pytest.fixture
+def user():
+    now = datetime.now(UTC)
+    user = UserModel(id=41, username="ed", is_active=True, created_at=now, updated_at=now)
+    yield user
+    invalidate_principal(user.id)
+
+
+async def test_cache_hit_and_miss_return_the_same_kind_of_principal(user):
+    credentials = HTTPAuthorizationCredentials(
+        scheme="Bearer", credentials=create_access_token({"sub": user.id})
+    )
+    db = FakeSession(user)
+
+    first = await get_current_user(credentials, db)
+    second = await get_current_user(credentials, db)
+
+    assert db.queries == 1
+    assert isinstance(first, Principal) and isinstance(second, Principal)
+    assert second == first
+    assert (second.id, second.username) == (41, "ed")
+
+
+async def test_principals_are_read_only(user):
+    principal = Principal.model_validate(user)
+
+    with pytest.raises(ValidationError):
+        principal.username = "someone else"
@@ -0,0 +1,41 @@
+from app.core.etag import etag_matches, etag_versions, make_etag, make_versioned_etag
+
+
+def test_make_etag_is_quoted_and_stable():
+    etag = make_etag(1, "2026-01-01")
+
+    assert etag.startswith('"') and etag.endswith('"')
+    assert etag == make_etag(1, "2026-01-01")
+    assert etag != make_etag(1, "2026-01-02")
+
+
+def test_weak_comparison_for_if_none_match():
+    etag = make_etag(1)
+
+    assert etag_matches(f'W/{etag}', etag)
+    assert etag_matches(f'"other", {etag}', etag)
+    assert not etag_matches('"other"', etag)
+    assert not etag_matches(None, etag)
+
+
+def test_strong_comparison_for_if_match():
+    etag = make_etag(1)
+
+    assert etag_matches(etag, etag, weak=False)
+    assert not etag_matches(f'W/{etag}', etag, weak=False)
+    assert etag_matches("*", etag, weak=False)
+
+
+def test_versioned_etag_names_its_version():
+    etag = make_versioned_etag(7, "2026-01-01")
+
+    assert etag.startswith('"7-')
+    assert etag != make_versioned_etag(7, "2026-01-02")
+    assert etag_versions(etag) == [7]
+    assert etag_versions(f'{etag}, {make_versioned_etag(8)}') == [7, 8]
+
+
+def test_if_match_versions_skip_weak_and_foreign_tags():
+    assert etag_versions(f'W/{make_versioned_etag(7)}') == []
+    assert etag_versions(make_etag(7)) == []
+    assert etag_versions("*") is None
@@ -0,0 +1,132 @@
+import asyncio
+
+import pytest
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.models import Revision as RevisionModel
+from app.models import Space as SpaceModel
+from app.models import User as UserModel
+from app.models.workspace import Workspace as WorkspaceModel
+
+PAGES = f"{settings.API_V1_PREFIX}/pages"
+TAGS = f"{settings.API_V1_PREFIX}/tags"
+USERS = f"{settings.API_V1_PREFIX}/users"
+
+# Parallel saves fired at one page by the revision numbering test
+PARALLEL_EDITS = 200
+
+
+@pytest.fixture
+async def page(client, session_factory):
+    """A page with one revision, created through the API."""
+    async with session_factory() as session:
+        user = UserModel(username="editor")
+        session.add(user)
+        await session.flush()
+        workspace = WorkspaceModel(name="Docs", slug="docs", owner_id=user.id)
+        session.add(workspace)
+        await session.flush()
+        space = SpaceModel(
+            workspace_id=workspace.id, name="Guides", slug="guides", owner_id=user.id
+        )
+        session.add(space)
+        await session.commit()
+
+    response = await client.post(
+        f"{PAGES}/",
+        json={
+            "space_id": space.id,
+            "slug": "intro",
+            "title": "Intro",
+            "content": "v1",
+            "created_by": user.id,
+        },
+    )
+    assert response.status_code == 201
+    return response.json()
+
+
+async def test_stale_expected_version_conflicts(client, page):
+    url = f"{PAGES}/{page['id']}"
+    response = await client.patch(url, json={"content": "v2", "expected_version": page["version"]})
+    assert response.status_code == 200
+
+    response = await client.patch(url, json={"content": "v3", "expected_version": page["version"]})
+
+    assert response.status_code == 409
+    assert response.json()["detail"]["current_version"] == page["version"] + 1
+
+
+async def test_stale_if_match_fails_precondition(client, page):
+    url = f"{PAGES}/{page['id']}"
+    stale_etag = (await client.get(url)).headers["ETag"]
+    response = await client.patch(url, json={"content": "v2"}, headers={"If-Match": stale_etag})
+    assert response.status_code == 200
+
+    response = await client.patch(url, json={"content": "v3"}, headers={"If-Match": stale_etag})
+
+    assert response.status_code == 412
+    assert response.headers["ETag"] != stale_etag
+
+
+async def test_current_if_match_succeeds(client, page):
+    etag = (await client.get(f"{PAGES}/{page['id']}")).headers["ETag"]
+
+    response = await client.patch(
+        f"{PAGES}/{page['id']}",
+        json={"content": "v2", "updated_by": page["created_by"]},
+        headers={"If-Match": etag},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["content"] == "v2"
+    assert response.json()["current_revision"] == 2
+
+
+async def test_if_match_ignores_changes_outside_the_page(client, page):
+    url = f"{PAGES}/{page['id']}"
+    etag = (await client.get(url)).headers["ETag"]
+    response = await client.patch(f"{USERS}/{page['created_by']}", json={"display_name": "Ed"})
+    assert response.status_code == 200
+    assert (await client.get(url)).headers["ETag"] != etag
+
+    response = await client.patch(url, json={"content": "v2"}, headers={"If-Match": etag})
+
+    assert response.status_code == 200
+
+
+async def test_bulk_tagging_conflicts_with_stale_saves(client, page):
+    url = f"{PAGES}/{page['id']}"
+    stale_etag = (await client.get(url)).headers["ETag"]
+    tag = (await client.post(f"{TAGS}/", json={"name": "Howto"})).json()
+    bulk = {"page_ids": [page["id"]], "add_tag_ids": [tag["id"]]}
+
+    response = await client.post(f"{TAGS}/bulk", json=bulk)
+    assert response.json() == {"added": 1, "removed": 0}
+
+    response = await client.patch(url, json={"content": "v2", "expected_version": page["version"]})
+    assert response.status_code == 409
+    response = await client.patch(url, json={"content": "v2"}, headers={"If-Match": stale_etag})
+    assert response.status_code == 412
+    assert [t["id"] for t in (await client.get(url)).json()["tags"]] == [tag["id"]]
+
+
+async def test_parallel_edits_keep_revisions_contiguous(client, session_factory, page):
+    async def edit(i: int) -> int:
+        response = await client.patch(
+            f"{PAGES}/{page['id']}",
+            json={"content": f"Concurrent edit {i}", "updated_by": page["created_by"]},
+        )
+        return response.status_code
+
+    statuses = await asyncio.gather(*(edit(i) for i in range(PARALLEL_EDITS)))
+
+    async with session_factory() as session:
+        result = await session.execute(
+            select(RevisionModel.revision_number).where(RevisionModel.page_id == page["id"])
+        )
+        numbers = sorted(result.scalars().all())
+
+    assert statuses == [200] * PARALLEL_EDITS
+    assert numbers == list(range(1, PARALLEL_EDITS + 2))
@@ -0,0 +1,24 @@
+import importlib.util
+from pathlib import Path
+
+from app.core.section_store import page_content_hash
+
+MIGRATION = Path(__file__).parents[1] / "alembic" / "versions" / "c58e1a7b9f36_page_content_hash.py"
+
+
+def test_backfill_formula_matches_the_app():
+    spec = importlib.util.spec_from_file_location("page_content_hash_migration", MIGRATION)
+    migration = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migration)
+    sections = [(0, "a" * 64), (1024, "b" * 64)]
+
+    assert migration.page_content_hash("Title", "Body", sections) == page_content_hash(
+        "Title", "Body", sections
+    )
+    assert migration.page_content_hash("Title", "", []) == page_content_hash("Title", "", [])
+
+
+def test_moving_a_section_changes_the_hash():
+    assert page_content_hash("T", "", [(0, "a"), (1, "b")]) != page_content_hash(
+        "T", "", [(0, "b"), (1, "a")]
+    )
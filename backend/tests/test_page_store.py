@@ -0,0 +1,66 @@
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.page_store import sync_sections_for_page
+from app.core.section_store import section_hash
+from app.models import PageSection as PageSectionModel
+from app.schemas import PageSectionCreate
+
+
+class FakeSession:
+    async def flush(self):
+        pass
+
+
+def _section(position, text, id=None):
+    return PageSectionCreate(id=id, position=position, section_type="paragraph", text=text)
+
+
+def _page(*sections):
+    rows = [
+        PageSectionModel(id=index, position=section.position, content_hash=section_hash(section))
+        for index, section in enumerate(sections, start=1)
+    ]
+    return SimpleNamespace(id=7, sections=rows)
+
+
+async def test_sections_are_matched_by_id_when_moved():
+    page = _page(_section(0, "first"), _section(1, "second"))
+    first, second = page.sections
+    moved = [_section(0, "second", id=2), _section(1, "first", id=1)]
+
+    await sync_sections_for_page(FakeSession(), page, moved)
+
+    assert page.sections == [second, first]
+    assert [(row.id, row.position) for row in page.sections] == [(2, 0), (1, 1)]
+    assert second.content_hash == section_hash(_section(0, "second"))
+
+
+async def test_sections_without_id_reuse_the_row_at_their_position():
+    page = _page(_section(0, "first"), _section(1, "second"))
+    first, _ = page.sections
+
+    await sync_sections_for_page(FakeSession(), page, [_section(0, "edited")])
+
+    assert page.sections == [first]
+    assert first.content_hash == section_hash(_section(0, "edited"))
+
+
+async def test_foreign_section_ids_are_rejected():
+    page = _page(_section(0, "first"))
+
+    with pytest.raises(HTTPException) as exc_info:
+        await sync_sections_for_page(FakeSession(), page, [_section(0, "x", id=99)])
+
+    assert exc_info.value.status_code == 400
+
+
+async def test_duplicate_positions_are_rejected():
+    page = _page()
+
+    with pytest.raises(HTTPException) as exc_info:
+        await sync_sections_for_page(FakeSession(), page, [_section(0, "a"), _section(0, "b")])
+
+    assert exc_info.value.status_code == 400
@@ -0,0 +1,34 @@
+import pytest
+from fastapi import HTTPException
+
+from app.core.pagination import decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip():
+    values = {"updated_at": "2026-01-02T03:04:05+00:00", "id": 42}
+    cursor = encode_cursor(values)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor, {"updated_at": str, "id": int}) == values
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not base64 json!",
+        encode_cursor({"id": "42"}),
+        encode_cursor({"updated_at": "2026-01-02T03:04:05+00:00"}),
+    ],
+)
+def test_invalid_cursor_is_rejected(cursor):
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(cursor, {"id": int})
+
+    assert exc_info.value.status_code == 400
+
+
+def test_non_object_cursor_is_rejected():
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(encode_cursor([1, 2]), {})
+
+    assert exc_info.value.status_code == 400
@@ -0,0 +1,37 @@
+from app.core import revision_store
+from app.core.revision_store import apply_delta, layout_chain, make_delta, replay_chain
+
+
+def test_delta_round_trip():
+    old = "intro\nkept line\nremoved line\nmore\n"
+    new = "intro\nkept line\nadded line\nmore\ntail without newline"
+
+    assert apply_delta(old, make_delta(old, new)) == new
+
+
+def test_delta_from_and_to_empty():
+    text = "one\ntwo\n"
+
+    assert apply_delta("", make_delta("", text)) == text
+    assert apply_delta(text, make_delta(text, "")) == ""
+
+
+def test_layout_chain_replays_every_revision(monkeypatch):
+    monkeypatch.setattr(revision_store.settings, "REVISION_KEYFRAME_INTERVAL", 3)
+    base = "".join(f"line {n}\n" for n in range(50))
+    contents = [base + "".join(f"edit {n}\n" for n in range(i)) for i in range(7)]
+
+    rows = layout_chain(contents)
+    replayed = replay_chain(
+        (number, is_keyframe, content, delta)
+        for number, (is_keyframe, content, delta) in enumerate(rows, start=1)
+    )
+
+    assert [keyframe for keyframe, _, _ in rows] == [True, False, False, True, False, False, True]
+    assert replayed == {number: content for number, content in enumerate(contents, start=1)}
+
+
+def test_layout_chain_stores_keyframe_when_delta_is_larger():
+    rows = layout_chain(["a", "b"])
+
+    assert rows == [(True, "a", None), (True, "b", None)]
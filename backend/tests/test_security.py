@@ -0,0 +1,21 @@
+from app.core.security import get_password_hash, verify_password
+
+
+async def test_hash_round_trip():
+    hashed = await get_password_hash("correct horse battery staple")
+
+    assert hashed.startswith("$2")
+    assert await verify_password("correct horse battery staple", hashed)
+    assert not await verify_password("wrong password", hashed)
+
+
+async def test_long_passwords_compare_on_their_first_72_bytes():
+    password = "x" * 100
+    hashed = await get_password_hash(password)
+
+    assert await verify_password(password, hashed)
+    assert await verify_password("x" * 72 + "ignored", hashed)
+
+
+async def test_placeholder_hash_never_verifies():
+    assert not await verify_password("secret", "hashed_secret")